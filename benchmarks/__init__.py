@@ -0,0 +1,6 @@
+"""
+camply Benchmarks
+
+    python -m benchmarks
+    python -m benchmarks --check
+"""
@@ -0,0 +1,106 @@
+"""
+Run the Benchmark Suite
+
+    python -m benchmarks                      # print a table of every scenario
+    python -m benchmarks --scale 10           # scale the synthetic payloads up
+    python -m benchmarks --check              # fail on regressions against the baseline
+    python -m benchmarks --save-baseline      # record a new baseline
+"""
+
+import argparse
+import json
+import pathlib
+import sys
+from dataclasses import asdict
+from typing import List, Optional
+
+from benchmarks.harness import (
+    calibrate,
+    check_regressions,
+    format_results,
+    load_baseline,
+    measure,
+    normalize,
+    save_baseline,
+)
+from benchmarks.scenarios import SCENARIOS, STAGES, quiet_logging
+
+BASELINE_PATH = pathlib.Path(__file__).resolve().parent / "baseline.json"
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Run the Benchmarks, Returning the Process Exit Code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Scenario to run, repeatable (default: all)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Size factor of synthetic payloads"
+    )
+    parser.add_argument(
+        "--no-memory", action="store_true", help="Skip peak memory measurement"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE_PATH)
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="Save results as the baseline"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="Exit non-zero on any regression"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=2.0,
+        help="Slowdown factor counted as a regression (default: 2.0)",
+    )
+    options = parser.parse_args(args)
+    quiet_logging()
+    selected = [
+        scenario
+        for scenario in SCENARIOS
+        if options.scenario is None or scenario.name in options.scenario
+    ]
+    calibration = calibrate()
+    results = [
+        measure(
+            scenario=scenario.name,
+            prepare=scenario.setup(options.scale),
+            stages=STAGES,
+            context=scenario.context,
+            repeat=options.repeat,
+            memory=not options.no_memory,
+        )
+        for scenario in selected
+    ]
+    if options.json is True:
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    else:
+        print(format_results(results))
+    if options.save_baseline is True:
+        save_baseline(path=options.baseline, results=results, calibration=calibration)
+        print(f"Baseline saved to {options.baseline}")
+    if options.check is True:
+        regressions = check_regressions(
+            current=normalize(results=results, calibration=calibration),
+            baseline=load_baseline(options.baseline),
+            threshold=options.threshold,
+        )
+        for regression in regressions:
+            print(f"REGRESSION: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {options.threshold}x the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+"""
+Benchmark Harness: Stage Timings, Peak Memory and the Regression Gate
+"""
+
+import inspect
+import json
+import pathlib
+import statistics
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+# Time spent in a scenario outside every instrumented method
+PARSE_STAGE = "parse"
+
+
+@dataclass
+class StageResult:
+    """
+    Timings and Peak Memory of a Single Benchmark Scenario
+    """
+
+    scenario: str
+    campsites: int
+    total: float
+    stages: Dict[str, float] = field(default_factory=dict)
+    peak_memory: int = 0
+
+
+class StageProfiler:
+    """
+    Attribute Wall Time to Stages by Wrapping Methods
+
+    Time is exclusive: a stage called from inside another stage is
+    subtracted from the outer one, so stages always add up to the total.
+    Anything outside an instrumented method counts as `parse` - fetching
+    and parsing provider responses.
+    """
+
+    def __init__(self, stages: Dict[str, List[Tuple[type, str]]]) -> None:
+        """
+        Initialize with the Methods Making up Each Stage
+
+        Parameters
+        ----------
+        stages: Dict[str, List[Tuple[type, str]]]
+            Stage names and the (class, method name) pairs timed as that stage
+        """
+        self.stages = stages
+        self.timings: Dict[str, float] = {}
+        self._local = threading.local()
+
+    def _wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wrap a Function to Record its Exclusive Time Under a Stage
+        """
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            stack = self._local.__dict__.setdefault("stack", [])
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = stack.pop()
+                self.timings[stage] = self.timings.get(stage, 0.0) + (
+                    elapsed - children
+                )
+                if stack:
+                    stack[-1] += elapsed
+
+        return timed
+
+    @contextmanager
+    def instrument(self) -> Iterator["StageProfiler"]:
+        """
+        Patch Every Stage Method for the Duration of the Context
+        """
+        patched = []
+        for stage, methods in self.stages.items():
+            for cls, name in methods:
+                original = inspect.getattr_static(cls, name)
+                if isinstance(original, (classmethod, staticmethod)):
+                    wrapper = type(original)(self._wrap(stage, original.__func__))
+                else:
+                    wrapper = self._wrap(stage, original)
+                patched.append((cls, name, cls.__dict__.get(name)))
+                setattr(cls, name, wrapper)
+        try:
+            yield self
+        finally:
+            for cls, name, original in reversed(patched):
+                if original is None:
+                    delattr(cls, name)
+                else:
+                    setattr(cls, name, original)
+
+
+def measure(
+    scenario: str,
+    prepare: Callable[[], Callable[[], list]],
+    stages: Dict[str, List[Tuple[type, str]]],
+    context: Callable[[], ContextManager[Any]] = nullcontext,
+    repeat: int = 3,
+    memory: bool = True,
+) -> StageResult:
+    """
+    Time a Scenario by Stage and Measure its Peak Memory
+
+    Every run enters `context` and calls `prepare` before the clock starts,
+    only the callable `prepare` returns is timed. Timings come from the
+    fastest of `repeat` runs, peak memory from one more run under
+    `tracemalloc` (which would otherwise skew the timings).
+
+    Parameters
+    ----------
+    scenario: str
+    prepare: Callable[[], Callable[[], list]]
+        Returns a callable running the scenario once and returning the
+        campsites it produced
+    stages: Dict[str, List[Tuple[type, str]]]
+    context: Callable[[], ContextManager[Any]]
+        Context every run happens in, like a cassette being replayed
+    repeat: int
+    memory: bool
+        Whether to measure peak memory
+
+    Returns
+    -------
+    StageResult
+    """
+    best: Optional[StageResult] = None
+    for _ in range(repeat):
+        profiler = StageProfiler(stages=stages)
+        with context():
+            run = prepare()
+            with profiler.instrument():
+                start = time.perf_counter()
+                campsites = run()
+                total = time.perf_counter() - start
+        timings = {stage: profiler.timings.get(stage, 0.0) for stage in stages}
+        timings[PARSE_STAGE] = max(total - sum(timings.values()), 0.0)
+        if best is None or total < best.total:
+            best = StageResult(
+                scenario=scenario,
+                campsites=len(campsites),
+                total=total,
+                stages=timings,
+            )
+    if memory is True:
+        with context():
+            run = prepare()
+            tracemalloc.start()
+            try:
+                run()
+                _, best.peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    return best
+
+
+def calibrate(repeat: int = 5) -> float:
+    """
+    Time a Fixed Workload to Normalize Timings Across Machines
+
+    Returns
+    -------
+    float
+        Seconds the workload took, fastest of `repeat` runs
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        records = [
+            {"campsite_id": index % 997, "booking_date": index % 31, "price": index}
+            for index in range(100_000)
+        ]
+        records.sort(key=lambda record: (record["campsite_id"], record["booking_date"]))
+        statistics.fmean(record["price"] for record in records)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def normalize(results: List[StageResult], calibration: float) -> Dict[str, Any]:
+    """
+    Express Results in Multiples of the Calibration Workload
+
+    Parameters
+    ----------
+    results: List[StageResult]
+    calibration: float
+
+    Returns
+    -------
+    Dict[str, Any]
+    """
+    return {
+        result.scenario: {
+            "campsites": result.campsites,
+            "total": result.total / calibration,
+            "stages": {
+                stage: seconds / calibration for stage, seconds in result.stages.items()
+            },
+            "peak_memory": result.peak_memory,
+        }
+        for result in results
+    }
+
+
+def check_regressions(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 2.0,
+    min_relative: float = 0.05,
+) -> List[str]:
+    """
+    Compare Normalized Results Against a Baseline
+
+    A stage regresses when it takes more than `threshold` times its baseline
+    time, peak memory regresses the same way. Stages shorter than
+    `min_relative` calibration workloads are too noisy to gate and are
+    compared as if they took `min_relative`.
+
+    Parameters
+    ----------
+    current: Dict[str, Any]
+    baseline: Dict[str, Any]
+    threshold: float
+    min_relative: float
+
+    Returns
+    -------
+    List[str]
+        A message for every regression, empty when there are none
+    """
+    regressions = []
+    for scenario, expected in baseline.items():
+        if scenario not in current:
+            continue
+        measured = current[scenario]
+        for stage, expected_time in expected["stages"].items():
+            measured_time = measured["stages"].get(stage, 0.0)
+            ratio = max(measured_time, min_relative) / max(expected_time, min_relative)
+            if ratio > threshold:
+                regressions.append(
+                    f"{scenario} [{stage}]: {ratio:.2f}x slower than the baseline"
+                )
+        if expected["peak_memory"] and measured["peak_memory"]:
+            ratio = measured["peak_memory"] / expected["peak_memory"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{scenario} [peak memory]: {ratio:.2f}x the baseline"
+                )
+    return regressions
+
+
+def load_baseline(path: pathlib.Path) -> Dict[str, Any]:
+    """
+    Load a Saved Baseline
+    """
+    return json.loads(path.read_text())["scenarios"]
+
+
+def save_baseline(
+    path: pathlib.Path, results: List[StageResult], calibration: float
+) -> None:
+    """
+    Save Normalized Results as the New Baseline
+    """
+    payload = {
+        "calibration_seconds": calibration,
+        "scenarios": normalize(results=results, calibration=calibration),
+        "raw": [asdict(result) for result in results],
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n")
+
+
+def format_results(results: List[StageResult]) -> str:
+    """
+    Format Results as a Table
+    """
+    stage_names = sorted({stage for result in results for stage in result.stages})
+    header = ["scenario", "campsites", "total ms"]
+    header += [f"{stage} ms" for stage in stage_names] + ["peak MiB"]
+    rows = [header]
+    for result in results:
+        rows.append(
+            [
+                result.scenario,
+                f"{result.campsites:,}",
+                f"{result.total * 1000:.1f}",
+                *(
+                    f"{result.stages.get(stage, 0.0) * 1000:.1f}"
+                    for stage in stage_names
+                ),
+                f"{result.peak_memory / 2**20:.1f}",
+            ]
+        )
+    widths = [max(len(row[index]) for row in rows) for index in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if index == 0 else cell.rjust(width)
+            for index, (cell, width) in enumerate(zip(row, widths))
+        )
+        for row in rows
+    )
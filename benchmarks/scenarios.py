@@ -0,0 +1,271 @@
+"""
+Benchmark Scenarios: Recorded Cassettes and Synthetic Payloads
+
+Cassette scenarios replay the responses recorded for the test suite through
+a search's full `get_all_campsites` pipeline. Synthetic scenarios scale the
+same stages up past anything the cassettes hold.
+"""
+
+import datetime
+import logging
+import pathlib
+import sys
+import tempfile
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Tuple
+
+import vcr
+from freezegun import freeze_time
+
+from benchmarks.yellowstone_assembly import synthetic_month
+from camply.config.api_config import (
+    GoingToCampConfig,
+    RecreationBookingConfig,
+    UseDirectConfig,
+    YellowstoneConfig,
+)
+from camply.containers import AvailableCampsite, SearchWindow
+from camply.providers import GoingToCamp, Yellowstone
+from camply.providers.usedirect.usedirect import UseDirectProvider
+from camply.search.base_search import BaseCampingSearch
+from camply.search.search_going_to_camp import SearchGoingToCamp
+from camply.search.search_recreationdotgov import (
+    SearchRecreationDotGov,
+    SearchRecreationDotGovBase,
+)
+from camply.search.search_usedirect import SearchReserveCalifornia
+from camply.search.search_yellowstone import SearchYellowstone
+from camply.utils.concurrency_utils import HostRateLimiter
+
+CASSETTE_DIR = (
+    pathlib.Path(__file__).resolve().parent.parent
+    / "tests"
+    / "search_providers"
+    / "cassettes"
+)
+# The cassettes were recorded on this day, search windows are validated against it
+RECORDED_AT = datetime.datetime(2023, 4, 28, 12)
+
+# Methods timed as each stage, everything else counts as `parse`
+STAGES: Dict[str, List[Tuple[type, str]]] = {
+    "filter": [
+        (BaseCampingSearch, "_filter_date_overlap"),
+        (SearchRecreationDotGovBase, "filter_campsites_to_equipment"),
+    ],
+    "consolidate": [
+        (BaseCampingSearch, "campsites_to_df"),
+        (BaseCampingSearch, "_consolidate_campsites"),
+    ],
+    "construct": [
+        (BaseCampingSearch, "df_to_campsites"),
+        (AvailableCampsite, "__init__"),
+    ],
+}
+
+
+@dataclass
+class Scenario:
+    """
+    A Named Benchmark
+
+    `setup` takes the scale factor and returns the `prepare` callable handed
+    to `measure`, every run happens inside `context`.
+    """
+
+    name: str
+    setup: Callable[[float], Callable[[], Callable[[], list]]]
+    context: Callable[[], ContextManager[Any]] = nullcontext
+
+
+def cassette_scenario(
+    name: str,
+    cassette: pathlib.Path,
+    search_class: type,
+    start_date: datetime.date,
+    end_date: datetime.date,
+    **search_kwargs: Any,
+) -> Scenario:
+    """
+    Replay a Cassette Through a Search's `get_all_campsites`
+
+    Runs happen with the time frozen to when the cassettes were recorded
+    (ticking, so timings are still real) and a fresh search object, so the
+    provider fetches and parses every response each time.
+    """
+
+    @contextmanager
+    def context() -> Iterator[None]:
+        with replay(cassette), freeze_time(RECORDED_AT, tick=True):
+            yield
+
+    def setup(scale: float) -> Callable[[], Callable[[], list]]:
+        def prepare() -> Callable[[], list]:
+            search = search_class(
+                search_window=SearchWindow(start_date=start_date, end_date=end_date),
+                verbose=False,
+                **search_kwargs,
+            )
+            return search.get_all_campsites
+
+        return prepare
+
+    return Scenario(name=name, setup=setup, context=context)
+
+
+@contextmanager
+def replay(cassette: pathlib.Path) -> Iterator[None]:
+    """
+    Replay a Recorded Cassette with Fresh Provider Caches
+
+    Requests are made one at a time (vcrpy isn't thread safe) without any
+    rate limiting, and every on-disk provider cache points at an empty
+    directory, so each run parses the recorded responses instead of a cache.
+    """
+    configs = (GoingToCampConfig, UseDirectConfig, YellowstoneConfig)
+    providers = (GoingToCamp, Yellowstone, UseDirectProvider)
+    concurrency = {config: config.MAX_CONCURRENT_REQUESTS for config in configs}
+    cache_dirs = {
+        provider: provider.__dict__.get("__offline_cache_dir__")
+        for provider in providers
+    }
+    rate_limiters = {provider: provider.rate_limiter for provider in providers}
+    recdotgov_rate_limiting = RecreationBookingConfig.RATE_LIMITING
+    recorder = vcr.VCR(record_mode="none")
+    with tempfile.TemporaryDirectory() as cache_dir:
+        try:
+            for config in configs:
+                config.MAX_CONCURRENT_REQUESTS = 1
+            for provider in providers:
+                provider.__offline_cache_dir__ = pathlib.Path(cache_dir)
+                provider.rate_limiter = HostRateLimiter(calls=sys.maxsize, period=1.0)
+            RecreationBookingConfig.RATE_LIMITING = (0.0, 0.0)
+            with recorder.use_cassette(str(cassette), allow_playback_repeats=True):
+                yield
+        finally:
+            for config, value in concurrency.items():
+                config.MAX_CONCURRENT_REQUESTS = value
+            for provider, value in cache_dirs.items():
+                provider.__offline_cache_dir__ = value
+            for provider, value in rate_limiters.items():
+                provider.rate_limiter = value
+            RecreationBookingConfig.RATE_LIMITING = recdotgov_rate_limiting
+
+
+def synthetic_campsites(sites: int, nights: int) -> List[Dict[str, Any]]:
+    """
+    Nightly Availability Records for `sites` Campsites Across `nights` Nights
+
+    Every third night is booked so availabilities come in consecutive runs
+    like the real thing.
+    """
+    start = datetime.datetime(2023, 9, 1)
+    records = []
+    for site in range(sites):
+        for night in range(nights):
+            if (site + night) % 3 == 0:
+                continue
+            booking_date = start + datetime.timedelta(days=night)
+            records.append(
+                {
+                    "campsite_id": site,
+                    "booking_date": booking_date,
+                    "booking_end_date": booking_date + datetime.timedelta(days=1),
+                    "booking_nights": 1,
+                    "campsite_site_name": f"Site {site}",
+                    "campsite_loop_name": f"Loop {site % 7}",
+                    "campsite_type": "STANDARD NONELECTRIC",
+                    "campsite_occupancy": (1, 6),
+                    "campsite_use_type": "Overnight",
+                    "availability_status": "Available",
+                    "recreation_area": "Synthetic Recreation Area",
+                    "recreation_area_id": 1,
+                    "facility_name": f"Campground {site % 11}",
+                    "facility_id": site % 11,
+                    "booking_url": f"https://example.com/campsites/{site}",
+                    "permitted_equipment": [],
+                    "campsite_attributes": [],
+                }
+            )
+    return records
+
+
+def synthetic_consolidation(scale: float) -> Callable[[], Callable[[], list]]:
+    """
+    Construct, Consolidate and Rebuild Many Synthetic Campsites
+    """
+    records = synthetic_campsites(sites=max(int(50 * scale), 1), nights=30)
+
+    def run() -> list:
+        campsites = [AvailableCampsite(**record) for record in records]
+        campsite_df = BaseCampingSearch.campsites_to_df(campsites=campsites)
+        consolidated = BaseCampingSearch._consolidate_campsites(
+            campsite_df=campsite_df, nights=2
+        )
+        return BaseCampingSearch.df_to_campsites(campsite_df=consolidated)
+
+    return lambda: run
+
+
+def synthetic_yellowstone(scale: float) -> Callable[[], Callable[[], list]]:
+    """
+    Assemble a Synthetic Month of Yellowstone Availability
+    """
+    monthly_campsites, available_rooms, property_info = synthetic_month(
+        facilities=5, rooms=max(int(400 * scale), 1)
+    )
+
+    def run() -> list:
+        return Yellowstone._assemble_campsites(
+            monthly_campsites=monthly_campsites,
+            available_rooms=available_rooms,
+            property_info=property_info,
+        )
+
+    return lambda: run
+
+
+SCENARIOS: List[Scenario] = [
+    cassette_scenario(
+        name="RecreationDotGov",
+        cassette=CASSETTE_DIR / "test_get_all_campsites_campground.yaml",
+        search_class=SearchRecreationDotGov,
+        start_date=datetime.date(2023, 9, 1),
+        end_date=datetime.date(2023, 10, 1),
+        campgrounds=234708,
+    ),
+    cassette_scenario(
+        name="Yellowstone",
+        cassette=CASSETTE_DIR / "test_yellowstone_get_all_campsites.yaml",
+        search_class=SearchYellowstone,
+        start_date=datetime.date(2023, 9, 1),
+        end_date=datetime.date(2023, 10, 1),
+    ),
+    cassette_scenario(
+        name="GoingToCamp",
+        cassette=CASSETTE_DIR / "test_going_to_camp_get_all_campsites.yaml",
+        search_class=SearchGoingToCamp,
+        start_date=datetime.date(2023, 9, 1),
+        end_date=datetime.date(2023, 9, 2),
+        recreation_area=[1],
+        campgrounds="-2147483643",
+    ),
+    cassette_scenario(
+        name="ReserveCalifornia",
+        cassette=CASSETTE_DIR / "test_rc_cli_campsites_nights.yaml",
+        search_class=SearchReserveCalifornia,
+        start_date=datetime.date(2023, 6, 1),
+        end_date=datetime.date(2023, 7, 1),
+        recreation_area=None,
+        campgrounds=[1121],
+    ),
+    Scenario(name="synthetic-consolidation", setup=synthetic_consolidation),
+    Scenario(name="synthetic-yellowstone", setup=synthetic_yellowstone),
+]
+
+
+def quiet_logging() -> None:
+    """
+    Keep Provider Logging Out of the Benchmark Output
+    """
+    logging.getLogger("camply").setLevel(logging.WARNING)
@@ -0,0 +1,96 @@
+"""
+Benchmark: Yellowstone Campsite Record Assembly
+
+Times `Yellowstone._assemble_campsites` against a synthetic month of
+availability shaped like the Xanterra API responses.
+
+    python benchmarks/yellowstone_assembly.py --facilities 5 --rooms 400
+"""
+
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+from typing import List, Tuple
+
+from camply.providers import Yellowstone
+
+
+def synthetic_month(
+    facilities: int, rooms: int, days: int = 30
+) -> Tuple[List[dict], List[dict], List[dict]]:
+    """
+    Build Synthetic Monthly Campsites, Available Rooms and Property Info
+    """
+    start = date(2023, 9, 1)
+    booking_dates = [
+        (start + timedelta(days=offset)).strftime("%m/%d/%Y") for offset in range(days)
+    ]
+    monthly_campsites = []
+    available_rooms = []
+    property_info = []
+    for facility_index in range(facilities):
+        facility_id = f"YLY{facility_index}:RV"
+        for booking_date in booking_dates:
+            monthly_campsites.append(
+                {
+                    "booking_date": booking_date,
+                    "facility_id": facility_id,
+                    "facility_name": f"Campground {facility_index}",
+                }
+            )
+        for room_index in range(rooms):
+            campsite_code = f"S{room_index:04d}"
+            property_info.append(
+                {
+                    "facility_id": facility_id,
+                    "campsite_code": campsite_code,
+                    "campsite_title": f"Site {room_index}",
+                    "campsite_type": "RV",
+                    "capacity": (1, 6),
+                }
+            )
+            for booking_date in booking_dates[room_index % 3 :: 3]:
+                available_rooms.append(
+                    {
+                        "booking_date": booking_date,
+                        "facility_id": facility_id,
+                        "campsite_code": campsite_code,
+                        "available": 1,
+                        "price": 33,
+                    }
+                )
+    return monthly_campsites, available_rooms, property_info
+
+
+def main() -> None:
+    """
+    Run the Benchmark
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--facilities", type=int, default=5)
+    parser.add_argument("--rooms", type=int, default=400)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    monthly_campsites, available_rooms, property_info = synthetic_month(
+        facilities=args.facilities, rooms=args.rooms
+    )
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        campsites = Yellowstone._assemble_campsites(
+            monthly_campsites=monthly_campsites,
+            available_rooms=available_rooms,
+            property_info=property_info,
+        )
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    print(
+        f"{len(campsites):,} campsites from {len(available_rooms):,} rooms: "
+        f"best {best * 1000:.1f} ms, median {statistics.median(timings) * 1000:.1f} ms "
+        f"({len(campsites) / best:,.0f} campsites/s)"
+    )
+
+
+if __name__ == "__main__":
+    main()
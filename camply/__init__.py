@@ -2,11 +2,28 @@
 camply __init__ file
 """
 
+from typing import TYPE_CHECKING
+
 from ._version import __application__, __version__
 from .config import EquipmentOptions
 from .containers import AvailableCampsite, SearchWindow
-from .providers import GoingToCamp, RecreationDotGov, Yellowstone
-from .search import SearchRecreationDotGov, SearchYellowstone
+from .utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from .providers import GoingToCamp, RecreationDotGov, Yellowstone
+    from .search import SearchRecreationDotGov, SearchYellowstone
+
+# Providers and searches are imported the first time they're accessed
+__getattr__ = lazy_module_attributes(
+    __name__,
+    {
+        "GoingToCamp": "camply.providers:GoingToCamp",
+        "RecreationDotGov": "camply.providers:RecreationDotGov",
+        "Yellowstone": "camply.providers:Yellowstone",
+        "SearchRecreationDotGov": "camply.search:SearchRecreationDotGov",
+        "SearchYellowstone": "camply.search:SearchYellowstone",
+    },
+)
 
 __all__ = [
     "__version__",
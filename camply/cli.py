@@ -7,6 +7,7 @@ import sys
 from dataclasses import dataclass
 from datetime import date, timedelta
 from typing import (
+    TYPE_CHECKING,
     Any,
     Container,
     Dict,
@@ -20,28 +21,32 @@ from typing import (
 )
 
 import click
-from rich import traceback
 from rich_click import RichCommand, RichGroup, rich_click
 
-from camply import Yellowstone, __application__, __version__
-from camply.config import EquipmentOptions, SearchConfig, logging_config
+from camply import __application__, __version__
+from camply.config import (
+    EquipmentOptions,
+    InstrumentationConfig,
+    RIDBConfig,
+    SearchConfig,
+    logging_config,
+)
 from camply.config.logging_config import set_up_logging
 from camply.containers import SearchWindow
 from camply.containers.examples import example_campsite
 from camply.notifications import CAMPSITE_NOTIFICATIONS, MultiNotifierProvider
-from camply.providers import (
-    GoingToCamp,
-    RecreationDotGov,
-)
-from camply.search import CAMPSITE_SEARCH_PROVIDER, BaseCampingSearch
+from camply.search import CAMPSITE_SEARCH_PROVIDER
 from camply.utils import configure_camply, log_camply, make_list, yaml_utils
 from camply.utils.general_utils import days_of_the_week_mapping, handle_search_windows
 from camply.utils.logging_utils import log_sorted_response
 
+if TYPE_CHECKING:
+    from camply.search import BaseCampingSearch
+
 logging.Logger.camply = log_camply
 logger = logging.getLogger(__name__)
 
-DEFAULT_CAMPLY_PROVIDER: str = RecreationDotGov.__name__
+DEFAULT_CAMPLY_PROVIDER: str = "RecreationDotGov"
 
 rich_click.STYLE_OPTION = "bold green"
 rich_click.STYLE_SWITCH = "bold blue"
@@ -97,6 +102,22 @@ provider_argument = click.option(
 debug_option = click.option(
     "--debug/--no-debug", default=None, help="Enable extra debugging output"
 )
+profile_option = click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Profile the command and print its hot paths and allocations on exit",
+)
+profile_output_option = click.option(
+    "--profile-output",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help=(
+        "File to write the profile to, implies --profile. A `.json` file gets a "
+        "sampled speedscope profile, anything else a cProfile pstats file. "
+        f"Defaults to '{InstrumentationConfig.PROFILE_OUTPUT}'"
+    ),
+)
 
 
 def _set_up_debug(debug: Optional[bool] = None) -> None:
@@ -111,9 +132,22 @@ def _set_up_debug(debug: Optional[bool] = None) -> None:
         logger.debug("Camply Version: %s", __version__)
         logger.debug("Python Version: %s", sys.version.split(" ")[0])
         logger.debug("Platform: %s", sys.platform)
+    from rich import traceback
+
     traceback.install(show_locals=debug, suppress=[click, rich_click])
 
 
+def _set_up_profiling(ctx: click.core.Context, output: Optional[str]) -> None:
+    """
+    Profile the Rest of the Command, Reporting When its Context Closes
+    """
+    from camply.utils.profiling import ProfilingSession
+
+    session = ProfilingSession(output=output or InstrumentationConfig.PROFILE_OUTPUT)
+    ctx.call_on_close(lambda: click.echo(session.stop(), err=True))
+    session.start()
+
+
 def _preferred_provider(context: CamplyContext, command_provider: Optional[str]) -> str:
     """
     Called to get the preferred subcommands provider.
@@ -142,10 +176,16 @@ def _preferred_provider(context: CamplyContext, command_provider: Optional[str])
 @click.group(cls=RichGroup)
 @debug_option
 @provider_argument
+@profile_option
+@profile_output_option
 @click.version_option(version=__version__, prog_name=__application__)
 @click.pass_context
 def camply_command_line(
-    ctx: click.core.Context, debug: bool, provider: Optional[str]
+    ctx: click.core.Context,
+    debug: bool,
+    provider: Optional[str],
+    profile: bool,
+    profile_output: Optional[str],
 ) -> None:
     """
     Welcome to camply, the campsite finder.
@@ -164,6 +204,8 @@ def camply_command_line(
     logger.camply("camply, the campsite finder ⛺️")
     ctx.obj = CamplyContext(debug=debug, provider=provider)
     _set_up_debug(debug=debug)
+    if profile is True or profile_output is not None:
+        _set_up_profiling(ctx=ctx, output=profile_output)
 
 
 @camply_command_line.command(cls=RichCommand)
@@ -225,6 +267,8 @@ def equipment_types(
     Equipment are camping equipment that can be used at a campsite. Different providers
     and recreation areas have different types of equipment for which reservations can be made.
     """
+    from camply.providers import GoingToCamp, RecreationDotGov
+
     provider = _preferred_provider(context, provider)
     if not rec_area and provider == GoingToCamp.__name__:
         logger.error(
@@ -262,6 +306,8 @@ def recreation_areas(
     Search for Recreation Areas and their IDs. Recreation Areas are places like
     National Parks and National Forests that can contain one or many campgrounds.
     """
+    from camply.providers import GoingToCamp, RecreationDotGov, Yellowstone
+
     provider = _preferred_provider(context, provider)
     if context.debug is None:
         context.debug = debug
@@ -317,6 +363,8 @@ def campgrounds(
     multiple campsites, others are facilities like fire towers or cabins that might only
     contain a single 'campsite' to book.
     """
+    from camply.providers import GoingToCamp, Yellowstone
+
     provider = _preferred_provider(context, provider)
     if context.debug is None:
         context.debug = debug
@@ -462,7 +510,8 @@ equipment_id_argument = click.option(
     default=None,
     help="Search for campsites compatible with specific equipment categories. Going To "
     "Camp uses equipment category IDs for filtering campsites by equipment. Every "
-    "recreation area has equipment categories unique to it. "
+    "recreation area has equipment categories unique to it, so it can only be used "
+    "with a single --rec-area. "
     "Use `camply equipment-types --provider GoingToCamp --rec-area <rec area id>` "
     "to get a listing of equipment for an area.",
 )
@@ -559,7 +608,7 @@ def _validate_campsites(
         Tuple containing continuous run eval, search_windows,
         and days of the week
     """
-    if provider.startswith(RecreationDotGov.__name__) and all(
+    if provider.startswith(DEFAULT_CAMPLY_PROVIDER) and all(
         [
             len(rec_area) == 0,
             len(campground) == 0,
@@ -770,8 +819,8 @@ def campsites(
             day=day,
             yaml_config=yaml_config,
         )
-    provider_class: Type[BaseCampingSearch] = CAMPSITE_SEARCH_PROVIDER[provider]
-    camping_finder: BaseCampingSearch = provider_class(**provider_kwargs)
+    provider_class: Type["BaseCampingSearch"] = CAMPSITE_SEARCH_PROVIDER[provider]
+    camping_finder: "BaseCampingSearch" = provider_class(**provider_kwargs)
     camping_finder.get_matching_campsites(**search_kwargs)
 
 
@@ -799,6 +848,50 @@ def providers(
         )
 
 
+@camply_command_line.command(cls=RichCommand)
+@click.option(
+    "--export",
+    "export_source",
+    default=None,
+    metavar="PATH_OR_URL",
+    help=(
+        "Load this RIDB full export zip file (a path or a URL) instead of fetching "
+        "changes from the RIDB API. Defaults to downloading the latest export "
+        "the first time the catalog is synced"
+    ),
+)
+@debug_option
+@click.pass_obj
+def sync_catalog(
+    context: CamplyContext, debug: bool, export_source: Optional[str]
+) -> None:
+    """
+    Sync the local catalog of Recreation.gov facilities
+
+    Loads the RIDB's full data export into a local SQLite catalog of
+    recreation areas and facilities the first time it runs, and after that
+    only fetches the records that changed. Once synced, Recreation.gov
+    recreation area and campground lookups are served from the catalog.
+    """
+    from camply.providers import RecreationDotGov
+    from camply.providers.recreation_dot_gov.ridb_catalog import RIDBCatalog
+
+    if context.debug is None:
+        context.debug = debug
+        _set_up_debug(debug=context.debug)
+    if not RIDBConfig.CATALOG_PATH:
+        logger.error("The local RIDB catalog is disabled, set CAMPLY_RIDB_CATALOG")
+        sys.exit(1)
+    with RIDBCatalog(path=RIDBConfig.CATALOG_PATH) as catalog:
+        if export_source is None and catalog.synced_at is None:
+            export_source = RIDBConfig.EXPORT_URL
+        if export_source is not None:
+            catalog.sync_export(source=export_source)
+        else:
+            RecreationDotGov().refresh_catalog(catalog=catalog)
+        logger.info("Local RIDB catalog synced: %s", catalog.path)
+
+
 test_notifications_kwargs = notification_kwargs.copy()
 test_notifications_kwargs["help"] = test_notifications_kwargs["help"].replace(
     "Enables continuous searching. ", ""
@@ -10,10 +10,13 @@ from .api_config import (
 )
 from .data_columns import CampsiteContainerFields, DataColumns
 from .file_config import FileConfig
+from .instrumentation_config import InstrumentationConfig
 from .notification_config import (
     AppriseConfig,
+    DigestConfig,
     EmailConfig,
     NtfyConfig,
+    OutboxConfig,
     PushbulletConfig,
     PushoverConfig,
     SlackConfig,
@@ -29,9 +32,12 @@ __all__ = [
     "CampsiteContainerFields",
     "DataColumns",
     "FileConfig",
+    "InstrumentationConfig",
     "AppriseConfig",
+    "DigestConfig",
     "EmailConfig",
     "NtfyConfig",
+    "OutboxConfig",
     "PushbulletConfig",
     "PushoverConfig",
     "SlackConfig",
@@ -2,7 +2,9 @@
 API Searching Configuration
 """
 
+from datetime import timedelta
 from os import getenv
+from os.path import join
 from typing import Any, Dict, List, Tuple, Union
 
 from dotenv import load_dotenv
@@ -33,6 +35,14 @@ class APIConfig:
         6000  # Max Timeout in Seconds of Retrying (100 Minutes)
     )
 
+    # Send provider requests for a host to another base URL instead, e.g. a
+    # local emulator: "www.recreation.gov=http://127.0.0.1:8080,*=http://..."
+    HOST_OVERRIDES: Dict[str, str] = dict(
+        item.strip().split("=", 1)
+        for item in getenv("CAMPLY_HOST_OVERRIDES", "").split(",")
+        if "=" in item
+    )
+
 
 class RIDBConfig(APIConfig):
     """
@@ -65,6 +75,21 @@ class RIDBConfig(APIConfig):
     # TOUR DETAILS
     TOUR_API_PATH: str = "tours"
 
+    # PAGINATION: PAGES AFTER THE FIRST ARE FETCHED CONCURRENTLY, UP TO A CAP
+    MAX_RESULTS: int = int(getenv("CAMPLY_RIDB_MAX_RESULTS", "1000"))
+    MAX_CONCURRENT_REQUESTS: int = 4
+    # RATE LIMITING (RIDB ALLOWS 50 REQUESTS PER MINUTE)
+    RATE_LIMIT_CALLS: int = 50
+    RATE_LIMIT_PERIOD: float = 60.0
+
+    # LOCAL CATALOG OF FACILITIES AND RECREATION AREAS (`camply sync-catalog`),
+    # USED ONCE SYNCED - SET CAMPLY_RIDB_CATALOG TO "" TO ALWAYS SEARCH LIVE
+    CATALOG_PATH: str = getenv(
+        "CAMPLY_RIDB_CATALOG", join(FileConfig.HOME_PATH, ".camply_ridb.sqlite")
+    )
+    CATALOG_REFRESH_INTERVAL: timedelta = timedelta(days=1)
+    EXPORT_URL: str = "https://ridb.recreation.gov/downloads/RIDBFullExport_V1_JSON.zip"
+
 
 class RecreationBookingConfig(APIConfig):
     """
@@ -113,6 +138,28 @@ class UseDirectConfig(APIConfig):
     AVAILABILITY_ENDPOINT = f"{RDR_PREFIX}/{SEARCH_PREFIX}/grid"
     DATE_FORMAT = "%m-%d-%Y"
 
+    # RATE LIMITING (PER UseDirect HOST, ONE CALL PER SECOND)
+    RATE_LIMIT_CALLS: int = 1
+    RATE_LIMIT_PERIOD: float = 1.0
+    MAX_CONCURRENT_REQUESTS: int = 3
+
+    METADATA_TTL: timedelta = timedelta(days=1)
+    UNIT_METADATA_TTL: timedelta = timedelta(days=7)
+
+
+class GoingToCampConfig(APIConfig):
+    """
+    GoingToCamp API Configuration
+    """
+
+    # RATE LIMITING (PER GoingToCamp HOST)
+    RATE_LIMIT_CALLS: int = 5
+    RATE_LIMIT_PERIOD: float = 1.0
+    MAX_CONCURRENT_REQUESTS: int = 4
+
+    SITE_DETAILS_TTL: timedelta = timedelta(days=7)
+    MAP_HIERARCHY_TTL: timedelta = timedelta(days=1)
+
 
 class YellowstoneConfig(DataColumns, APIConfig):
     """
@@ -154,7 +201,7 @@ class YellowstoneConfig(DataColumns, APIConfig):
     FACILITY_PRICE: str = "price"
     FACILITY_TYPE: str = "type"
 
-    CAMPSITE_DATA_COLUMNS: List[str] = ["facility_id", "facility_name", "booking_url"]
+    BOOKING_DATE_FORMAT: str = "%m/%d/%Y"
 
     RATE_CODE: str = "INTERNET"
     LODGING_RATES: str = "rates"
@@ -166,6 +213,22 @@ class YellowstoneConfig(DataColumns, APIConfig):
 
     MINIMUM_POLLING_INTERVAL: int = 45
 
+    # RATE LIMITING (webapi.xanterra.net)
+    RATE_LIMIT_CALLS: int = 3
+    RATE_LIMIT_PERIOD: float = 1.0
+    MAX_CONCURRENT_REQUESTS: int = 3
+
+    PROPERTY_INFO_TTL: timedelta = timedelta(days=7)
+
+    # RETRY BUDGET (PER REQUEST AND PER POLL) AND CIRCUIT BREAKER
+    REQUEST_TIMEOUT: int = 30
+    RETRY_MAX_ATTEMPTS: int = 4
+    RETRY_MAX_DELAY: int = 120  # Seconds Spent Retrying a Single Request
+    RETRY_MAX_WAIT: int = 30  # Max Seconds Between Attempts
+    RETRY_POLL_BUDGET: int = 180  # Seconds Spent Retrying Across a Whole Poll
+    CIRCUIT_FAILURE_THRESHOLD: int = 3
+    CIRCUIT_RESET_TIMEOUT: int = 300
+
     WEBUI_ALIAS_ENDPOINT: str = "yellowstonenationalparklodges.com"
     WEBUI_BASE_ENDPOINT: str = "secure.yellowstonenationalparklodges.com"
     WEBUI_BOOKING_PATH: str = "booking/lodging-select"
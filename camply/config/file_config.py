@@ -75,12 +75,43 @@ class FileConfig:
         APPRISE_URL={"default": "", "notes": "Apprise notification URL"},
         WEBHOOK_URL={"default": "", "notes": "Webhook URL"},
         WEBHOOK_HEADERS={"default": "", "notes": "Webhook JSON Headers"},
+        WEBHOOK_FORMAT={
+            "default": "json",
+            "notes": "Webhook body format, `json` or `ndjson`",
+        },
+        WEBHOOK_GZIP={"default": "", "notes": "Set to true to gzip webhook bodies"},
+        WEBHOOK_MAX_BATCH_SIZE={
+            "default": 100,
+            "notes": "Most campsites sent per webhook request",
+        },
+        CAMPLY_NOTIFICATION_DIGEST={
+            "default": "",
+            "notes": "Set to true to pack campsites into digest notifications",
+        },
+        CAMPLY_NOTIFICATION_OUTBOX={
+            "default": "",
+            "notes": "SQLite file to queue notifications in (not required)",
+        },
+        CAMPLY_INSTRUMENTATION={
+            "default": "",
+            "notes": "Per-poll timing sinks, e.g. `log,jsonl:polls.jsonl` (not required)",
+        },
         RIDB_API_KEY={
             "default": "",
             "notes": "Personal Recreation.gov API Key (not required)",
         },
+        CAMPLY_RIDB_MAX_RESULTS={
+            "default": 1000,
+            "notes": "Most results fetched for a Recreation.gov search",
+        },
+        CAMPLY_RIDB_CATALOG={
+            "default": "~/.camply_ridb.sqlite",
+            "notes": "Local Recreation.gov catalog path (`camply sync-catalog`)",
+        },
     )
 
     PROVIDERS_DIRECTORY = CAMPLY_DIRECTORY.joinpath("providers")
     RESERVE_CALIFORNIA_PROVIDER = PROVIDERS_DIRECTORY.joinpath("reserve_california")
     USEDIRECT_PROVIDER = PROVIDERS_DIRECTORY.joinpath("usedirect")
+    GOING_TO_CAMP_PROVIDER = PROVIDERS_DIRECTORY.joinpath("going_to_camp")
+    XANTERRA_PROVIDER = PROVIDERS_DIRECTORY.joinpath("xanterra")
@@ -0,0 +1,49 @@
+"""
+Project Configuration for Search Instrumentation
+"""
+
+from os import getenv
+from typing import Tuple
+
+from dotenv import load_dotenv
+
+from camply.config.file_config import FileConfig
+
+load_dotenv(FileConfig.DOT_CAMPLY_FILE, override=False)
+
+
+class InstrumentationConfig:
+    """
+    Instrumentation Config Class
+    """
+
+    # Comma separated sinks, instrumentation is disabled when unset:
+    # "log", "jsonl:<PATH>", "prometheus:<PATH>" (textfile), "otel" and
+    # "metrics:[<HOST>:]<PORT>" (HTTP endpoint)
+    SINKS: str = getenv("CAMPLY_INSTRUMENTATION", "")
+    OPENTELEMETRY_METER: str = "camply"
+    METRICS_HOST: str = "127.0.0.1"
+    METRICS_PATH: str = "/metrics"
+    # Upper bounds of the histogram buckets, in seconds
+    METRICS_BUCKETS: Tuple[float, ...] = (
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+        30,
+        60,
+        300,
+        900,
+        1800,
+        3600,
+    )
+
+    # `camply --profile`
+    PROFILE_OUTPUT: str = "camply.prof"
+    PROFILE_SAMPLING_INTERVAL: float = 0.005
+    PROFILE_TRACEMALLOC_FRAMES: int = 1
+    PROFILE_TOP_N: int = 20
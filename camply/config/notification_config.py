@@ -53,6 +53,10 @@ class EmailConfig:
     DEFAULT_SMTP_PORT: int = 465
     EMAIL_SMTP_PORT: int = int(getenv("EMAIL_SMTP_PORT", DEFAULT_SMTP_PORT))
 
+    SMTP_TIMEOUT: int = 30
+    # Servers drop idle connections, reconnect rather than fail on a stale one
+    SMTP_IDLE_TIMEOUT: int = 240
+
     ENVIRONMENT_VARIABLE_NAMES: List[str] = [
         "EMAIL_TO_ADDRESS",
         "EMAIL_USERNAME",
@@ -133,3 +137,46 @@ class WebhookConfig:
     WEBHOOK_HEADERS: Dict[str, Any] = json.loads(
         getenv("WEBHOOK_HEADERS", None) or "{}"
     )
+    # `json` sends one JSON document per batch, `ndjson` streams one campsite per line
+    WEBHOOK_FORMAT: str = (getenv("WEBHOOK_FORMAT", None) or "json").lower()
+    WEBHOOK_GZIP: bool = (getenv("WEBHOOK_GZIP", None) or "false").lower() in [
+        "1",
+        "true",
+        "yes",
+    ]
+    WEBHOOK_MAX_BATCH_SIZE: int = int(getenv("WEBHOOK_MAX_BATCH_SIZE", None) or 100)
+
+    NDJSON_CONTENT_TYPE: str = "application/x-ndjson"
+    REQUEST_TIMEOUT: int = 30
+    POOL_MAXSIZE: int = 4
+    RETRY_MAX_ATTEMPTS: int = 4
+    RETRY_MAX_WAIT: float = 10.0
+    RETRY_STATUS_CODES: List[int] = [408, 425, 429, 500, 502, 503, 504]
+
+
+class OutboxConfig:
+    """
+    Notification Outbox Config Class
+    """
+
+    # Path to a SQLite file, notifications are sent inline when unset
+    OUTBOX_PATH: Optional[str] = getenv("CAMPLY_NOTIFICATION_OUTBOX", None) or None
+
+    POLL_INTERVAL: float = 1.0  # Seconds Between Dispatcher Checks
+    MAX_ATTEMPTS: int = 8
+    BACKOFF_BASE: float = 5.0  # Seconds Before the First Retry
+    BACKOFF_MAX: float = 900.0  # Max Seconds Between Retries
+    DRAIN_TIMEOUT: float = 60.0  # Seconds to Keep Delivering on Close
+    RETENTION_DAYS: int = 7  # Days Delivered Keys are Kept for Deduplication
+
+
+class DigestConfig:
+    """
+    Digest Notification Config Class
+    """
+
+    DIGEST_ENABLED: bool = getenv("CAMPLY_NOTIFICATION_DIGEST", "false").lower() in [
+        "1",
+        "true",
+        "yes",
+    ]
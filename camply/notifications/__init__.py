@@ -1,16 +1,42 @@
 """
 Notifications __init__ file
+
+Notifiers are imported the first time they're accessed, so the clients
+behind them (apprise, twilio, ...) are only imported when they're used.
 """
 
-from .apprise import AppriseNotifications
-from .email_notifications import EmailNotifications
-from .multi_provider_notifications import CAMPSITE_NOTIFICATIONS, MultiNotifierProvider
-from .pushbullet import PushbulletNotifications
-from .pushover import PushoverNotifications
-from .silent_notifications import SilentNotifications
-from .slack import SlackNotifications
-from .telegram import TelegramNotifications
-from .twilio import TwilioNotifications
+from typing import TYPE_CHECKING, Dict
+
+from camply.utils.lazy_imports import lazy_module_attributes
+
+if TYPE_CHECKING:
+    from .apprise import AppriseNotifications
+    from .email_notifications import EmailNotifications
+    from .multi_provider_notifications import (
+        CAMPSITE_NOTIFICATIONS,
+        MultiNotifierProvider,
+    )
+    from .pushbullet import PushbulletNotifications
+    from .pushover import PushoverNotifications
+    from .silent_notifications import SilentNotifications
+    from .slack import SlackNotifications
+    from .telegram import TelegramNotifications
+    from .twilio import TwilioNotifications
+
+__notifications__: Dict[str, str] = {
+    "AppriseNotifications": "camply.notifications.apprise:AppriseNotifications",
+    "EmailNotifications": "camply.notifications.email_notifications:EmailNotifications",
+    "MultiNotifierProvider": "camply.notifications.multi_provider_notifications:MultiNotifierProvider",
+    "CAMPSITE_NOTIFICATIONS": "camply.notifications.multi_provider_notifications:CAMPSITE_NOTIFICATIONS",
+    "PushbulletNotifications": "camply.notifications.pushbullet:PushbulletNotifications",
+    "PushoverNotifications": "camply.notifications.pushover:PushoverNotifications",
+    "SilentNotifications": "camply.notifications.silent_notifications:SilentNotifications",
+    "SlackNotifications": "camply.notifications.slack:SlackNotifications",
+    "TelegramNotifications": "camply.notifications.telegram:TelegramNotifications",
+    "TwilioNotifications": "camply.notifications.twilio:TwilioNotifications",
+}
+
+__getattr__ = lazy_module_attributes(__name__, __notifications__)
 
 __all__ = [
     "AppriseNotifications",
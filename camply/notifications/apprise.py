@@ -18,6 +18,11 @@ class AppriseNotifications(BaseNotifications):
     Push Notifications via Apprise
     """
 
+    max_concurrent_messages: int = 4
+
+    # Conservative limit shared by most Apprise services
+    max_message_length: int = 2000
+
     def __init__(self):
         super().__init__()
         try:
@@ -64,6 +69,10 @@ class AppriseNotifications(BaseNotifications):
         ----------
         campsites: AvailableCampsite
         """
+        if self.digest is True:
+            self.send_digest(campsites=campsites)
+            return
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -74,4 +83,5 @@ class AppriseNotifications(BaseNotifications):
             fields.append("")
             fields.append("camply, the campsite finder ⛺️")
             composed_message = "\n".join(fields)
-            self.send_message(message=composed_message)
+            messages.append({"message": composed_message})
+        self.send_messages(messages)
@@ -4,12 +4,15 @@ Push Notifications Template
 import datetime
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
-from camply.config import CampsiteContainerFields
+from camply.config import CampsiteContainerFields, DigestConfig
 from camply.containers import AvailableCampsite
+from camply.utils.concurrency_utils import HostRateLimiter, run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -26,17 +29,38 @@ class BaseNotifications(ABC):
     """
 
     last_gasp: bool = True
+    # Messages sent at once by `send_messages`, and at most `rate_limit_calls`
+    # messages per `rate_limit_period` seconds (unlimited when None)
+    max_concurrent_messages: int = 1
+    rate_limit_calls: Optional[int] = None
+    rate_limit_period: float = 1.0
+    # Longest message the provider accepts, digests are packed to fit it.
+    # Providers without a limit don't support digests
+    max_message_length: Optional[int] = None
 
     ignored_notification_fields = [
         CampsiteContainerFields.LOCATION,
         CampsiteContainerFields.CAMPSITE_ATTRIBUTES,
     ]
 
+    # Formatted campsites shared by every provider, see `cache_formatted_campsites`
+    _formatted_campsites: Dict[
+        int, Tuple[AvailableCampsite, str, List[Tuple[str, str, Any]]]
+    ] = {}
+
     def __init__(self) -> None:
         """
         Instantiate with a Requests Session
         """
         self.session = requests.Session()
+        self.digest: bool = (
+            DigestConfig.DIGEST_ENABLED is True and self.max_message_length is not None
+        )
+        self.rate_limiter: Optional[HostRateLimiter] = None
+        if self.rate_limit_calls is not None:
+            self.rate_limiter = HostRateLimiter(
+                calls=self.rate_limit_calls, period=self.rate_limit_period
+            )
 
     def __repr__(self) -> str:
         """
@@ -69,14 +93,191 @@ class BaseNotifications(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """
+        Release Anything Held Open by the Notifier
+        """
+        self.session.close()
+
+    def send_messages(self, messages: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send Many Messages, Concurrently and Within the Provider's Rate Limit
+
+        Parameters
+        ----------
+        messages: List[Dict[str, Any]]
+            Keyword arguments for each `send_message` call
+
+        Returns
+        -------
+        List[Any]
+            The result of each `send_message` call, in order
+        """
+        return run_concurrently(
+            self._send_rate_limited_message,
+            messages,
+            max_workers=self.max_concurrent_messages,
+        )
+
+    def _send_rate_limited_message(self, message_kwargs: Dict[str, Any]) -> Any:
+        """
+        Send a Single Message Once the Rate Limit Allows
+
+        Parameters
+        ----------
+        message_kwargs: Dict[str, Any]
+
+        Returns
+        -------
+        Any
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(host=self.__class__.__name__)
+        return self.send_message(**message_kwargs)
+
+    def measure_message(self, message: str) -> int:
+        """
+        Length of a Message as the Provider Counts it
+
+        Parameters
+        ----------
+        message: str
+
+        Returns
+        -------
+        int
+        """
+        return len(message)
+
     @classmethod
-    def format_standard_campsites(
+    def format_digest_line(cls, campsite: AvailableCampsite) -> str:
+        """
+        Format a Campsite as a Single Digest Line
+
+        Parameters
+        ----------
+        campsite: AvailableCampsite
+
+        Returns
+        -------
+        str
+        """
+        nights = "night" if campsite.booking_nights == 1 else "nights"
+        return (
+            f"• {campsite.campsite_site_name} ({campsite.campsite_type}), "
+            f"{campsite.booking_nights} {nights}: {campsite.booking_url}"
+        )
+
+    def pack_digest(self, campsites: List[AvailableCampsite]) -> List[str]:
+        """
+        Pack Campsites into as few Messages as `max_message_length` Allows
+
+        Campsites are grouped under a header per facility and booking date.
+        Groups are filled into messages in order and a group that doesn't fit
+        is continued in the next message under a repeated header. A single
+        line longer than the limit is sent in a message on its own.
+
+        Parameters
+        ----------
+        campsites: List[AvailableCampsite]
+
+        Returns
+        -------
+        List[str]
+        """
+        limit = self.max_message_length
+        groups: Dict[Tuple[str, str, datetime.date], List[str]] = {}
+        for campsite in sorted(
+            campsites, key=lambda x: (x.booking_date, x.facility_name)
+        ):
+            key = (
+                campsite.recreation_area,
+                campsite.facility_name,
+                campsite.booking_date.date(),
+            )
+            groups.setdefault(key, []).append(self.format_digest_line(campsite))
+        messages: List[str] = []
+        current: List[str] = []
+        for (recreation_area, facility_name, booking_date), lines in groups.items():
+            header = (
+                f"🏕 {facility_name} | {recreation_area} | "
+                f"{booking_date.strftime('%Y-%m-%d')}"
+            )
+            section = [header]
+            for line in lines:
+                candidate = "\n".join([*current, *section, line])
+                if limit is None or self.measure_message(candidate) <= limit:
+                    section.append(line)
+                    continue
+                if len(section) > 1:
+                    messages.append("\n".join([*current, *section]))
+                elif current:
+                    messages.append("\n".join(current).rstrip("\n"))
+                current = []
+                section = [header, line]
+            current = [*current, *section, ""]
+        if current:
+            messages.append("\n".join(current).rstrip("\n"))
+        return messages
+
+    def send_digest(self, campsites: List[AvailableCampsite], **kwargs) -> List[Any]:
+        """
+        Send Campsites as Packed Digest Messages
+
+        Parameters
+        ----------
+        campsites: List[AvailableCampsite]
+        **kwargs
+            Passed to every `send_message` call
+
+        Returns
+        -------
+        List[Any]
+        """
+        messages = self.pack_digest(campsites)
+        return self.send_messages(
+            [{"message": message, **kwargs} for message in messages]
+        )
+
+    @classmethod
+    @contextmanager
+    def cache_formatted_campsites(
+        cls, campsites: List[AvailableCampsite]
+    ) -> Iterator[None]:
+        """
+        Format Campsites Once and Share the Result With Every Provider
+
+        While the context is open `format_standard_campsites` returns the
+        precomputed fields for these campsites instead of formatting them again.
+
+        Parameters
+        ----------
+        campsites: List[AvailableCampsite]
+        """
+        added = []
+        for campsite in campsites:
+            if id(campsite) not in BaseNotifications._formatted_campsites:
+                BaseNotifications._formatted_campsites[id(campsite)] = (
+                    campsite,
+                    *cls._format_campsite_fields(campsite=campsite),
+                )
+                added.append(id(campsite))
+        try:
+            yield
+        finally:
+            for campsite_id in added:
+                BaseNotifications._formatted_campsites.pop(campsite_id, None)
+
+    @classmethod
+    def _format_campsite_fields(
         cls, campsite: AvailableCampsite
-    ) -> Tuple[str, Dict[str, str]]:
+    ) -> Tuple[str, List[Tuple[str, str, Any]]]:
         """
-        Format Standard Message
+        Format the Title and Every (key, label, value) Field of a Campsite
         """
-        fields = {}
+        cached = BaseNotifications._formatted_campsites.get(id(campsite))
+        if cached is not None and cached[0] is campsite:
+            return cached[1], cached[2]
         message_title = " | ".join(
             [
                 campsite.recreation_area,
@@ -84,6 +285,7 @@ class BaseNotifications(ABC):
                 campsite.booking_date.strftime("%Y-%m-%d"),
             ]
         )
+        fields = []
         for key, value in campsite.dict().items():
             if key in [
                 CampsiteContainerFields.BOOKING_DATE,
@@ -102,7 +304,27 @@ class BaseNotifications(ABC):
                 value = "\n  - " + "\n  - ".join(
                     {item.equipment_name for item in equipment}
                 )
-            if key not in cls.ignored_notification_fields:
-                formatted_key = key.replace("_", " ").title()
-                fields[formatted_key] = value
+            fields.append((key, _field_label(key), value))
         return message_title, fields
+
+    @classmethod
+    def format_standard_campsites(
+        cls, campsite: AvailableCampsite
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        Format Standard Message
+        """
+        message_title, fields = cls._format_campsite_fields(campsite=campsite)
+        return message_title, {
+            label: value
+            for key, label, value in fields
+            if key not in cls.ignored_notification_fields
+        }
+
+
+@lru_cache(maxsize=None)
+def _field_label(key: str) -> str:
+    """
+    Human Readable Label for a Campsite Field
+    """
+    return key.replace("_", " ").title()
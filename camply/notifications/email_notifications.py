@@ -1,10 +1,13 @@
 """
-Push Notifications via Pushover
+Push Notifications via Email
 """
 import logging
+import ssl
+import threading
+import time
 from email.message import EmailMessage
-from smtplib import SMTP_SSL
-from typing import List
+from smtplib import SMTP_SSL, SMTPException, SMTPServerDisconnected
+from typing import Any, Dict, List, Optional, Tuple
 
 from camply.config import EmailConfig
 from camply.containers import AvailableCampsite
@@ -13,6 +16,139 @@ from camply.notifications.base_notifications import BaseNotifications
 logger = logging.getLogger(__name__)
 
 
+class SMTPClient:
+    """
+    Long-Lived, Thread-Safe SMTP Connection
+
+    The connection is opened and authenticated on first use and reused for
+    every message after that. Connections that have sat idle too long are
+    reopened, and a send that fails because the server dropped the
+    connection is retried once over a fresh one.
+    """
+
+    _clients: Dict[Tuple[str, int, str], "SMTPClient"] = {}
+    _clients_lock = threading.Lock()
+
+    def __init__(self, server: str, port: int, username: str, password: str) -> None:
+        """
+        Initialize with Connection Details
+
+        Parameters
+        ----------
+        server: str
+        port: int
+        username: str
+        password: str
+        """
+        self.server = server
+        self.port = port
+        self.username = username
+        self._password = password
+        self._lock = threading.Lock()
+        self._connection: Optional[SMTP_SSL] = None
+        self._last_used: float = 0.0
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {self.username}@{self.server}:{self.port}>"
+
+    @classmethod
+    def get_client(
+        cls, server: str, port: int, username: str, password: str
+    ) -> "SMTPClient":
+        """
+        Get the Shared Client for a Server and Login
+
+        Parameters
+        ----------
+        server: str
+        port: int
+        username: str
+        password: str
+
+        Returns
+        -------
+        SMTPClient
+        """
+        key = (server, int(port), username)
+        with cls._clients_lock:
+            client = cls._clients.get(key)
+            if client is None or client._password != password:
+                client = cls(
+                    server=server, port=int(port), username=username, password=password
+                )
+                cls._clients[key] = client
+        return client
+
+    def _connect(self) -> SMTP_SSL:
+        """
+        Open and Authenticate a New Connection
+        """
+        self._disconnect()
+        connection = SMTP_SSL(self.server, self.port, timeout=EmailConfig.SMTP_TIMEOUT)
+        connection.ehlo()
+        connection.login(user=self.username, password=self._password)
+        self._connection = connection
+        return connection
+
+    def _disconnect(self) -> None:
+        """
+        Close the Current Connection, Ignoring Errors From a Dead One
+        """
+        if self._connection is not None:
+            try:
+                self._connection.quit()
+            except (SMTPException, OSError):
+                pass
+            self._connection = None
+
+    def _get_connection(self) -> SMTP_SSL:
+        """
+        Return an Open Connection, Reconnecting if it's Gone Stale
+        """
+        idle = time.monotonic() - self._last_used
+        if self._connection is None or idle > EmailConfig.SMTP_IDLE_TIMEOUT:
+            return self._connect()
+        return self._connection
+
+    def validate(self) -> None:
+        """
+        Connect and Log In, Raising Any Connection or Authentication Errors
+        """
+        with self._lock:
+            self._connect()
+            self._last_used = time.monotonic()
+
+    def send(self, emails: List[EmailMessage]) -> None:
+        """
+        Send Emails Over the Shared Connection
+
+        Parameters
+        ----------
+        emails: List[EmailMessage]
+        """
+        with self._lock:
+            for email in emails:
+                connection = self._get_connection()
+                logger.info(f"Sending Email to {email['To']}: {email['Subject']}")
+                try:
+                    connection.send_message(email)
+                except (SMTPServerDisconnected, ConnectionError, ssl.SSLError) as e:
+                    logger.debug(f"SMTP connection lost, reconnecting: {e}")
+                    self._connect().send_message(email)
+                self._last_used = time.monotonic()
+                logger.info("Email sent successfully")
+
+    def close(self) -> None:
+        """
+        Close the Connection
+        """
+        with self._lock:
+            self._disconnect()
+
+
 class EmailNotifications(BaseNotifications):
     """
     Notifications via Email
@@ -30,8 +166,8 @@ class EmailNotifications(BaseNotifications):
         """
         Data Validation
 
-        **kwargs
-            Accepts: from, to, subject, username, password, server, port
+        The SMTP login is checked lazily, on the first email sent or
+        by calling `validate`.
         """
         super().__init__()
         # PERFORM SOME VALIDATION
@@ -54,17 +190,34 @@ class EmailNotifications(BaseNotifications):
             )
             logger.error(error_message)
             raise EnvironmentError(error_message)
-        # ATTEMPT AN EMAIL LOGIN AT INIT TO THROW ERRORS EARLY
-        _email_server = SMTP_SSL(
-            self.email_smtp_server,
-            self.email_smtp_server_port,
-        )
-        _email_server.ehlo()
-        _email_server.login(
-            user=self.email_username,
-            password=self._email_password,
+
+    def _get_client(self, **kwargs) -> SMTPClient:
+        """
+        Get the SMTP Client, Accepts: username, password, server, port
+        """
+        return SMTPClient.get_client(
+            server=kwargs.get("server", self.email_smtp_server),
+            port=kwargs.get("port", self.email_smtp_server_port),
+            username=kwargs.get("username", self.email_username),
+            password=kwargs.get("password", self._email_password),
         )
-        _email_server.quit()
+
+    def validate(self) -> None:
+        """
+        Log In to the SMTP Server to Throw Configuration Errors Early
+        """
+        self._get_client().validate()
+
+    def _build_email(self, message: str, **kwargs) -> EmailMessage:
+        """
+        Build an Email, Accepts: from, to, subject
+        """
+        email = EmailMessage()
+        email.set_content(message)
+        email["Subject"] = kwargs.get("subject", self.email_subject)
+        email["From"] = kwargs.get("from", self.email_from)
+        email["To"] = kwargs.get("to", self.email_to)
+        return email
 
     def send_message(self, message: str, **kwargs) -> None:
         """
@@ -81,22 +234,35 @@ class EmailNotifications(BaseNotifications):
         -------
         object
         """
-        email = EmailMessage()
-        email.set_content(message)
-        email["Subject"] = kwargs.get("subject", self.email_subject)
-        email["From"] = kwargs.get("from", self.email_from)
-        email["To"] = kwargs.get("to", self.email_to)
-        email_server_user = kwargs.get("username", self.email_username)
-        email_server_password = kwargs.get("password", self._email_password)
-        email_server_smtp_server = kwargs.get("server", self.email_smtp_server)
-        email_server_smtp_server_port = kwargs.get("port", self.email_smtp_server_port)
-        email_server = SMTP_SSL(email_server_smtp_server, email_server_smtp_server_port)
-        email_server.ehlo()
-        email_server.login(user=email_server_user, password=email_server_password)
-        logger.info(f"Sending Email to {email['To']}: {email['Subject']}")
-        email_server.send_message(email)
-        logger.info("Email sent successfully")
-        email_server.quit()
+        self.send_messages([{"message": message, **kwargs}])
+
+    def send_messages(self, messages: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Send Many Emails Over a Single SMTP Session per Server
+
+        Parameters
+        ----------
+        messages: List[Dict[str, Any]]
+            Keyword arguments for each `send_message` call
+
+        Returns
+        -------
+        List[Any]
+        """
+        emails: Dict[SMTPClient, List[EmailMessage]] = {}
+        for message_kwargs in messages:
+            client = self._get_client(**message_kwargs)
+            emails.setdefault(client, []).append(self._build_email(**message_kwargs))
+        for client, client_emails in emails.items():
+            client.send(client_emails)
+        return [None] * len(messages)
+
+    def close(self) -> None:
+        """
+        Close the SMTP Connection
+        """
+        super().close()
+        self._get_client().close()
 
     def send_campsites(self, campsites: List[AvailableCampsite], **kwargs) -> None:
         """
@@ -4,35 +4,31 @@ Default Notifier: Silent + Extras
 
 import datetime
 import logging
-from typing import Dict, List, Type, Union
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Type, Union
 
 from camply.containers import AvailableCampsite
-from camply.notifications.apprise import AppriseNotifications
 from camply.notifications.base_notifications import BaseNotifications, NotificationError
-from camply.notifications.email_notifications import EmailNotifications
-from camply.notifications.ntfy import NtfyNotifications
-from camply.notifications.pushbullet import PushbulletNotifications
-from camply.notifications.pushover import PushoverNotifications
 from camply.notifications.silent_notifications import SilentNotifications
-from camply.notifications.slack import SlackNotifications
-from camply.notifications.telegram import TelegramNotifications
-from camply.notifications.twilio import TwilioNotifications
-from camply.notifications.webhook import WebhookNotifications
+from camply.utils.lazy_imports import LazyRegistry
 
 logger = logging.getLogger(__name__)
 
-CAMPSITE_NOTIFICATIONS: Dict[str, Type[BaseNotifications]] = {
-    "pushover": PushoverNotifications,
-    "email": EmailNotifications,
-    "ntfy": NtfyNotifications,
-    "apprise": AppriseNotifications,
-    "pushbullet": PushbulletNotifications,
-    "slack": SlackNotifications,
-    "telegram": TelegramNotifications,
-    "twilio": TwilioNotifications,
-    "webhook": WebhookNotifications,
-    "silent": SilentNotifications,
-}
+# Notifier modules (and their clients) are only imported once they're used
+CAMPSITE_NOTIFICATIONS: LazyRegistry[Type[BaseNotifications]] = LazyRegistry(
+    {
+        "pushover": "camply.notifications.pushover:PushoverNotifications",
+        "email": "camply.notifications.email_notifications:EmailNotifications",
+        "ntfy": "camply.notifications.ntfy:NtfyNotifications",
+        "apprise": "camply.notifications.apprise:AppriseNotifications",
+        "pushbullet": "camply.notifications.pushbullet:PushbulletNotifications",
+        "slack": "camply.notifications.slack:SlackNotifications",
+        "telegram": "camply.notifications.telegram:TelegramNotifications",
+        "twilio": "camply.notifications.twilio:TwilioNotifications",
+        "webhook": "camply.notifications.webhook:WebhookNotifications",
+        "silent": "camply.notifications.silent_notifications:SilentNotifications",
+    }
+)
 
 
 class MultiNotifierProvider(BaseNotifications):
@@ -40,6 +36,9 @@ class MultiNotifierProvider(BaseNotifications):
     Notifications Supported from Multiple Providers
     """
 
+    # Seconds to wait on the slowest provider before moving on
+    provider_timeout: float = 60.0
+
     def __init__(self, provider: Union[str, List[str], BaseNotifications, None]):
         """
         Initialize with a Notifier Class Object, a string or list of strings
@@ -79,8 +78,10 @@ class MultiNotifierProvider(BaseNotifications):
         **kwargs
             All kwargs passed to underlying notification method
         """
-        for provider in self.providers:
-            provider.send_message(message=message, **kwargs)
+        self._fan_out(
+            lambda provider: provider.send_message(message=message, **kwargs),
+            providers=self.providers,
+        )
 
     def send_campsites(self, campsites: List[AvailableCampsite], **kwargs):
         """
@@ -90,8 +91,81 @@ class MultiNotifierProvider(BaseNotifications):
         ----------
         campsites: List[AvailableCampsite]
         """
+        with self.cache_formatted_campsites(campsites=campsites):
+            self._fan_out(
+                lambda provider: provider.send_campsites(campsites=campsites, **kwargs),
+                providers=self.providers,
+            )
+
+    def _fan_out(
+        self,
+        send: Callable[[BaseNotifications], Any],
+        providers: List[BaseNotifications],
+        raise_errors: bool = True,
+    ) -> None:
+        """
+        Send to All Providers Concurrently
+
+        Each provider runs in its own thread so a slow or failing provider
+        doesn't hold up the others. Providers still running after
+        `provider_timeout` seconds are logged and left to finish in the
+        background. Errors are logged per provider and only raised when
+        every notification provider has failed.
+
+        Parameters
+        ----------
+        send: Callable[[BaseNotifications], Any]
+            Function sending to a single provider
+        providers: List[BaseNotifications]
+        raise_errors: bool
+            Whether to raise a NotificationError when all providers fail
+
+        Raises
+        ------
+        NotificationError
+        """
+        if len(providers) == 0:
+            return
+        executor = ThreadPoolExecutor(
+            max_workers=len(providers), thread_name_prefix="camply-notify"
+        )
+        futures = {executor.submit(send, provider): provider for provider in providers}
+        done, not_done = wait(futures, timeout=self.provider_timeout)
+        executor.shutdown(wait=False)
+        errors: List[Exception] = []
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                logger.error(
+                    f"Notifications failed via {futures[future]}: "
+                    f"({error.__class__.__name__}) {error}"
+                )
+                errors.append(error)
+        for future in not_done:
+            logger.warning(
+                f"Notifications via {futures[future]} are taking longer than "
+                f"{self.provider_timeout} seconds, continuing without them."
+            )
+        notifiers = [
+            provider
+            for provider in providers
+            if not isinstance(provider, SilentNotifications)
+        ]
+        if (
+            raise_errors is True
+            and len(notifiers) > 0
+            and len(errors) == len(notifiers)
+        ):
+            raise NotificationError(
+                f"Notifications failed via all providers: {errors[0]}"
+            ) from errors[0]
+
+    def close(self) -> None:
+        """
+        Close All Providers
+        """
         for provider in self.providers:
-            provider.send_campsites(campsites=campsites, **kwargs)
+            provider.close()
 
     def log_providers(self) -> None:
         """
@@ -124,7 +198,11 @@ class MultiNotifierProvider(BaseNotifications):
             "camply encountered an error and exited 😟 "
             f"[{date_string}] - ({error.__class__.__name__}) {error_string}"
         )
-        for provider in self.providers:
-            if provider.last_gasp is True:
-                provider.send_message(error_message)
+        self._fan_out(
+            lambda provider: provider.send_message(error_message),
+            providers=[
+                provider for provider in self.providers if provider.last_gasp is True
+            ],
+            raise_errors=False,
+        )
         raise RuntimeError(error_message) from error
@@ -19,6 +19,12 @@ class NtfyNotifications(BaseNotifications):
     Push Notifications via Ntfy
     """
 
+    max_concurrent_messages: int = 4
+    rate_limit_calls: int = 5
+
+    # ntfy messages are limited to 4096 bytes
+    max_message_length: int = 4096
+
     def __init__(self):
         super().__init__()
         if any([NtfyConfig.NTFY_TOPIC is None, NtfyConfig.NTFY_TOPIC == ""]):
@@ -59,6 +65,20 @@ class NtfyNotifications(BaseNotifications):
             raise ConnectionError(response.text) from he
         return response
 
+    def measure_message(self, message: str) -> int:
+        """
+        Size of a Message in Bytes, as ntfy Limits it
+
+        Parameters
+        ----------
+        message: str
+
+        Returns
+        -------
+        int
+        """
+        return len(message.encode("utf-8"))
+
     def send_campsites(self, campsites: List[AvailableCampsite], **kwargs):
         """
         Send a message with a campsite object
@@ -67,6 +87,10 @@ class NtfyNotifications(BaseNotifications):
         ----------
         campsites: AvailableCampsite
         """
+        if self.digest is True:
+            self.send_digest(campsites=campsites, title="camply: Campsites Found")
+            return
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -75,8 +99,11 @@ class NtfyNotifications(BaseNotifications):
             for key, value in formatted_dict.items():
                 fields.append(f"{key}: {value}")
             composed_message = "\n".join(fields)
-            self.send_message(
-                message=composed_message,
-                title=message_title,
-                url=formatted_dict.get("Booking Link", ""),
+            messages.append(
+                {
+                    "message": composed_message,
+                    "title": message_title,
+                    "url": formatted_dict.get("Booking Link", ""),
+                }
             )
+        self.send_messages(messages)
@@ -0,0 +1,395 @@
+"""
+Persistent Notification Outbox
+"""
+
+import hashlib
+import json
+import logging
+import pathlib
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, Union
+
+from camply.config.notification_config import OutboxConfig
+from camply.config.search_config import SearchConfig
+from camply.containers import AvailableCampsite
+from camply.notifications.base_notifications import BaseNotifications
+from camply.notifications.multi_provider_notifications import MultiNotifierProvider
+from camply.notifications.silent_notifications import SilentNotifications
+from camply.utils.concurrency_utils import run_concurrently
+
+logger = logging.getLogger(__name__)
+
+_CAMPSITE = "campsite"
+_MESSAGE = "message"
+
+_PENDING = "pending"
+_SENT = "sent"
+_FAILED = "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    provider TEXT NOT NULL,
+    idempotency_key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    created_at REAL NOT NULL,
+    last_error TEXT,
+    UNIQUE (provider, idempotency_key)
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+"""
+
+
+class NotificationOutbox(MultiNotifierProvider):
+    """
+    Notifications Queued in SQLite and Delivered in the Background
+
+    Sending only writes to the outbox, a dispatcher thread delivers each
+    queued notification and retries failures with exponential backoff.
+    Every campsite gets an idempotency key per provider so the same campsite
+    is never delivered twice, even across restarts. The silent provider is
+    still called inline so found campsites are logged as they're found.
+    """
+
+    def __init__(
+        self,
+        provider: Union[str, List[str], BaseNotifications, None],
+        path: Union[str, pathlib.Path],
+    ):
+        """
+        Initialize with Providers and an Outbox File
+
+        Parameters
+        ----------
+        provider: Union[str, List[str], BaseNotifications, None]
+            Provider String, Comma Separated Provider String, or list of provider
+            strings
+        path: Union[str, pathlib.Path]
+            SQLite file the outbox is stored in
+        """
+        super().__init__(provider=provider)
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(_SCHEMA)
+        self._purge_delivered()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._dispatcher = threading.Thread(
+            target=self._run_dispatcher, name="camply-outbox", daemon=True
+        )
+        self._dispatcher.start()
+
+    @property
+    def _queued_providers(self) -> Dict[str, BaseNotifications]:
+        """
+        Providers Delivered Through the Outbox, by Name
+        """
+        return {
+            str(provider): provider
+            for provider in self.providers
+            if not isinstance(provider, SilentNotifications)
+        }
+
+    @classmethod
+    def idempotency_key(cls, campsite: AvailableCampsite) -> str:
+        """
+        Stable Key Identifying a Campsite Availability
+
+        Parameters
+        ----------
+        campsite: AvailableCampsite
+
+        Returns
+        -------
+        str
+        """
+        identity = "|".join(
+            str(value)
+            for value in (
+                campsite.recreation_area_id,
+                campsite.facility_id,
+                campsite.campsite_id,
+                campsite.booking_date.isoformat(),
+                campsite.booking_end_date.isoformat(),
+            )
+        )
+        return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+    def send_message(self, message: str, **kwargs):
+        """
+        Queue a message
+
+        Parameters
+        ----------
+        message: str
+            Message Text
+        **kwargs
+            All kwargs passed to underlying notification method
+        """
+        self._send_silent(lambda provider: provider.send_message(message, **kwargs))
+        payload = json.dumps({"message": message, **kwargs})
+        self._enqueue([(_MESSAGE, uuid.uuid4().hex, payload)])
+
+    def send_campsites(self, campsites: List[AvailableCampsite], **kwargs):
+        """
+        Queue a message with a campsite object
+
+        Parameters
+        ----------
+        campsites: List[AvailableCampsite]
+        """
+        self._send_silent(
+            lambda provider: provider.send_campsites(campsites=campsites, **kwargs)
+        )
+        self._enqueue(
+            [
+                (_CAMPSITE, self.idempotency_key(campsite), campsite.json())
+                for campsite in campsites
+            ]
+        )
+
+    def _send_silent(self, send) -> None:
+        """
+        Call the Silent Providers Inline
+        """
+        for provider in self.providers:
+            if isinstance(provider, SilentNotifications):
+                send(provider)
+
+    def _enqueue(self, items: List[Tuple[str, str, str]]) -> None:
+        """
+        Write Notifications to the Outbox for Every Queued Provider
+
+        Parameters
+        ----------
+        items: List[Tuple[str, str, str]]
+            (kind, idempotency key, payload) for each notification
+        """
+        now = time.time()
+        rows = [
+            (provider_name, key, kind, payload, now, now)
+            for provider_name in self._queued_providers
+            for kind, key, payload in items
+        ]
+        if len(rows) == 0:
+            return
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO outbox "
+                "(provider, idempotency_key, kind, payload, next_attempt_at, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        self._wakeup.set()
+
+    def pending_count(self) -> int:
+        """
+        Number of Notifications Waiting to be Delivered
+
+        Returns
+        -------
+        int
+        """
+        if len(self._queued_providers) == 0:
+            return 0
+        with self._lock:
+            (count,) = self._connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE status = ? AND provider IN "
+                f"({', '.join('?' for _ in self._queued_providers)})",
+                (_PENDING, *self._queued_providers),
+            ).fetchone()
+        return count
+
+    def dispatch(self) -> int:
+        """
+        Deliver Every Notification That is Due
+
+        Each provider's notifications are delivered in the order they were
+        queued, providers are delivered to concurrently.
+
+        Returns
+        -------
+        int
+            Number of notifications delivered
+        """
+        providers = self._queued_providers
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT id, provider, kind, payload, attempts FROM outbox "
+                "WHERE status = ? AND next_attempt_at <= ? ORDER BY id",
+                (_PENDING, time.time()),
+            ).fetchall()
+        due: Dict[str, List[tuple]] = defaultdict(list)
+        for row in rows:
+            if row[1] in providers:
+                due[row[1]].append(row)
+        delivered = run_concurrently(
+            lambda provider_name: self._deliver(
+                provider=providers[provider_name], rows=due[provider_name]
+            ),
+            list(due),
+            max_workers=len(due),
+        )
+        return sum(delivered)
+
+    def _deliver(self, provider: BaseNotifications, rows: List[tuple]) -> int:
+        """
+        Deliver a Provider's Notifications, Batching Consecutive Campsites
+
+        Batches hold at most `SearchConfig.MAXIMUM_NOTIFICATION_BATCH_SIZE`
+        campsites and each one is marked as sent as soon as it's delivered, so
+        a failure only retries the batch that failed.
+
+        Parameters
+        ----------
+        provider: BaseNotifications
+        rows: List[tuple]
+
+        Returns
+        -------
+        int
+            Number of notifications delivered
+        """
+        delivered = 0
+        batches: List[List[tuple]] = []
+        for row in rows:
+            if (
+                row[2] == _CAMPSITE
+                and batches
+                and batches[-1][0][2] == _CAMPSITE
+                and len(batches[-1]) < SearchConfig.MAXIMUM_NOTIFICATION_BATCH_SIZE
+            ):
+                batches[-1].append(row)
+            else:
+                batches.append([row])
+        for batch in batches:
+            try:
+                if batch[0][2] == _CAMPSITE:
+                    provider.send_campsites(
+                        campsites=[AvailableCampsite.parse_raw(row[3]) for row in batch]
+                    )
+                else:
+                    provider.send_message(**json.loads(batch[0][3]))
+            except Exception as e:
+                self._record_failure(provider=provider, rows=batch, error=e)
+            else:
+                with self._lock:
+                    self._connection.executemany(
+                        "UPDATE outbox SET status = ?, attempts = attempts + 1 "
+                        "WHERE id = ?",
+                        [(_SENT, row[0]) for row in batch],
+                    )
+                delivered += len(batch)
+        return delivered
+
+    def _record_failure(
+        self, provider: BaseNotifications, rows: List[tuple], error: Exception
+    ) -> None:
+        """
+        Schedule a Retry with Backoff, or Give Up After Too Many Attempts
+        """
+        attempts = rows[0][4] + 1
+        error_string = f"({error.__class__.__name__}) {error}"
+        if attempts >= OutboxConfig.MAX_ATTEMPTS:
+            logger.error(
+                f"Giving up on {len(rows)} notification(s) via {provider} "
+                f"after {attempts} attempts: {error_string}"
+            )
+            status, next_attempt_at = _FAILED, time.time()
+        else:
+            backoff = min(
+                OutboxConfig.BACKOFF_BASE * 2 ** (attempts - 1),
+                OutboxConfig.BACKOFF_MAX,
+            )
+            backoff *= 1 + random.random() / 10
+            logger.warning(
+                f"Notifications via {provider} failed, retrying in "
+                f"{backoff:.0f} seconds: {error_string}"
+            )
+            status, next_attempt_at = _PENDING, time.time() + backoff
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE outbox SET status = ?, attempts = ?, next_attempt_at = ?, "
+                "last_error = ? WHERE id = ?",
+                [
+                    (status, attempts, next_attempt_at, error_string, row[0])
+                    for row in rows
+                ],
+            )
+
+    def _purge_delivered(self) -> None:
+        """
+        Remove Delivered Notifications Past the Retention Period
+        """
+        cutoff = time.time() - OutboxConfig.RETENTION_DAYS * 24 * 60 * 60
+        with self._lock:
+            self._connection.execute(
+                "DELETE FROM outbox WHERE status != ? AND created_at < ?",
+                (_PENDING, cutoff),
+            )
+
+    def _run_dispatcher(self) -> None:
+        """
+        Dispatcher Thread: Deliver Due Notifications Until Stopped
+        """
+        while not self._stopped.is_set():
+            self._wakeup.wait(timeout=OutboxConfig.POLL_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.dispatch()
+            except Exception as e:
+                logger.exception(f"Notification outbox dispatch failed: {e}")
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Keep Delivering Until the Outbox is Empty or the Timeout Passes
+
+        Notifications still pending are kept in the outbox and delivered
+        the next time it's opened.
+
+        Parameters
+        ----------
+        timeout: Optional[float]
+            Seconds to wait, defaults to `OutboxConfig.DRAIN_TIMEOUT`
+        """
+        if self._stopped.is_set():
+            return
+        timeout = OutboxConfig.DRAIN_TIMEOUT if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        while self.pending_count() > 0 and time.monotonic() < deadline:
+            self._wakeup.set()
+            time.sleep(min(OutboxConfig.POLL_INTERVAL, 0.1))
+        self._stopped.set()
+        self._wakeup.set()
+        self._dispatcher.join(timeout=max(deadline - time.monotonic(), 0) + 1)
+        remaining = self.pending_count()
+        if remaining > 0:
+            logger.warning(
+                f"{remaining} notification(s) still queued in {self.path}, "
+                "they'll be delivered on the next run."
+            )
+        super().close()
+
+    def last_gasp(self, error: Exception) -> None:
+        """
+        Deliver What's Queued, Then Make the `last gasp` Notification
+
+        Returns
+        -------
+        None
+        """
+        self.close()
+        super().last_gasp(error=error)
@@ -19,6 +19,9 @@ class PushbulletNotifications(BaseNotifications):
     Push Notifications via PushBullet
     """
 
+    max_concurrent_messages: int = 4
+    rate_limit_calls: int = 5
+
     def __init__(self):
         super().__init__()
         pushbullet_headers = PushbulletConfig.API_HEADERS.copy()
@@ -73,6 +76,7 @@ class PushbulletNotifications(BaseNotifications):
         ----------
         campsites: AvailableCampsite
         """
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -81,6 +85,7 @@ class PushbulletNotifications(BaseNotifications):
             for key, value in formatted_dict.items():
                 fields.append(f"{key}: {value}")
             composed_message = "\n".join(fields)
-            self.send_message(
-                message=composed_message, title=message_title, type="note"
+            messages.append(
+                {"message": composed_message, "title": message_title, "type": "note"}
             )
+        self.send_messages(messages)
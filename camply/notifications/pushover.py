@@ -20,6 +20,12 @@ class PushoverNotifications(BaseNotifications, logging.StreamHandler):
     Push Notifications via Pushover + a Logging Handler
     """
 
+    max_concurrent_messages: int = 4
+    rate_limit_calls: int = 5
+
+    # Pushover messages are limited to 1024 characters
+    max_message_length: int = 1024
+
     def __init__(self, level: Optional[int] = logging.INFO):
         super().__init__()
         self.session.headers.update(PushoverConfig.API_HEADERS)
@@ -86,6 +92,13 @@ class PushoverNotifications(BaseNotifications, logging.StreamHandler):
         title = f"Pushover {record.levelname.title()} Message"
         self.send_message(message=log_formatted_message, title=title)
 
+    def close(self) -> None:
+        """
+        Close the Session and the Logging Handler
+        """
+        BaseNotifications.close(self)
+        logging.StreamHandler.close(self)
+
     def send_campsites(self, campsites: List[AvailableCampsite], **kwargs):
         """
         Send a message with a campsite object
@@ -94,6 +107,10 @@ class PushoverNotifications(BaseNotifications, logging.StreamHandler):
         ----------
         campsites: AvailableCampsite
         """
+        if self.digest is True:
+            self.send_digest(campsites=campsites, title="camply: Campsites Found")
+            return
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -104,4 +121,7 @@ class PushoverNotifications(BaseNotifications, logging.StreamHandler):
                     value = f"<a href='{value}'>{value}</a>"
                 fields.append(f"<b>{key}:</b> {value}")
             composed_message = "\n".join(fields)
-            self.send_message(message=composed_message, title=message_title, html=1)
+            messages.append(
+                {"message": composed_message, "title": message_title, "html": 1}
+            )
+        self.send_messages(messages)
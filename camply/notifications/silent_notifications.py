@@ -56,5 +56,6 @@ class SilentNotifications(BaseNotifications):
             )
             message_string = "\n\t• " + "\n\t• ".join(campsite_tuple)
             self.send_message(message_string)
-            campsite_formatted = pformat(campsite.dict())
-            logger.debug("Campsite Info: " + campsite_formatted)
+            if logger.isEnabledFor(logging.DEBUG):
+                campsite_formatted = pformat(campsite.dict())
+                logger.debug("Campsite Info: " + campsite_formatted)
@@ -19,6 +19,10 @@ class SlackNotifications(BaseNotifications):
     Push Notifications via Slack
     """
 
+    # Slack webhooks allow one message per second
+    max_concurrent_messages: int = 1
+    rate_limit_calls: int = 1
+
     def __init__(self):
         super().__init__()
         self.session.headers.update({"Content-Type": "application/json"})
@@ -74,6 +78,7 @@ class SlackNotifications(BaseNotifications):
         ----------
         campsites: AvailableCampsite
         """
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -116,7 +121,5 @@ class SlackNotifications(BaseNotifications):
                         "fields": fields[chunk:chunk_max],
                     }
                 )
-            self.send_message(
-                message=message_title,
-                blocks=blocks,
-            )
+            messages.append({"message": message_title, "blocks": blocks})
+        self.send_messages(messages)
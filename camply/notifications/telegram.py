@@ -3,7 +3,7 @@ Push Notifications via Telegram
 """
 
 import logging
-from typing import List
+from typing import Dict, List
 
 import requests
 
@@ -19,6 +19,17 @@ class TelegramNotifications(BaseNotifications):
     Push Notifications via Telegram
     """
 
+    # Telegram allows about one message per second to a chat
+    max_concurrent_messages: int = 1
+    rate_limit_calls: int = 1
+
+    # Telegram messages are limited to 4096 characters
+    max_message_length: int = 4096
+    # MarkdownV2 reserved characters, escaped in a single pass
+    escape_table: Dict[int, str] = str.maketrans(
+        {character: f"\\{character}" for character in "_*[]()~`>#+-=|{}.!"}
+    )
+
     def __init__(self):
         super().__init__()
         self.session.headers.update(TelegramConfig.API_HEADERS)
@@ -67,6 +78,20 @@ class TelegramNotifications(BaseNotifications):
             raise ConnectionError(response.text) from he
         return response
 
+    def measure_message(self, message: str) -> int:
+        """
+        Length of a Message Once Escaped for Telegram
+
+        Parameters
+        ----------
+        message: str
+
+        Returns
+        -------
+        int
+        """
+        return len(self.escape_text(message))
+
     @staticmethod
     def escape_text(message: str) -> str:
         """
@@ -80,29 +105,7 @@ class TelegramNotifications(BaseNotifications):
         -------
         String
         """
-        fields = [
-            "_",
-            "*",
-            "[",
-            "]",
-            "(",
-            ")",
-            "~",
-            "`",
-            ">",
-            "#",
-            "+",
-            "-",
-            "=",
-            "|",
-            "{",
-            "}",
-            ".",
-            "!",
-        ]
-        for f in fields:
-            message = message.replace(f, f"\\{f}")
-        return message
+        return message.translate(TelegramNotifications.escape_table)
 
     def send_campsites(self, campsites: List[AvailableCampsite], **kwargs):
         """
@@ -112,6 +115,10 @@ class TelegramNotifications(BaseNotifications):
         ----------
         campsites: AvailableCampsite
         """
+        if self.digest is True:
+            self.send_digest(campsites=campsites)
+            return
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -121,4 +128,5 @@ class TelegramNotifications(BaseNotifications):
                 fields.append(self.escape_text(f"{key}: {value}"))
             message_fields = "\n".join(fields)
             message = f"*{self.escape_text(message_title)}*\n{message_fields}"
-            self.send_message(message, escaped=True)
+            messages.append({"message": message, "escaped": True})
+        self.send_messages(messages)
@@ -18,6 +18,13 @@ class TwilioNotifications(BaseNotifications):
     Push Notifications via Twilio
     """
 
+    # Twilio long codes send about one message per second
+    max_concurrent_messages: int = 4
+    rate_limit_calls: int = 1
+
+    # Twilio message bodies are limited to 1600 characters
+    max_message_length: int = 1600
+
     def __init__(self):
         super().__init__()
         try:
@@ -69,6 +76,10 @@ class TwilioNotifications(BaseNotifications):
         ----------
         campsites: AvailableCampsite
         """
+        if self.digest is True:
+            self.send_digest(campsites=campsites)
+            return
+        messages = []
         for campsite in campsites:
             message_title, formatted_dict = self.format_standard_campsites(
                 campsite=campsite,
@@ -79,4 +90,5 @@ class TwilioNotifications(BaseNotifications):
             fields.append("")
             fields.append("camply, the campsite finder ⛺️")
             composed_message = "\n".join(fields)
-            self.send_message(message=composed_message)
+            messages.append({"message": composed_message})
+        self.send_messages(messages)
@@ -2,22 +2,40 @@
 Generic Webhook Notifications
 """
 
+import datetime
+import gzip
+import json
 import logging
-from typing import List
+import zlib
+from typing import Dict, Iterator, List, Union
 
 import requests
+import tenacity
+from requests.adapters import HTTPAdapter
 
 from camply.config.notification_config import WebhookConfig
 from camply.containers import AvailableCampsite
-from camply.containers.data_containers import WebhookBody
 from camply.notifications.base_notifications import BaseNotifications
+from camply.utils.instrumentation import count_retry
 
 logger = logging.getLogger(__name__)
 
 
+class WebhookRetryError(ConnectionError):
+    """
+    Webhook Request Failed in a Way Worth Retrying
+    """
+
+
 class WebhookNotifications(BaseNotifications):
     """
     Push Notifications via Webhooks
+
+    Campsites are sent in batches of at most `WEBHOOK_MAX_BATCH_SIZE` over a
+    keep-alive connection, either as a single JSON document per batch
+    (matching `WebhookBody`) or streamed as newline delimited JSON, one
+    campsite per line. Bodies can be gzip compressed and failed requests are
+    retried with jittered exponential backoff.
     """
 
     last_gasp: bool = False
@@ -25,9 +43,19 @@ class WebhookNotifications(BaseNotifications):
     def __init__(self):
         super().__init__()
         self.webhook_url = WebhookConfig.WEBHOOK_URL
-        self.webhook_headers = WebhookConfig.DEFAULT_HEADERS
-        self.webhook_headers.update(WebhookConfig.WEBHOOK_HEADERS)
-        self.session.headers = self.webhook_headers
+        self.webhook_headers: Dict[str, str] = {
+            **WebhookConfig.DEFAULT_HEADERS,
+            **WebhookConfig.WEBHOOK_HEADERS,
+        }
+        self.webhook_format = WebhookConfig.WEBHOOK_FORMAT
+        self.gzip = WebhookConfig.WEBHOOK_GZIP
+        self.max_batch_size = max(WebhookConfig.WEBHOOK_MAX_BATCH_SIZE, 1)
+        self.session.headers.update(self.webhook_headers)
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=WebhookConfig.POOL_MAXSIZE
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         if self.webhook_url is None:
             warning_message = (
                 "Webhook notifications are not configured properly. "
@@ -38,6 +66,11 @@ class WebhookNotifications(BaseNotifications):
             )
             logger.error(warning_message)
             raise EnvironmentError(warning_message)
+        if self.webhook_format not in ["json", "ndjson"]:
+            raise EnvironmentError(
+                f"Unsupported `WEBHOOK_FORMAT`: {self.webhook_format}, "
+                "use `json` or `ndjson`."
+            )
 
     def send_message(self, message: str, **kwargs) -> None:
         """
@@ -45,16 +78,87 @@ class WebhookNotifications(BaseNotifications):
         """
         pass
 
-    def send_campsites(self, campsites: List[AvailableCampsite], **kwargs) -> None:
+    @classmethod
+    def _json_body(
+        cls, campsites: List[AvailableCampsite], timestamp: datetime.datetime
+    ) -> bytes:
         """
-        Send a message with a campsite object
+        Serialize a Batch the Same Way as `WebhookBody.json()`
 
-        Parameters
-        ----------
-        campsites: List[AvailableCampsite]
+        Each campsite is already validated, so they're serialized directly
+        instead of being validated again inside a `WebhookBody`.
+        """
+        campsite_json = ", ".join(campsite.json() for campsite in campsites)
+        body = (
+            f'{{"campsites": [{campsite_json}], '
+            f'"timestamp": {json.dumps(timestamp.isoformat())}}}'
+        )
+        return body.encode("utf-8")
+
+    @classmethod
+    def _ndjson_lines(cls, campsites: List[AvailableCampsite]) -> Iterator[bytes]:
+        """
+        Serialize a Batch as Newline Delimited JSON, One Campsite per Line
         """
-        webhook_body = WebhookBody(campsites=campsites).json().encode("utf-8")
-        response = self.session.post(url=self.webhook_url, data=webhook_body)
+        for campsite in campsites:
+            yield campsite.json().encode("utf-8") + b"\n"
+
+    @classmethod
+    def _gzip_stream(cls, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """
+        Gzip Compress a Stream of Chunks
+        """
+        compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    def _build_request(
+        self, campsites: List[AvailableCampsite], timestamp: datetime.datetime
+    ) -> Dict[str, Union[bytes, Iterator[bytes], Dict[str, str]]]:
+        """
+        Build the Body and Headers for a Batch
+        """
+        headers = {}
+        data: Union[bytes, Iterator[bytes]]
+        if self.webhook_format == "ndjson":
+            headers["Content-Type"] = WebhookConfig.NDJSON_CONTENT_TYPE
+            data = self._ndjson_lines(campsites)
+            if self.gzip is True:
+                data = self._gzip_stream(data)
+        else:
+            data = self._json_body(campsites=campsites, timestamp=timestamp)
+            if self.gzip is True:
+                data = gzip.compress(data)
+        if self.gzip is True:
+            headers["Content-Encoding"] = "gzip"
+        return {"data": data, "headers": headers}
+
+    def _post_batch(
+        self, campsites: List[AvailableCampsite], timestamp: datetime.datetime
+    ) -> requests.Response:
+        """
+        POST a Single Batch
+
+        Raises
+        ------
+        WebhookRetryError
+            On connection errors and retryable status codes
+        ConnectionError
+            On any other unsuccessful status code
+        """
+        try:
+            response = self.session.post(
+                url=self.webhook_url,
+                timeout=WebhookConfig.REQUEST_TIMEOUT,
+                **self._build_request(campsites=campsites, timestamp=timestamp),
+            )
+        except (requests.ConnectionError, requests.Timeout) as e:
+            raise WebhookRetryError(str(e)) from e
+        if response.status_code in WebhookConfig.RETRY_STATUS_CODES:
+            raise WebhookRetryError(f"{response.status_code}: {response.text}")
         try:
             response.raise_for_status()
         except requests.HTTPError as he:
@@ -63,3 +167,35 @@ class WebhookNotifications(BaseNotifications):
                 "Your configuration might be incorrect."
             )
             raise ConnectionError(response.text) from he
+        return response
+
+    def send_campsites(self, campsites: List[AvailableCampsite], **kwargs) -> None:
+        """
+        Send a message with a campsite object
+
+        Parameters
+        ----------
+        campsites: List[AvailableCampsite]
+        """
+        if len(campsites) == 0:
+            return
+        timestamp = datetime.datetime.now(tz=datetime.timezone.utc)
+        retryer = tenacity.Retrying(
+            wait=tenacity.wait_random_exponential(
+                multiplier=0.5, max=WebhookConfig.RETRY_MAX_WAIT
+            ),
+            stop=tenacity.stop_after_attempt(WebhookConfig.RETRY_MAX_ATTEMPTS),
+            retry=tenacity.retry_if_exception_type(WebhookRetryError),
+            before_sleep=count_retry,
+            reraise=True,
+        )
+        for start in range(0, len(campsites), self.max_batch_size):
+            batch = campsites[start : start + self.max_batch_size]
+            try:
+                retryer(self._post_batch, campsites=batch, timestamp=timestamp)
+            except WebhookRetryError as we:
+                logger.warning(
+                    f"Notifications weren't able to be sent to {self.webhook_url} "
+                    f"after {WebhookConfig.RETRY_MAX_ATTEMPTS} attempts."
+                )
+                raise ConnectionError(str(we)) from we
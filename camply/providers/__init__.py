@@ -1,55 +1,66 @@
 """
 providers __init__ file
+
+Providers are imported the first time they're accessed, importing
+`camply.providers` on its own doesn't import any provider modules.
 """
 
-from typing import Union
+from typing import TYPE_CHECKING, Dict
 
-from .base_provider import BaseProvider
-from .going_to_camp.going_to_camp_provider import GoingToCamp
-from .recreation_dot_gov.recdotgov_camps import RecreationDotGov
-from .recreation_dot_gov.recdotgov_tours import (
-    RecreationDotGovDailyTicket,
-    RecreationDotGovDailyTimedEntry,
-    RecreationDotGovTicket,
-    RecreationDotGovTimedEntry,
-)
-from .usedirect.variations import (
-    AlabamaStateParks,
-    ArizonaStateParks,
-    FairfaxCountyParks,
-    FloridaStateParks,
-    MaricopaCountyParks,
-    MinnesotaStateParks,
-    MissouriStateParks,
-    NorthernTerritory,
-    OhioStateParks,
-    OregonMetro,
-    ReserveCalifornia,
-    VirginiaStateParks,
-)
-from .xanterra.yellowstone_lodging import Yellowstone
+from camply.utils.lazy_imports import lazy_module_attributes
 
-ProviderType = Union[
-    GoingToCamp,
-    RecreationDotGov,
-    RecreationDotGovDailyTicket,
-    RecreationDotGovDailyTimedEntry,
-    RecreationDotGovTicket,
-    RecreationDotGovTimedEntry,
-    Yellowstone,
-    ReserveCalifornia,
-    NorthernTerritory,
-    FloridaStateParks,
-    OregonMetro,
-    OhioStateParks,
-    VirginiaStateParks,
-    ArizonaStateParks,
-    MaricopaCountyParks,
-    MissouriStateParks,
-    AlabamaStateParks,
-    FairfaxCountyParks,
-    MinnesotaStateParks,
-]
+if TYPE_CHECKING:
+    from .base_provider import BaseProvider
+    from .going_to_camp.going_to_camp_provider import GoingToCamp
+    from .provider_types import ProviderType
+    from .recreation_dot_gov.recdotgov_camps import RecreationDotGov
+    from .recreation_dot_gov.recdotgov_tours import (
+        RecreationDotGovDailyTicket,
+        RecreationDotGovDailyTimedEntry,
+        RecreationDotGovTicket,
+        RecreationDotGovTimedEntry,
+    )
+    from .usedirect.variations import (
+        AlabamaStateParks,
+        ArizonaStateParks,
+        FairfaxCountyParks,
+        FloridaStateParks,
+        MaricopaCountyParks,
+        MinnesotaStateParks,
+        MissouriStateParks,
+        NorthernTerritory,
+        OhioStateParks,
+        OregonMetro,
+        ReserveCalifornia,
+        VirginiaStateParks,
+    )
+    from .xanterra.yellowstone_lodging import Yellowstone
+
+__providers__: Dict[str, str] = {
+    "BaseProvider": "camply.providers.base_provider:BaseProvider",
+    "ProviderType": "camply.providers.provider_types:ProviderType",
+    "GoingToCamp": "camply.providers.going_to_camp.going_to_camp_provider:GoingToCamp",
+    "RecreationDotGov": "camply.providers.recreation_dot_gov.recdotgov_camps:RecreationDotGov",
+    "RecreationDotGovDailyTicket": "camply.providers.recreation_dot_gov.recdotgov_tours:RecreationDotGovDailyTicket",
+    "RecreationDotGovDailyTimedEntry": "camply.providers.recreation_dot_gov.recdotgov_tours:RecreationDotGovDailyTimedEntry",
+    "RecreationDotGovTicket": "camply.providers.recreation_dot_gov.recdotgov_tours:RecreationDotGovTicket",
+    "RecreationDotGovTimedEntry": "camply.providers.recreation_dot_gov.recdotgov_tours:RecreationDotGovTimedEntry",
+    "Yellowstone": "camply.providers.xanterra.yellowstone_lodging:Yellowstone",
+    "AlabamaStateParks": "camply.providers.usedirect.variations:AlabamaStateParks",
+    "ArizonaStateParks": "camply.providers.usedirect.variations:ArizonaStateParks",
+    "FairfaxCountyParks": "camply.providers.usedirect.variations:FairfaxCountyParks",
+    "FloridaStateParks": "camply.providers.usedirect.variations:FloridaStateParks",
+    "MaricopaCountyParks": "camply.providers.usedirect.variations:MaricopaCountyParks",
+    "MinnesotaStateParks": "camply.providers.usedirect.variations:MinnesotaStateParks",
+    "MissouriStateParks": "camply.providers.usedirect.variations:MissouriStateParks",
+    "NorthernTerritory": "camply.providers.usedirect.variations:NorthernTerritory",
+    "OhioStateParks": "camply.providers.usedirect.variations:OhioStateParks",
+    "OregonMetro": "camply.providers.usedirect.variations:OregonMetro",
+    "ReserveCalifornia": "camply.providers.usedirect.variations:ReserveCalifornia",
+    "VirginiaStateParks": "camply.providers.usedirect.variations:VirginiaStateParks",
+}
+
+__getattr__ = lazy_module_attributes(__name__, __providers__)
 
 __all__ = [
     "BaseProvider",
@@ -14,6 +14,8 @@ from fake_useragent import UserAgent
 from camply.config import SearchConfig
 from camply.config.api_config import APIConfig
 from camply.containers import CampgroundFacility
+from camply.utils.api_utils import provider_session
+from camply.utils.instrumentation import count_retry
 
 logger = logging.getLogger(__name__)
 
@@ -83,7 +85,7 @@ class BaseProvider(ABC):
         Initialize with a session
         """
         _user_agent = UserAgent(browsers=["chrome"]).random
-        self.session = requests.Session()
+        self.session = provider_session(provider=self.__class__.__name__)
         self.headers = {"User-Agent": _user_agent}
         self.session.headers = self.headers
         self.json_headers = self.headers.copy()
@@ -207,6 +209,7 @@ class BaseProvider(ABC):
                 self.RETRY_CONFIG.RETRY_MAX_API_TIMEOUT
             ),
             retry=tenacity.retry_if_exception_type(ProviderError),
+            before_sleep=count_retry,
         )
         response: requests.Response = retryer.__call__(
             fn=self.make_http_request,
@@ -4,19 +4,26 @@ Going to Camp Web Searching Utilities
 
 import json
 import logging
+import pathlib
 import sys
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from fake_useragent import UserAgent
 from pydantic import ValidationError
 
+from camply.config import FileConfig
+from camply.config.api_config import GoingToCampConfig
 from camply.containers import AvailableResource, CampgroundFacility, RecreationArea
 from camply.containers.base_container import GoingToCampEquipment
 from camply.containers.gtc_api_responses import ResourceLocation
 from camply.providers.base_provider import BaseProvider, ProviderSearchError
 from camply.providers.going_to_camp.rec_areas import RECREATION_AREAS
 from camply.utils import make_list
+from camply.utils.concurrency_utils import HostRateLimiter, run_concurrently
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -45,6 +52,32 @@ class GoingToCamp(BaseProvider):
     Going To Camp API provider
     """
 
+    __offline_cache_dir__: Optional[pathlib.Path] = None
+
+    rate_limiter: HostRateLimiter = HostRateLimiter(
+        calls=GoingToCampConfig.RATE_LIMIT_CALLS,
+        period=GoingToCampConfig.RATE_LIMIT_PERIOD,
+    )
+
+    def __init__(self) -> None:
+        """
+        Initialize with a Session and Per-Recreation Area Attribute Lookups
+        """
+        super().__init__()
+        self._attribute_details: Dict[int, Dict[str, Any]] = {}
+        self._attribute_details_lock = threading.Lock()
+        self._resource_maps: Dict[Tuple[Any, ...], Tuple[float, List[Any]]] = {}
+
+    @property
+    def offline_cache_dir(self) -> pathlib.Path:
+        """
+        Offline Cache Directory
+        """
+        if self.__offline_cache_dir__ is None:
+            return FileConfig.GOING_TO_CAMP_PROVIDER / "cache"
+        else:
+            return self.__offline_cache_dir__
+
     @classmethod
     def find_recreation_areas(
         cls, search_string: Optional[str] = None, **kwargs
@@ -145,10 +178,76 @@ class GoingToCamp(BaseProvider):
                         attribute_enum_detail, "localizedValues", 0, "displayName"
                     )
 
+    def _get_attribute_details(self, rec_area_id: int) -> Dict[str, Any]:
+        """
+        Get the Filterable Attribute Definitions for a Recreation Area
+
+        Parameters
+        ----------
+        rec_area_id: int
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        with self._attribute_details_lock:
+            if rec_area_id not in self._attribute_details:
+                self._attribute_details[rec_area_id] = self._api_request(
+                    rec_area_id, "ATTRIBUTE_DETAILS"
+                )
+        return self._attribute_details[rec_area_id]
+
+    def _site_details_file(self, rec_area_id: int, resource_id: int) -> pathlib.Path:
+        """
+        Path to the Offline Cache File for a Site
+
+        Parameters
+        ----------
+        rec_area_id: int
+        resource_id: int
+
+        Returns
+        -------
+        pathlib.Path
+        """
+        return self.offline_cache_dir.joinpath(
+            self._hostname_for(rec_area_id), "sites", f"{resource_id}.json"
+        )
+
+    @classmethod
+    def _fetch_site_details_from_disk(
+        cls, file_path: pathlib.Path, ttl: timedelta
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read Cached Site Details, Ignoring Anything Older than the TTL
+
+        Parameters
+        ----------
+        file_path: pathlib.Path
+        ttl: timedelta
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+        """
+        if file_path.exists() is False:
+            return None
+        modified_time = datetime.utcfromtimestamp(file_path.stat().st_mtime)
+        if datetime.utcnow() - modified_time > ttl:
+            return None
+        try:
+            return json.loads(file_path.read_text(encoding="utf-8"))
+        except json.JSONDecodeError:
+            logger.debug("Discarding Corrupt Site Details Cache: %s", file_path)
+            return None
+
     def get_site_details(self, rec_area_id: int, resource_id: int):
         """
         Get the details about a site in a recreation area
 
+        Site details are static, so they're cached on disk per
+        (recreation area, resource) for `GoingToCampConfig.SITE_DETAILS_TTL`.
+
         Parameters
         ----------
         rec_area_id: int
@@ -160,11 +259,13 @@ class GoingToCamp(BaseProvider):
         details: Dict[str, str]
             The details about the site
         """
-        if not hasattr(self, "_attribute_details"):
-            self._attribute_details = self._api_request(
-                rec_area_id, "ATTRIBUTE_DETAILS"
-            )
-        attribute_details = self._attribute_details
+        cache_file = self._site_details_file(rec_area_id, resource_id)
+        site_details = self._fetch_site_details_from_disk(
+            file_path=cache_file, ttl=GoingToCampConfig.SITE_DETAILS_TTL
+        )
+        if site_details is not None:
+            return site_details
+        attribute_details = self._get_attribute_details(rec_area_id)
 
         site_details = self._api_request(
             rec_area_id, "SITE_DETAILS", {"resourceId": resource_id}
@@ -191,8 +292,38 @@ class GoingToCamp(BaseProvider):
             site_attributes[attribute_name] = ",".join(attribute_values)
         site_details["site_attributes"] = site_attributes
 
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(site_details), encoding="utf-8")
         return site_details
 
+    def get_sites_details(
+        self, rec_area_id: int, resource_ids: Iterable[int]
+    ) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the details about many sites in a recreation area
+
+        Cached sites are read from disk, cache misses are fetched concurrently
+        (within the per-host rate limit).
+
+        Parameters
+        ----------
+        rec_area_id: int
+            Recreation Area ID by which to filter
+        resource_ids: Iterable[int]
+
+        Returns
+        -------
+        Dict[int, Dict[str, Any]]
+            Site details keyed by resource ID
+        """
+        unique_resource_ids = list(dict.fromkeys(resource_ids))
+        details = run_concurrently(
+            lambda resource_id: self.get_site_details(rec_area_id, resource_id),
+            unique_resource_ids,
+            max_workers=GoingToCampConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        return dict(zip(unique_resource_ids, details))
+
     def get_reservation_link(
         self,
         rec_area_domain_name,
@@ -251,6 +382,69 @@ class GoingToCamp(BaseProvider):
         Parameters
         ----------
         rec_area_id: Optional[Union[List[int], int]]
+            Recreation Area ID(s)
+        campground_id: Optional[Union[List[int], int]]
+            Campground IDs
+        search_string: Optional[str]
+            A string to search for in the facility name
+
+        Returns
+        -------
+        campgrounds: List[CampgroundFacility]
+            Array of Matching Campsites
+        """
+        campgrounds: List[CampgroundFacility] = []
+        for recreation_area_id in make_list(rec_area_id, coerce=int):
+            campgrounds += self._find_facilities_for_recreation_area(
+                rec_area_id=recreation_area_id,
+                campground_id=campground_id,
+                search_string=search_string,
+            )
+        if campground_id not in (None, [], ()):
+            self._warn_ambiguous_campgrounds(campgrounds)
+        logger.info(f"{len(campgrounds)} Matching Campgrounds Found")
+        log_sorted_response(response_array=campgrounds)
+        return campgrounds
+
+    @classmethod
+    def _warn_ambiguous_campgrounds(cls, campgrounds: List[CampgroundFacility]) -> None:
+        """
+        Warn About Campground IDs Matched in More than One Recreation Area
+
+        Campground IDs are only unique within a recreation area's host, so the
+        same ID usually refers to different campgrounds on different hosts.
+
+        Parameters
+        ----------
+        campgrounds: List[CampgroundFacility]
+        """
+        rec_areas_by_campground: Dict[int, List[int]] = defaultdict(list)
+        for campground in campgrounds:
+            rec_areas_by_campground[campground.facility_id].append(
+                campground.recreation_area_id
+            )
+        for facility_id, rec_area_ids in rec_areas_by_campground.items():
+            if len(rec_area_ids) > 1:
+                rec_area_list = ", ".join(str(rec_area) for rec_area in rec_area_ids)
+                logger.warning(
+                    f"Campground #{facility_id} matches Recreation Areas "
+                    f"{rec_area_list} - campground IDs are only unique within a "
+                    "recreation area, search one --rec-area at a time to target "
+                    "a single campground"
+                )
+
+    def _find_facilities_for_recreation_area(
+        self,
+        rec_area_id: int,
+        campground_id: Optional[Union[List[int], int]] = None,
+        search_string: Optional[str] = None,
+    ) -> List[CampgroundFacility]:
+        """
+        Find Matching Campsites within a Single Recreation Area
+
+        Parameters
+        ----------
+        rec_area_id: int
             Recreation Area ID
         campground_id: Optional[Union[List[int], int]]
             Campground IDs
@@ -262,7 +456,6 @@ class GoingToCamp(BaseProvider):
         campgrounds: List[CampgroundFacility]
             Array of Matching Campsites
         """
-        rec_area_id = make_list(rec_area_id, coerce=int)[0]
         logger.info(
             f"Retrieving Facility Information for Recreation Area ID: `{rec_area_id}`."
         )
@@ -310,8 +503,6 @@ class GoingToCamp(BaseProvider):
                 and str(campground_facility.facility_id) in campground_strings
             ):
                 campgrounds.append(campground_facility)
-        logger.info(f"{len(campgrounds)} Matching Campgrounds Found")
-        log_sorted_response(response_array=campgrounds)
         return campgrounds
 
     def _hostname_for(self, recreation_area_id: int) -> str:
@@ -338,6 +529,7 @@ class GoingToCamp(BaseProvider):
             "User-Agent": UserAgent(browsers=["chrome"]).random,
             "Accept-Language": "en-US,en;q=0.9",
         }
+        self.rate_limiter.wait(host=str(hostname))
         response = self.session.get(url=url, headers=headers, params=params, timeout=30)
         if response.ok is False:
             error_message = f"Receiving bad data from GoingToCamp API: status_code: {response.status_code}: {response.text}"
@@ -452,6 +644,53 @@ class GoingToCamp(BaseProvider):
 
         return availability_details, list(results["mapLinkAvailabilities"].keys())
 
+    def _crawl_maps(
+        self,
+        rec_area_id: int,
+        search_filter: Dict[str, Any],
+        map_ids: List[Any],
+    ) -> Dict[Any, Dict[str, Any]]:
+        """
+        Breadth-First Search of a Campground's Map Hierarchy
+
+        Each level of linked maps is requested concurrently (within the
+        per-host limits), every map is requested at most once.
+
+        Parameters
+        ----------
+        rec_area_id: int
+        search_filter: Dict[str, Any]
+            MAPDATA search filter, `mapId` is replaced for each map
+        map_ids: List[Any]
+            Maps to start from
+
+        Returns
+        -------
+        Dict[Any, Dict[str, Any]]
+            Resource availabilities keyed by map ID
+        """
+        resources: Dict[Any, Dict[str, Any]] = {}
+        visited: Set[str] = set()
+        frontier = list(map_ids)
+        while frontier:
+            level = []
+            for map_id in frontier:
+                if str(map_id) not in visited:
+                    visited.add(str(map_id))
+                    level.append(map_id)
+            results = run_concurrently(
+                lambda map_id: self._find_matching_resources(
+                    rec_area_id, {**search_filter, "mapId": map_id}
+                ),
+                level,
+                max_workers=GoingToCampConfig.MAX_CONCURRENT_REQUESTS,
+            )
+            frontier = []
+            for availability_details, linked_map_ids in results:
+                resources.update(availability_details)
+                frontier += linked_map_ids
+        return resources
+
     def list_equipment_types(self, rec_area_id: int) -> Dict[str, int]:
         """
         List equipment types available for a recreation area
@@ -485,23 +724,24 @@ class GoingToCamp(BaseProvider):
         log_sorted_response(response_array=equipment_types)
         return equipment_types
 
-    def list_site_availability(
+    def _get_resource_availabilities(
         self,
         campground: CampgroundFacility,
         start_date: datetime.date,
         end_date: datetime.date,
         equipment_type_id: Optional[str],
-    ) -> List[AvailableResource]:
+        daily_availability: bool = False,
+    ) -> Dict[Any, Dict[str, List[Dict[str, Any]]]]:
         """
-        Retrieve the Availability for all Sites in a Camp Area
+        Retrieve the Raw Resource Availabilities for a Camp Area
 
-        Sites are filtered on the provided date range and compatible
-        equipment.
+        The maps that hold sites are remembered per campground, so later
+        searches skip straight to them.
 
         Returns
         -------
-        available_sites: List[AvailableResource]
-            The list of available sites
+        Dict[Any, Dict[str, List[Dict[str, Any]]]]
+            Availabilities per resource, keyed by map ID
         """
         search_filter = {
             "mapId": campground.map_id,
@@ -510,7 +750,7 @@ class GoingToCamp(BaseProvider):
             "startDate": start_date.isoformat(),
             "endDate": end_date.isoformat(),
             "isReserving": True,
-            "getDailyAvailability": False,
+            "getDailyAvailability": daily_availability,
             "partySize": 1,
             "numEquipment": 1,
             "equipmentCategoryId": NON_GROUP_EQUIPMENT,
@@ -519,17 +759,56 @@ class GoingToCamp(BaseProvider):
         if equipment_type_id:
             search_filter["subEquipmentCategoryId"] = equipment_type_id
 
-        resources, additional_resources = self._find_matching_resources(
-            campground.recreation_area_id, search_filter
+        cache_key = (
+            campground.recreation_area_id,
+            campground.facility_id,
+            campground.map_id,
+            equipment_type_id,
         )
-
-        # Resources are often deeply nested; fetch nested resources
-        for map_id in additional_resources:
-            search_filter["mapId"] = map_id
-            avail, _ = self._find_matching_resources(
-                campground.recreation_area_id, search_filter
+        cached_maps = self._resource_maps.get(cache_key)
+        if (
+            cached_maps is not None
+            and time.monotonic() - cached_maps[0]
+            <= GoingToCampConfig.MAP_HIERARCHY_TTL.total_seconds()
+        ):
+            resources = self._crawl_maps(
+                campground.recreation_area_id, search_filter, cached_maps[1]
             )
-            resources.update(avail)
+        else:
+            resources = self._crawl_maps(
+                campground.recreation_area_id, search_filter, [campground.map_id]
+            )
+            resource_map_ids = [
+                map_id for map_id, details in resources.items() if details
+            ]
+            if resource_map_ids:
+                self._resource_maps[cache_key] = (time.monotonic(), resource_map_ids)
+        return resources
+
+    def list_site_availability(
+        self,
+        campground: CampgroundFacility,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        equipment_type_id: Optional[str],
+    ) -> List[AvailableResource]:
+        """
+        Retrieve the Availability for all Sites in a Camp Area
+
+        Sites are filtered on the provided date range and compatible
+        equipment.
+
+        Returns
+        -------
+        available_sites: List[AvailableResource]
+            The list of available sites
+        """
+        resources = self._get_resource_availabilities(
+            campground=campground,
+            start_date=start_date,
+            end_date=end_date,
+            equipment_type_id=equipment_type_id,
+        )
 
         availabilities = []
         for map_id, resource_details in resources.items():
@@ -540,6 +819,52 @@ class GoingToCamp(BaseProvider):
 
         return availabilities
 
+    def list_site_daily_availability(
+        self,
+        campground: CampgroundFacility,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        equipment_type_id: Optional[str],
+    ) -> Optional[List[Tuple[AvailableResource, List[bool]]]]:
+        """
+        Retrieve the Nightly Availability for all Sites in a Camp Area
+
+        A single request covers the whole date range, the nights can then be
+        split back into any number of windows within it.
+
+        Returns
+        -------
+        Optional[List[Tuple[AvailableResource, List[bool]]]]
+            Sites that are available at least one night, along with whether
+            they're available for each night from `start_date`. None when the
+            host doesn't return exactly one entry per night for every site.
+        """
+        resources = self._get_resource_availabilities(
+            campground=campground,
+            start_date=start_date,
+            end_date=end_date,
+            equipment_type_id=equipment_type_id,
+            daily_availability=True,
+        )
+
+        nights = (end_date - start_date).days
+        availabilities = []
+        for map_id, resource_details in resources.items():
+            for resource_id, availability_details in resource_details.items():
+                if len(availability_details) != nights:
+                    logger.warning(
+                        f"Expected {nights} nights of availability for site "
+                        f"#{resource_id} in {campground.facility_name}, "
+                        f"received {len(availability_details)}"
+                    )
+                    return None
+                nightly = [night["availability"] == 0 for night in availability_details]
+                if any(nightly):
+                    ar = AvailableResource(resource_id=resource_id, map_id=map_id)
+                    availabilities.append((ar, nightly))
+
+        return availabilities
+
 
 def _fetch_nested_key(obj: Union[dict, list, object], *keys: str) -> Any:
     """
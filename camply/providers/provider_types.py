@@ -0,0 +1,51 @@
+"""
+Union of Every camply Provider
+"""
+
+from typing import Union
+
+from camply.providers.going_to_camp.going_to_camp_provider import GoingToCamp
+from camply.providers.recreation_dot_gov.recdotgov_camps import RecreationDotGov
+from camply.providers.recreation_dot_gov.recdotgov_tours import (
+    RecreationDotGovDailyTicket,
+    RecreationDotGovDailyTimedEntry,
+    RecreationDotGovTicket,
+    RecreationDotGovTimedEntry,
+)
+from camply.providers.usedirect.variations import (
+    AlabamaStateParks,
+    ArizonaStateParks,
+    FairfaxCountyParks,
+    FloridaStateParks,
+    MaricopaCountyParks,
+    MinnesotaStateParks,
+    MissouriStateParks,
+    NorthernTerritory,
+    OhioStateParks,
+    OregonMetro,
+    ReserveCalifornia,
+    VirginiaStateParks,
+)
+from camply.providers.xanterra.yellowstone_lodging import Yellowstone
+
+ProviderType = Union[
+    GoingToCamp,
+    RecreationDotGov,
+    RecreationDotGovDailyTicket,
+    RecreationDotGovDailyTimedEntry,
+    RecreationDotGovTicket,
+    RecreationDotGovTimedEntry,
+    Yellowstone,
+    ReserveCalifornia,
+    NorthernTerritory,
+    FloridaStateParks,
+    OregonMetro,
+    OhioStateParks,
+    VirginiaStateParks,
+    ArizonaStateParks,
+    MaricopaCountyParks,
+    MissouriStateParks,
+    AlabamaStateParks,
+    FairfaxCountyParks,
+    MinnesotaStateParks,
+]
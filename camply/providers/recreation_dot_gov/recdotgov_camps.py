@@ -22,6 +22,7 @@ from camply.containers.api_responses import (
 from camply.containers.data_containers import CampsiteLocation
 from camply.providers.recreation_dot_gov.recdotgov_provider import RecreationDotGovBase
 from camply.utils import api_utils
+from camply.utils.instrumentation import traced
 
 logger = logging.getLogger(__name__)
 
@@ -153,6 +154,7 @@ class RecreationDotGov(RecreationDotGovBase):
         return equipment, attributes, location
 
     @classmethod
+    @traced()
     def process_campsite_availability(
         cls,
         availability: Dict[str, Any],
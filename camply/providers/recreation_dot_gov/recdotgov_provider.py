@@ -4,11 +4,12 @@ Recreation.gov Web Searching Utilities
 
 import json
 import logging
+import sys
 from abc import ABC, abstractmethod
 from base64 import b64decode
 from datetime import datetime
 from json import loads
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Type, Union
 from urllib import parse
 
 import pandas as pd
@@ -32,7 +33,14 @@ from camply.containers.api_responses import (
 from camply.containers.base_container import CamplyModel
 from camply.containers.data_containers import ListedCampsite
 from camply.providers.base_provider import BaseProvider, ProviderSearchError
+from camply.providers.recreation_dot_gov.ridb_catalog import RIDBCatalog
 from camply.utils import api_utils
+from camply.utils.concurrency_utils import (
+    HostRateLimiter,
+    iter_concurrently,
+    run_concurrently,
+)
+from camply.utils.instrumentation import count_retry, traced
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -43,6 +51,11 @@ class RecreationDotGovBase(BaseProvider, ABC):
     Python Class for Working with Recreation.gov API / NPS APIs
     """
 
+    ridb_rate_limiter: HostRateLimiter = HostRateLimiter(
+        calls=RIDBConfig.RATE_LIMIT_CALLS,
+        period=RIDBConfig.RATE_LIMIT_PERIOD,
+    )
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize with Search Dates
@@ -60,6 +73,10 @@ class RecreationDotGovBase(BaseProvider, ABC):
         }
         _user_agent = UserAgent(browsers=["chrome"]).random
         self._user_agent = {"User-Agent": _user_agent}
+        self._catalog: Optional[RIDBCatalog] = None
+        self._catalog_checked: bool = False
+        self._campsites: Dict[str, Union[CampsiteResponse, TourResponse]] = {}
+        self._facilities: Dict[str, dict] = {}
 
     @property
     @abstractmethod
@@ -150,12 +167,16 @@ class RecreationDotGovBase(BaseProvider, ABC):
         state_arg = kwargs.get("state", None)
         if state_arg is not None:
             kwargs.update({"state": state_arg.upper()})
-        params = dict(query=search_string, sort="Name", full="true", **kwargs)
-        if search_string is None:
-            params.pop("query")
-        api_response = self._ridb_get_paginate(
-            path=RIDBConfig.REC_AREA_API_PATH, params=params
-        )
+        catalog = self.catalog
+        if catalog is not None and set(kwargs) <= {"state"}:
+            api_response = catalog.rec_areas(query=search_string, **kwargs)
+        else:
+            params = dict(query=search_string, sort="Name", full="true", **kwargs)
+            if search_string is None:
+                params.pop("query")
+            api_response = self._ridb_get_paginate(
+                path=RIDBConfig.REC_AREA_API_PATH, params=params
+            )
         logger.info(f"{len(api_response)} recreation areas found.")
         logging_messages = []
         for recreation_area_object in api_response:
@@ -242,11 +263,21 @@ class RecreationDotGovBase(BaseProvider, ABC):
         logger.info(
             f"Retrieving Facility Information for Recreation Area ID: `{rec_area_id}`."
         )
-        api_path = f"{RIDBConfig.REC_AREA_API_PATH}/{rec_area_id}/{RIDBConfig.FACILITIES_API_PATH}"
-        api_response = self._ridb_get_paginate(
-            path=api_path, params=dict(full="true", **kwargs)
-        )
-        filtered_facilities = self._filter_facilities_responses(responses=api_response)
+        catalog = self.catalog
+        if catalog is not None and not kwargs:
+            filtered_facilities = catalog.facilities(
+                rec_area_id=rec_area_id,
+                facility_type=self.facility_type,
+                reservable=True,
+            )
+        else:
+            api_path = f"{RIDBConfig.REC_AREA_API_PATH}/{rec_area_id}/{RIDBConfig.FACILITIES_API_PATH}"
+            api_response = self._ridb_get_paginate(
+                path=api_path, params=dict(full="true", **kwargs)
+            )
+            filtered_facilities = self._filter_facilities_responses(
+                responses=api_response
+            )
         campgrounds = []
         logger.info(f"{len(filtered_facilities)} Matching Campgrounds Found")
         for facility in filtered_facilities:
@@ -273,12 +304,20 @@ class RecreationDotGovBase(BaseProvider, ABC):
         filtered_responses: List[CampgroundFacility]
             Array of Matching Campsites
         """
+        campground_ids = list(dict.fromkeys(campground_id))
+        catalog = self.catalog
+        if catalog is not None:
+            for campground_identifier in campground_ids:
+                facility_data = catalog.facility(campground_identifier)
+                if facility_data is not None:
+                    self._facilities[str(campground_identifier)] = facility_data
+        facilities_data = run_concurrently(
+            func=self.get_facility_by_id,
+            items=campground_ids,
+            max_workers=RIDBConfig.MAX_CONCURRENT_REQUESTS,
+        )
         campgrounds = []
-        for campground_identifier in campground_id:
-            facility_data = self.get_ridb_data(
-                path=f"{RIDBConfig.FACILITIES_API_PATH}/{campground_identifier}",
-                params={"full": True},
-            )
+        for facility_data in facilities_data:
             filtered_facility = self._filter_facilities_responses(
                 responses=[facility_data]
             )
@@ -305,13 +344,22 @@ class RecreationDotGovBase(BaseProvider, ABC):
         campgrounds: List[dict]
             Array of Matching Campsites
         """
-        facilities_response = self._ridb_get_paginate(
-            path=RIDBConfig.FACILITIES_API_PATH,
-            params=dict(query=search, full="true", **kwargs),
-        )
-        filtered_responses = self._filter_facilities_responses(
-            responses=facilities_response
-        )
+        catalog = self.catalog
+        if catalog is not None and set(kwargs) <= {"state", "activity"}:
+            filtered_responses = catalog.facilities(
+                query=search,
+                facility_type=self.facility_type,
+                reservable=True,
+                **kwargs,
+            )
+        else:
+            facilities_response = self._ridb_get_paginate(
+                path=RIDBConfig.FACILITIES_API_PATH,
+                params=dict(query=search, full="true", **kwargs),
+            )
+            filtered_responses = self._filter_facilities_responses(
+                responses=facilities_response
+            )
         logger.info(f"{len(filtered_responses)} Matching Campgrounds Found")
         campgrounds = []
         for facility in filtered_responses:
@@ -323,6 +371,63 @@ class RecreationDotGovBase(BaseProvider, ABC):
         log_sorted_response(response_array=campgrounds)
         return campgrounds
 
+    @property
+    def catalog(self) -> Optional[RIDBCatalog]:
+        """
+        The Local RIDB Catalog, Once Synced - Refreshed First When Stale
+
+        Facility and recreation area lookups are served from it instead of
+        the RIDB API, see `camply sync-catalog`.
+        """
+        if self._catalog_checked is False:
+            self._catalog_checked = True
+            self._catalog = RIDBCatalog.from_config()
+            if self._catalog is not None and self._catalog.is_stale():
+                try:
+                    self.refresh_catalog(catalog=self._catalog)
+                except (OSError, tenacity.RetryError) as e:
+                    logger.warning(
+                        "Couldn't refresh the local RIDB catalog, using it as is: %s",
+                        e,
+                    )
+        return self._catalog
+
+    def refresh_catalog(self, catalog: RIDBCatalog) -> int:
+        """
+        Fetch Facilities and Recreation Areas Updated Since the Last Sync
+
+        A catalog that was never synced is fetched in full, which takes a
+        while at the RIDB's rate limit - loading the RIDB export is faster.
+
+        Parameters
+        ----------
+        catalog: RIDBCatalog
+
+        Returns
+        -------
+        int
+            Records added or updated
+        """
+        params = {"full": "true"}
+        if catalog.cursor is not None:
+            params["lastupdated"] = catalog.cursor.strftime("%m-%d-%Y")
+        logger.info(
+            "Refreshing the local RIDB catalog with changes since %s",
+            catalog.cursor or "the beginning",
+        )
+        count = 0
+        for path, upsert in [
+            (RIDBConfig.REC_AREA_API_PATH, catalog.upsert_rec_areas),
+            (RIDBConfig.FACILITIES_API_PATH, catalog.upsert_facilities),
+        ]:
+            for page in self._ridb_iter_pages(
+                path=path, params=params, max_results=sys.maxsize
+            ):
+                count += upsert(page)
+        catalog.mark_synced()
+        logger.info("%s records updated in the local RIDB catalog", count)
+        return count
+
     @classmethod
     def _ridb_get_endpoint(cls, path: str) -> str:
         """
@@ -350,6 +455,7 @@ class RecreationDotGovBase(BaseProvider, ABC):
     @tenacity.retry(
         wait=tenacity.wait_random_exponential(multiplier=2, max=10),
         stop=tenacity.stop.stop_after_delay(15),
+        before_sleep=count_retry,
     )
     def get_ridb_data(
         self, path: str, params: Optional[dict] = None
@@ -371,6 +477,7 @@ class RecreationDotGovBase(BaseProvider, ABC):
         api_endpoint = self._ridb_get_endpoint(path=path)
         headers = self.headers.copy()
         headers.update(self._ridb_api_headers)
+        self.ridb_rate_limiter.wait(host=api_endpoint)
         response = self.session.get(
             url=api_endpoint, headers=headers, params=params, timeout=30
         )
@@ -382,13 +489,82 @@ class RecreationDotGovBase(BaseProvider, ABC):
             raise ConnectionError(error_message)
         return loads(response.content)
 
+    def _ridb_get_page(self, path: str, params: dict) -> GenericResponse:
+        """
+        Return a Single Page of a Paginated Response from the RIDB
+
+        Parameters
+        ----------
+        path: str
+            URL Endpoint, see https://ridb.recreation.gov/docs
+        params: dict
+            API Call Parameters, including the `offset`
+
+        Returns
+        -------
+        GenericResponse
+        """
+        return GenericResponse(**self.get_ridb_data(path=path, params=params))
+
+    def _ridb_iter_pages(
+        self,
+        path: str,
+        params: Optional[dict] = None,
+        max_results: Optional[int] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Stream the Pages of a Paginated Response from the RIDB
+
+        The first page gives the total count, every remaining page is then
+        fetched concurrently and yielded in order as soon as it arrives.
+
+        Parameters
+        ----------
+        path: str
+            URL Endpoint, see https://ridb.recreation.gov/docs
+        params: Optional[dict]
+            API Call Parameters
+        max_results: Optional[int]
+            Most results to return, defaults to `RIDBConfig.MAX_RESULTS`
+
+        Yields
+        ------
+        List[dict]
+            Records of each page
+        """
+        params = {} if params is None else params
+        if max_results is None:
+            max_results = RIDBConfig.MAX_RESULTS
+        first_page = self._ridb_get_page(path=path, params=dict(params, offset=0))
+        page_size = first_page.METADATA.RESULTS.CURRENT_COUNT
+        total_count = first_page.METADATA.RESULTS.TOTAL_COUNT
+        if total_count > max_results:
+            logger.warning(
+                f"Too Many Results returned ({total_count}), only the first "
+                f"{max_results} are used - try performing a more specific search"
+            )
+        yield first_page.RECDATA[:max_results]
+        if page_size == 0:
+            return
+        offsets = range(page_size, min(total_count, max_results), page_size)
+        pages = iter_concurrently(
+            func=lambda offset: self._ridb_get_page(
+                path=path, params=dict(params, offset=offset)
+            ),
+            items=offsets,
+            max_workers=RIDBConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        for offset, page in zip(offsets, pages):
+            yield page.RECDATA[: max_results - offset]
+
     def _ridb_get_paginate(
         self,
         path: str,
         params: Optional[dict] = None,
+        max_results: Optional[int] = None,
     ) -> List[dict]:
         """
-        Return the Paginated Response from the RIDP
+        Return the Paginated Response from the RIDB
 
         Parameters
         ----------
@@ -396,39 +572,19 @@ class RecreationDotGovBase(BaseProvider, ABC):
             URL Endpoint, see https://ridb.recreation.gov/docs
         params: Optional[dict]
             API Call Parameters
+        max_results: Optional[int]
+            Most results to return, defaults to `RIDBConfig.MAX_RESULTS`
 
         Returns
         -------
         paginated_response: list
             Concatted Response
         """
-        if params is None:
-            params = {}
         paginated_response = []
-
-        data_incomplete = True
-        offset: int = 0
-        max_offset: int = 500
-        historical_results = 0
-
-        while data_incomplete is True:
-            params.update(offset=offset)
-            data_response = self.get_ridb_data(path=path, params=params)
-            response_object = GenericResponse(**data_response)
-            paginated_response += response_object.RECDATA
-            result_count = response_object.METADATA.RESULTS.CURRENT_COUNT
-            historical_results += result_count
-            total_count = response_object.METADATA.RESULTS.TOTAL_COUNT
-            if offset >= max_offset:
-                logger.info(
-                    f"Too Many Results returned ({total_count}), "
-                    "try performing a more specific search"
-                )
-                data_incomplete = False
-            elif historical_results < total_count:
-                offset = historical_results
-            else:
-                data_incomplete = False
+        for page in self._ridb_iter_pages(
+            path=path, params=params, max_results=max_results
+        ):
+            paginated_response += page
         return paginated_response
 
     @classmethod
@@ -583,15 +739,22 @@ class RecreationDotGovBase(BaseProvider, ABC):
         headers = STANDARD_HEADERS.copy()
         headers.update(user_agent)
         headers.update(RecreationBookingConfig.API_REFERRERS)
-        response = requests.request(
-            method=method, url=url, headers=headers, params=params, timeout=30, **kwargs
-        )
+        with api_utils.provider_session(provider=cls.__name__) as session:
+            response = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                params=params,
+                timeout=30,
+                **kwargs,
+            )
         return response
 
     @classmethod
     @tenacity.retry(
         wait=tenacity.wait_random_exponential(multiplier=2, max=10),
         stop=tenacity.stop.stop_after_delay(15),
+        before_sleep=count_retry,
     )
     def make_recdotgov_request_retry(
         cls,
@@ -622,6 +785,7 @@ class RecreationDotGovBase(BaseProvider, ABC):
     @tenacity.retry(
         wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
         stop=tenacity.stop.stop_after_delay(6000),
+        before_sleep=count_retry,
     )
     def _make_recdotgov_availability_request(
         self,
@@ -650,6 +814,7 @@ class RecreationDotGovBase(BaseProvider, ABC):
             logger.debug(f"Error Details: {response_error}")
             raise ConnectionError(f"{error_message}: {response_error}")
 
+    @traced()
     def get_recdotgov_data(
         self, campground_id: int, month: datetime
     ) -> Union[dict, list]:
@@ -692,6 +857,8 @@ class RecreationDotGovBase(BaseProvider, ABC):
         -------
         CamplyModel
         """
+        if str(campsite_id) in self._campsites:
+            return self._campsites[str(campsite_id)]
         data = self.get_ridb_data(path=f"{self.resource_api_path}/{campsite_id}")
         try:
             response = self.api_response_class(**data[0])
@@ -699,14 +866,36 @@ class RecreationDotGovBase(BaseProvider, ABC):
             raise ProviderSearchError(
                 f"Campsite with ID #{campsite_id} not found."
             ) from ie
+        self._campsites[str(campsite_id)] = response
         return response
 
+    def get_facility_by_id(self, facility_id: Union[int, str]) -> dict:
+        """
+        Get a Facility's Details, Fetching Each Facility Only Once
+
+        Parameters
+        ----------
+        facility_id: Union[int, str]
+
+        Returns
+        -------
+        dict
+        """
+        if str(facility_id) not in self._facilities:
+            self._facilities[str(facility_id)] = self.get_ridb_data(
+                path=f"{RIDBConfig.FACILITIES_API_PATH}/{facility_id}",
+                params={"full": True},
+            )
+        return self._facilities[str(facility_id)]
+
     def get_campground_ids_by_campsites(
         self, campsite_ids: List[int]
     ) -> Tuple[List[int], List[CamplyModel]]:
         """
         Retrieve a list of FacilityIDs, and Facilities from a Campsite ID List
 
+        Each distinct campsite is fetched once, concurrently.
+
         Parameters
         ----------
         campsite_ids: List[int]
@@ -716,13 +905,13 @@ class RecreationDotGovBase(BaseProvider, ABC):
         -------
         Tuple[List[int], List[CamplyModel]]
         """
-        campground_ids = []
-        campgrounds = []
-        for campsite_id in campsite_ids:
-            campsite = self.get_campsite_by_id(campsite_id=campsite_id)
-            campgrounds.append(campsite)
-            campground_ids.append(campsite.FacilityID)
-        return list(set(campground_ids)), list(campgrounds)
+        campgrounds = run_concurrently(
+            func=self.get_campsite_by_id,
+            items=list(dict.fromkeys(campsite_ids)),
+            max_workers=RIDBConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        campground_ids = [campsite.FacilityID for campsite in campgrounds]
+        return list(dict.fromkeys(campground_ids)), campgrounds
 
     def _process_specific_campsites_provided(
         self, campsite_id: Optional[List[int]] = None
@@ -741,11 +930,15 @@ class RecreationDotGovBase(BaseProvider, ABC):
         facility_ids, campsites = self.get_campground_ids_by_campsites(
             campsite_ids=campsite_id
         )
+        campgrounds = {
+            str(campground.facility_id): campground
+            for campground in self._find_facilities_from_campgrounds(
+                campground_id=facility_ids
+            )
+        }
         facilities = []
         for campsite in campsites:
-            facility = self._find_facilities_from_campgrounds(
-                campground_id=[campsite.FacilityID]
-            )[0]
+            facility = campgrounds[str(campsite.FacilityID)]
             facilities.append(facility)
             # TODO(@juftin): Why did we change this?
             logger.info(
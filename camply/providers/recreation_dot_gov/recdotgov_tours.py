@@ -24,6 +24,8 @@ from camply.containers.base_container import CamplyModel, RecDotGovEquipment
 from camply.providers.base_provider import ProviderSearchError
 from camply.providers.recreation_dot_gov.recdotgov_provider import RecreationDotGovBase
 from camply.utils import api_utils
+from camply.utils.concurrency_utils import run_concurrently
+from camply.utils.instrumentation import traced
 
 logger = logging.getLogger(__name__)
 
@@ -174,6 +176,7 @@ class RecreationDotGovTours(RecreationDotGovBase, ABC):
         }
 
     @classmethod
+    @traced()
     def process_campsite_availability(
         cls,
         availability: Dict[str, Any],
@@ -240,6 +243,20 @@ class RecreationDotGovTours(RecreationDotGovBase, ABC):
                     total_campsite_availability.append(available_campsite)
         return total_campsite_availability
 
+    def _get_known_campsite(self, campsite_id: int) -> Optional[TourResponse]:
+        """
+        Get a Tour's Details, or None When it Isn't Found
+        """
+        try:
+            return self.get_campsite_by_id(campsite_id=campsite_id)
+        except ProviderSearchError as e:
+            warning_message = (
+                "Ignoring ProviderSearchError; "
+                f"be sure that this is covered by another one in the same facility: {e}"
+            )
+            logging.warning(warning_message)
+            return None
+
     def get_campground_ids_by_campsites(
         self, campsite_ids: List[int]
     ) -> Tuple[List[int], List[CamplyModel]]:
@@ -257,23 +274,21 @@ class RecreationDotGovTours(RecreationDotGovBase, ABC):
         -------
         Tuple[List[int], List[CamplyModel]]
         """
-        campground_ids = []
-        campgrounds = []
-        unknown_ids = []
-        for campsite_id in campsite_ids:
-            try:
-                campsite = self.get_campsite_by_id(campsite_id=campsite_id)
-            except ProviderSearchError as e:
-                warning_message = (
-                    "Ignoring ProviderSearchError; "
-                    f"be sure that this is covered by another one in the same facility: {e}"
-                )
-                logging.warning(warning_message)
-                unknown_ids.append(campsite_id)
-                continue
-            campgrounds.append(campsite)
-            campground_ids.append(campsite.FacilityID)
-        campground_ids_unique = list(set(campground_ids))
+        campsite_ids = list(dict.fromkeys(campsite_ids))
+        campsites = run_concurrently(
+            func=self._get_known_campsite,
+            items=campsite_ids,
+            max_workers=RIDBConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        campgrounds = [campsite for campsite in campsites if campsite is not None]
+        unknown_ids = [
+            campsite_id
+            for campsite_id, campsite in zip(campsite_ids, campsites)
+            if campsite is None
+        ]
+        campground_ids_unique = list(
+            dict.fromkeys(campsite.FacilityID for campsite in campgrounds)
+        )
         if unknown_ids:
             if not campground_ids_unique:
                 raise ProviderSearchError(
@@ -341,6 +356,7 @@ class RecreationDotGovDailyMixin(RecreationDotGovTours, ABC):
         )
 
     @classmethod
+    @traced()
     def process_campsite_availability(
         cls,
         availability: Dict[str, Any],
@@ -0,0 +1,631 @@
+"""
+Local Catalog of RIDB Facilities and Recreation Areas
+
+A SQLite copy of the RIDB's facilities and recreation areas, with full-text
+search over their names, keywords and descriptions. It's filled from the
+RIDB full data export and kept current by fetching only the records updated
+since the last sync. Records are stored in the shape the RIDB API returns
+with `full=true`, so lookups served from the catalog go through the same
+processing as live ones.
+"""
+
+import json
+import logging
+import pathlib
+import re
+import sqlite3
+import tempfile
+import zipfile
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Any, DefaultDict, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+from pydantic import ValidationError
+
+from camply.config import RIDBConfig
+from camply.containers.api_responses import FacilityResponse, RecreationAreaResponse
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS facilities (
+    facility_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    facility_type TEXT NOT NULL,
+    enabled INTEGER NOT NULL,
+    reservable INTEGER NOT NULL,
+    states TEXT NOT NULL,
+    activities TEXT,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rec_areas (
+    rec_area_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    states TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS rec_area_facilities (
+    rec_area_id TEXT NOT NULL,
+    facility_id TEXT NOT NULL,
+    PRIMARY KEY (rec_area_id, facility_id)
+);
+CREATE INDEX IF NOT EXISTS rec_area_facilities_facility_id
+    ON rec_area_facilities (facility_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS facilities_search
+    USING fts5(facility_id UNINDEXED, name, keywords, description);
+CREATE VIRTUAL TABLE IF NOT EXISTS rec_areas_search
+    USING fts5(rec_area_id UNINDEXED, name, keywords, description);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_SEARCH_TERMS = re.compile(r"\w+")
+_ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+
+
+def _match_expression(query: str) -> Optional[str]:
+    """
+    Turn a Search String into an FTS5 Query Matching Every Word as a Prefix
+    """
+    terms = _SEARCH_TERMS.findall(query)
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def _codes(values: Iterable[Any]) -> str:
+    """
+    Pack Codes like `|CA|NV|` so a Single One Can be Matched with `instr`
+    """
+    return "|" + "|".join(str(value).upper() for value in values if value) + "|"
+
+
+def _last_updated(record: Dict[str, Any]) -> Optional[str]:
+    """
+    The `LastUpdatedDate` of a Record, as an ISO Date
+    """
+    match = _ISO_DATE.match(str(record.get("LastUpdatedDate") or ""))
+    return None if match is None else match.group(0)
+
+
+def _read_export_table(
+    archive: zipfile.ZipFile, name: str
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Records of One Table of the RIDB Export, None When it Isn't Included
+    """
+    file_name = f"{name}_API_v1.json".lower()
+    for member in archive.namelist():
+        if pathlib.PurePosixPath(member).name.lower() == file_name:
+            with archive.open(member) as file:
+                return json.load(file)["RECDATA"]
+    return None
+
+
+def _group_by(
+    records: Optional[List[Dict[str, Any]]], key: str, entity_type: Optional[str] = None
+) -> DefaultDict[str, List[Dict[str, Any]]]:
+    """
+    Group Export Records by an ID, Optionally Only Those of One Entity Type
+    """
+    groups: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for record in records or []:
+        if entity_type is None or record.get("EntityType") == entity_type:
+            groups[str(record[key])].append(record)
+    return groups
+
+
+def export_records(
+    archive: zipfile.ZipFile,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Join the Tables of the RIDB Export into API Shaped Records
+
+    Parameters
+    ----------
+    archive: zipfile.ZipFile
+        RIDB full export, in JSON
+
+    Returns
+    -------
+    Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+        Recreation areas and facilities, as `full=true` API records
+    """
+    rec_areas = _read_export_table(archive, "RecAreas")
+    facilities = _read_export_table(archive, "Facilities")
+    if rec_areas is None or facilities is None:
+        raise ValueError("That isn't an RIDB export, RecAreas or Facilities is missing")
+    rec_area_addresses = _group_by(
+        _read_export_table(archive, "RecAreaAddresses"), "RecAreaID"
+    )
+    facility_addresses = _group_by(
+        _read_export_table(archive, "FacilityAddresses"), "FacilityID"
+    )
+    rec_area_links = _group_by(
+        _read_export_table(archive, "RecAreaFacilities"), "FacilityID"
+    )
+    organizations = {
+        str(organization["OrgID"]): organization
+        for organization in _read_export_table(archive, "Organizations") or []
+    }
+    organization_links = _group_by(
+        _read_export_table(archive, "OrgEntities"), "EntityID", "Facility"
+    )
+    activity_names = {
+        str(activity["ActivityID"]): activity["ActivityName"]
+        for activity in _read_export_table(archive, "Activities") or []
+    }
+    entity_activities = _read_export_table(archive, "EntityActivities")
+    activity_links = _group_by(entity_activities, "EntityID", "Facility")
+    rec_area_names = {
+        str(rec_area["RecAreaID"]): rec_area["RecAreaName"] for rec_area in rec_areas
+    }
+    for rec_area in rec_areas:
+        rec_area["RECAREAADDRESS"] = rec_area_addresses[str(rec_area["RecAreaID"])]
+    for facility in facilities:
+        facility_id = str(facility["FacilityID"])
+        facility["FACILITYADDRESS"] = facility_addresses[facility_id]
+        facility["RECAREA"] = [
+            {"RecAreaID": rec_area_id, "RecAreaName": rec_area_names[rec_area_id]}
+            for rec_area_id in (
+                str(link["RecAreaID"]) for link in rec_area_links[facility_id]
+            )
+            if rec_area_id in rec_area_names
+        ]
+        facility["ORGANIZATION"] = [
+            {"OrgID": organization["OrgID"], "OrgName": organization["OrgName"]}
+            for organization in (
+                organizations.get(str(link["OrgID"]))
+                for link in organization_links[facility_id]
+            )
+            if organization is not None
+        ]
+        if entity_activities is not None:
+            facility["ACTIVITY"] = [
+                {"ActivityID": link["ActivityID"], "ActivityName": name}
+                for link, name in (
+                    (link, activity_names.get(str(link["ActivityID"])))
+                    for link in activity_links[facility_id]
+                )
+                if name is not None
+            ]
+    return rec_areas, facilities
+
+
+class RIDBCatalog:
+    """
+    SQLite Catalog of RIDB Facilities and Recreation Areas
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        """
+        Open (or Create) the Catalog
+
+        Parameters
+        ----------
+        path: Union[str, pathlib.Path]
+            SQLite database file
+        """
+        self.path = pathlib.Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.executescript(_SCHEMA)
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {self.path}>"
+
+    def __enter__(self) -> "RIDBCatalog":
+        """
+        Use the Catalog as a Context Manager
+        """
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Close the Catalog
+        """
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the Database Connection
+        """
+        self.connection.close()
+
+    @classmethod
+    def from_config(cls) -> Optional["RIDBCatalog"]:
+        """
+        The Catalog at `RIDBConfig.CATALOG_PATH`, if it has Been Synced
+
+        Returns
+        -------
+        Optional[RIDBCatalog]
+        """
+        path = RIDBConfig.CATALOG_PATH
+        if not path or not pathlib.Path(path).expanduser().is_file():
+            return None
+        catalog = cls(path)
+        if catalog.synced_at is None:
+            catalog.close()
+            return None
+        return catalog
+
+    def _get_state(self, key: str) -> Optional[str]:
+        """
+        Read a Sync State Value
+        """
+        row = self.connection.execute(
+            "SELECT value FROM sync_state WHERE key = ?", (key,)
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def _set_state(self, key: str, value: str) -> None:
+        """
+        Write a Sync State Value
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)",
+            (key, value),
+        )
+
+    @property
+    def synced_at(self) -> Optional[datetime]:
+        """
+        When the Catalog was Last Synced
+        """
+        value = self._get_state("synced_at")
+        return None if value is None else datetime.fromisoformat(value)
+
+    @property
+    def cursor(self) -> Optional[date]:
+        """
+        Newest `LastUpdatedDate` in the Catalog, Where the Next Refresh Starts
+        """
+        value = self._get_state("cursor")
+        return None if value is None else date.fromisoformat(value)
+
+    def is_stale(
+        self, interval: timedelta = RIDBConfig.CATALOG_REFRESH_INTERVAL
+    ) -> bool:
+        """
+        Whether the Catalog is Due for a Refresh
+
+        Parameters
+        ----------
+        interval: timedelta
+
+        Returns
+        -------
+        bool
+        """
+        synced_at = self.synced_at
+        return synced_at is None or datetime.now() - synced_at > interval
+
+    def mark_synced(self) -> None:
+        """
+        Record that the Catalog was Synced Just Now
+        """
+        with self.connection:
+            self._set_state("synced_at", datetime.now().isoformat())
+
+    def _advance_cursor(self, updated: Iterable[Optional[str]]) -> None:
+        """
+        Move the Refresh Cursor to the Newest Update Seen
+        """
+        newest = max(
+            (value for value in [*updated, self._get_state("cursor")] if value),
+            default=None,
+        )
+        if newest is not None:
+            self._set_state("cursor", newest)
+
+    def upsert_facilities(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add or Replace Facilities
+
+        Records that aren't valid facilities are skipped.
+
+        Parameters
+        ----------
+        records: Iterable[Dict[str, Any]]
+            `full=true` RIDB facility records
+
+        Returns
+        -------
+        int
+            Facilities stored
+        """
+        updated: List[Optional[str]] = []
+        with self.connection:
+            for record in records:
+                try:
+                    facility = FacilityResponse(**record)
+                except ValidationError:
+                    logger.debug(
+                        "Skipping Invalid Facility: %s", record.get("FacilityID")
+                    )
+                    continue
+                facility_id = str(facility.FacilityID)
+                rec_area_ids = {
+                    str(rec_area.RecAreaID) for rec_area in facility.RECAREA or []
+                }
+                if facility.ParentRecAreaID is not None:
+                    rec_area_ids.add(str(facility.ParentRecAreaID))
+                activities = record.get("ACTIVITY")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO facilities VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        facility_id,
+                        facility.FacilityName,
+                        facility.FacilityTypeDescription,
+                        facility.Enabled,
+                        facility.Reservable,
+                        _codes(
+                            address.AddressStateCode
+                            for address in facility.FACILITYADDRESS or []
+                        ),
+                        None
+                        if activities is None
+                        else _codes(
+                            activity.get("ActivityName") for activity in activities
+                        ),
+                        json.dumps(record),
+                    ),
+                )
+                self.connection.execute(
+                    "DELETE FROM rec_area_facilities WHERE facility_id = ?",
+                    (facility_id,),
+                )
+                self.connection.executemany(
+                    "INSERT INTO rec_area_facilities VALUES (?, ?)",
+                    [(rec_area_id, facility_id) for rec_area_id in rec_area_ids],
+                )
+                self.connection.execute(
+                    "DELETE FROM facilities_search WHERE facility_id = ?",
+                    (facility_id,),
+                )
+                self.connection.execute(
+                    "INSERT INTO facilities_search VALUES (?, ?, ?, ?)",
+                    (
+                        facility_id,
+                        facility.FacilityName,
+                        record.get("Keywords") or "",
+                        record.get("FacilityDescription") or "",
+                    ),
+                )
+                updated.append(_last_updated(record))
+            self._advance_cursor(updated)
+        return len(updated)
+
+    def upsert_rec_areas(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add or Replace Recreation Areas
+
+        Records that aren't valid recreation areas are skipped.
+
+        Parameters
+        ----------
+        records: Iterable[Dict[str, Any]]
+            `full=true` RIDB recreation area records
+
+        Returns
+        -------
+        int
+            Recreation areas stored
+        """
+        updated: List[Optional[str]] = []
+        with self.connection:
+            for record in records:
+                try:
+                    rec_area = RecreationAreaResponse(**record)
+                except ValidationError:
+                    logger.debug(
+                        "Skipping Invalid Recreation Area: %s", record.get("RecAreaID")
+                    )
+                    continue
+                rec_area_id = str(rec_area.RecAreaID)
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO rec_areas VALUES (?, ?, ?, ?)",
+                    (
+                        rec_area_id,
+                        rec_area.RecAreaName,
+                        _codes(
+                            address.AddressStateCode
+                            for address in rec_area.RECAREAADDRESS
+                        ),
+                        json.dumps(record),
+                    ),
+                )
+                self.connection.execute(
+                    "DELETE FROM rec_areas_search WHERE rec_area_id = ?",
+                    (rec_area_id,),
+                )
+                self.connection.execute(
+                    "INSERT INTO rec_areas_search VALUES (?, ?, ?, ?)",
+                    (
+                        rec_area_id,
+                        rec_area.RecAreaName,
+                        record.get("Keywords") or "",
+                        record.get("RecAreaDescription") or "",
+                    ),
+                )
+                updated.append(_last_updated(record))
+            self._advance_cursor(updated)
+        return len(updated)
+
+    def sync_export(self, source: Union[str, pathlib.Path]) -> int:
+        """
+        Load the RIDB Full Data Export
+
+        Parameters
+        ----------
+        source: Union[str, pathlib.Path]
+            URL or path of the JSON export zip file,
+            see https://ridb.recreation.gov/download
+
+        Returns
+        -------
+        int
+            Records stored
+        """
+        source = str(source)
+        if not source.startswith(("http://", "https://")):
+            return self._load_export(pathlib.Path(source).expanduser())
+        with tempfile.TemporaryDirectory() as directory:
+            archive = pathlib.Path(directory) / "RIDBFullExport.zip"
+            logger.info("Downloading the RIDB Export: %s", source)
+            with requests.get(source, stream=True, timeout=60) as response:
+                response.raise_for_status()
+                with archive.open("wb") as file:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        file.write(chunk)
+            return self._load_export(archive)
+
+    def _load_export(self, path: pathlib.Path) -> int:
+        """
+        Load an RIDB Export Zip File
+        """
+        with zipfile.ZipFile(path) as archive:
+            rec_areas, facilities = export_records(archive)
+        count = self.upsert_rec_areas(rec_areas) + self.upsert_facilities(facilities)
+        self.mark_synced()
+        logger.info("%s Records Loaded into the Catalog from the RIDB Export", count)
+        return count
+
+    def _select(self, table: str, clauses: List[str], params: List[Any]) -> List[dict]:
+        """
+        Records of a Table Matching Every Clause, by Name
+        """
+        where = " AND ".join(clauses) or "1"
+        rows = self.connection.execute(
+            f"SELECT record FROM {table} WHERE {where} ORDER BY name", params
+        )
+        return [json.loads(record) for (record,) in rows]
+
+    @staticmethod
+    def _filter_search(
+        table: str,
+        key: str,
+        query: Optional[str],
+        clauses: List[str],
+        params: List[Any],
+    ) -> None:
+        """
+        Filter on a Full-Text Search
+        """
+        expression = None if query is None else _match_expression(query)
+        if expression is not None:
+            clauses.append(
+                f"{key} IN (SELECT {key} FROM {table} WHERE {table} MATCH ?)"
+            )
+            params.append(expression)
+
+    @staticmethod
+    def _filter_states(
+        state: Optional[str], clauses: List[str], params: List[Any]
+    ) -> None:
+        """
+        Filter on Comma Separated State Codes
+        """
+        codes = [code.strip().upper() for code in (state or "").split(",")]
+        codes = [code for code in codes if code]
+        if codes:
+            clauses.append(
+                "(" + " OR ".join("instr(states, ?) > 0" for _ in codes) + ")"
+            )
+            params += [_codes([code]) for code in codes]
+
+    def facility(self, facility_id: Union[int, str]) -> Optional[dict]:
+        """
+        A Facility by ID
+
+        Parameters
+        ----------
+        facility_id: Union[int, str]
+
+        Returns
+        -------
+        Optional[dict]
+        """
+        records = self._select("facilities", ["facility_id = ?"], [str(facility_id)])
+        return records[0] if records else None
+
+    def facilities(
+        self,
+        query: Optional[str] = None,
+        state: Optional[str] = None,
+        rec_area_id: Optional[Union[int, str]] = None,
+        activity: Optional[str] = None,
+        facility_type: Optional[str] = None,
+        reservable: bool = False,
+    ) -> List[dict]:
+        """
+        Search Facilities
+
+        Parameters
+        ----------
+        query: Optional[str]
+            Words to find in the name, keywords or description
+        state: Optional[str]
+            Comma separated state codes
+        rec_area_id: Optional[Union[int, str]]
+            Recreation area the facilities belong to
+        activity: Optional[str]
+            Activity offered, facilities without activity data always match
+        facility_type: Optional[str]
+            `FacilityTypeDescription` of the facilities
+        reservable: bool
+            Only enabled, reservable facilities
+
+        Returns
+        -------
+        List[dict]
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        self._filter_search("facilities_search", "facility_id", query, clauses, params)
+        self._filter_states(state, clauses, params)
+        if rec_area_id is not None:
+            clauses.append(
+                "facility_id IN "
+                "(SELECT facility_id FROM rec_area_facilities WHERE rec_area_id = ?)"
+            )
+            params.append(str(rec_area_id))
+        if activity is not None:
+            clauses.append("(activities IS NULL OR instr(activities, ?) > 0)")
+            params.append(_codes([activity]))
+        if facility_type is not None:
+            clauses.append("facility_type = ?")
+            params.append(facility_type)
+        if reservable is True:
+            clauses.append("enabled AND reservable")
+        return self._select("facilities", clauses, params)
+
+    def rec_areas(
+        self, query: Optional[str] = None, state: Optional[str] = None
+    ) -> List[dict]:
+        """
+        Search Recreation Areas
+
+        Parameters
+        ----------
+        query: Optional[str]
+            Words to find in the name, keywords or description
+        state: Optional[str]
+            Comma separated state codes
+
+        Returns
+        -------
+        List[dict]
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        self._filter_search("rec_areas_search", "rec_area_id", query, clauses, params)
+        self._filter_states(state, clauses, params)
+        return self._select("rec_areas", clauses, params)
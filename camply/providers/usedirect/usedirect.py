@@ -6,11 +6,23 @@ import json
 import logging
 import pathlib
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
 from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
-import ratelimit
 from fake_useragent import UserAgent
 from pydantic import ValidationError
 
@@ -34,6 +46,7 @@ from camply.containers.usedirect import (
 )
 from camply.exceptions import CamplyError
 from camply.providers.base_provider import BaseProvider
+from camply.utils.concurrency_utils import HostRateLimiter, run_concurrently
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -45,28 +58,119 @@ class UseDirectError(CamplyError):
     """
 
 
+class UseDirectMetadataSnapshot(NamedTuple):
+    """
+    Read-Only UseDirect Metadata, Shared Between Provider Instances
+    """
+
+    city_parks: Mapping[int, UseDirectCityPark]
+    rec_areas: Mapping[int, RecreationArea]
+    campgrounds: Mapping[int, CampgroundFacility]
+    unit_categories: Mapping[int, str]
+    unit_type_groups: Mapping[int, str]
+    loaded_at: float
+
+
+class UseDirectMetadataCache:
+    """
+    Thread-Safe, Process-Wide Cache of UseDirect Metadata
+
+    Metadata is loaded at most once per provider / offline cache directory
+    (and reloaded once it outlives its TTL). Concurrent searches block on
+    the first load instead of downloading the same metadata again.
+    """
+
+    def __init__(self, ttl: timedelta = UseDirectConfig.METADATA_TTL) -> None:
+        """
+        Initialize an Empty Cache
+
+        Parameters
+        ----------
+        ttl: timedelta
+            How long a loaded snapshot is served before reloading
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._key_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._snapshots: Dict[Tuple[str, str], UseDirectMetadataSnapshot] = {}
+
+    def get(
+        self,
+        key: Tuple[str, str],
+        loader: Callable[[], UseDirectMetadataSnapshot],
+    ) -> UseDirectMetadataSnapshot:
+        """
+        Return the Metadata Snapshot for a Key, Loading it if Needed
+
+        Parameters
+        ----------
+        key: Tuple[str, str]
+            Provider name and offline cache directory
+        loader: Callable[[], UseDirectMetadataSnapshot]
+            Called (once, under a per-key lock) when there's no fresh snapshot
+
+        Returns
+        -------
+        UseDirectMetadataSnapshot
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            snapshot = self._snapshots.get(key)
+            if (
+                snapshot is None
+                or time.monotonic() - snapshot.loaded_at > self.ttl.total_seconds()
+            ):
+                snapshot = loader()
+                self._snapshots[key] = snapshot
+        return snapshot
+
+    def clear(self) -> None:
+        """
+        Drop All Cached Snapshots
+
+        Returns
+        -------
+        None
+        """
+        with self._lock:
+            self._snapshots.clear()
+
+
 class UseDirectProvider(BaseProvider, ABC):
     """
     Camply Provider for UseDirect RDR Campgrounds
     """
 
-    usedirect_city_parks: Dict[int, UseDirectCityPark] = {}
-    usedirect_rec_areas: Dict[int, RecreationArea] = {}
-    usedirect_campgrounds: Dict[int, CampgroundFacility] = {}
-    usedirect_unit_categories: Dict[int, str] = {}
-    usedirect_unit_type_groups: Dict[int, str] = {}
-    usedirect_campsites: Dict[int, UseDirectAvailabilityUnit] = {}
-    campsite_ids: List[int] = []
-    metadata_refreshed: bool = False
-    active_search: bool = False
-
     __offline_cache_dir__: Optional[pathlib.Path] = None
 
+    metadata_cache: UseDirectMetadataCache = UseDirectMetadataCache()
+
+    rate_limiter: HostRateLimiter = HostRateLimiter(
+        calls=UseDirectConfig.RATE_LIMIT_CALLS,
+        period=UseDirectConfig.RATE_LIMIT_PERIOD,
+    )
+
     rdr_path: str = "rdr"
 
     booking_path_params: bool = True
     booking_path: str = "Web/Default.aspx"
 
+    def __init__(self) -> None:
+        """
+        Initialize with Search State Scoped to this Instance
+        """
+        super().__init__()
+        self.usedirect_city_parks: Mapping[int, UseDirectCityPark] = {}
+        self.usedirect_rec_areas: Mapping[int, RecreationArea] = {}
+        self.usedirect_campgrounds: Mapping[int, CampgroundFacility] = {}
+        self.usedirect_unit_categories: Mapping[int, str] = {}
+        self.usedirect_unit_type_groups: Mapping[int, str] = {}
+        self.usedirect_campsites: Dict[int, UseDirectAvailabilityUnit] = {}
+        self.campsite_ids: List[int] = []
+        self.metadata_refreshed: bool = False
+        self.active_search: bool = False
+
     @property
     @abstractmethod
     def base_url(self) -> str:
@@ -114,17 +218,46 @@ class UseDirectProvider(BaseProvider, ABC):
         - /rdr/rdr/search/places
         - /rdr/rdr/search/facilities
 
+        The parsed metadata is shared (read-only) with every other instance
+        of the same provider via `metadata_cache`.
+
         Returns
         -------
         None
         """
         if self.metadata_refreshed is False:
-            self._get_campground_metadata()
-            self._get_city_parks()
-            self._get_places()
-            self._get_facilities()
+            cache_key = (self.__class__.__name__, str(self.offline_cache_dir))
+            snapshot = self.metadata_cache.get(
+                key=cache_key, loader=self._load_metadata
+            )
+            self.usedirect_city_parks = snapshot.city_parks
+            self.usedirect_rec_areas = snapshot.rec_areas
+            self.usedirect_campgrounds = snapshot.campgrounds
+            self.usedirect_unit_categories = snapshot.unit_categories
+            self.usedirect_unit_type_groups = snapshot.unit_type_groups
         self.metadata_refreshed = True
 
+    def _load_metadata(self) -> UseDirectMetadataSnapshot:
+        """
+        Load All the Campground Metadata into a Read-Only Snapshot
+
+        Returns
+        -------
+        UseDirectMetadataSnapshot
+        """
+        self._get_campground_metadata()
+        self._get_city_parks()
+        self._get_places()
+        self._get_facilities()
+        return UseDirectMetadataSnapshot(
+            city_parks=MappingProxyType(dict(self.usedirect_city_parks)),
+            rec_areas=MappingProxyType(dict(self.usedirect_rec_areas)),
+            campgrounds=MappingProxyType(dict(self.usedirect_campgrounds)),
+            unit_categories=MappingProxyType(dict(self.usedirect_unit_categories)),
+            unit_type_groups=MappingProxyType(dict(self.usedirect_unit_type_groups)),
+            loaded_at=time.monotonic(),
+        )
+
     def search_for_recreation_areas(
         self,
         query: Optional[str] = None,
@@ -256,8 +389,6 @@ class UseDirectProvider(BaseProvider, ABC):
             ]
         return found_campgrounds
 
-    @ratelimit.sleep_and_retry
-    @ratelimit.limits(calls=1, period=1)
     def get_campsites_response(
         self,
         campground_id: int,
@@ -324,13 +455,14 @@ class UseDirectProvider(BaseProvider, ABC):
             key: value for key, value in data.items() if value not in [None, [], ""]
         }
         url = f"{self.base_url}/{self.rdr_path}/{UseDirectConfig.AVAILABILITY_ENDPOINT}"
-        random_ua = UserAgent(browsers=["chrome"]).random
-        self.json_headers["User-Agent"] = random_ua
+        headers = self.json_headers.copy()
+        headers["User-Agent"] = UserAgent(browsers=["chrome"]).random
+        self.rate_limiter.wait(host=self.base_url)
         response = self.make_http_request_retry(
             url=url,
             method="POST",
             data=json.dumps(non_null_data),
-            headers=self.json_headers,
+            headers=headers,
         )
         response_json = response.json()
         try:
@@ -483,14 +615,17 @@ class UseDirectProvider(BaseProvider, ABC):
         return campsite
 
     def _fetch_metadata_from_disk(
-        self, file_path: pathlib.Path
+        self,
+        file_path: pathlib.Path,
+        ttl: timedelta = UseDirectConfig.METADATA_TTL,
     ) -> Optional[Union[Dict[Any, Any], List[Dict[Any, Any]]]]:
         """
-        Cache Metadata Locally and Invalidate after a day
+        Cache Metadata Locally and Invalidate after a TTL (defaults to a day)
 
         Parameters
         ----------
         file_path: pathlib.Path
+        ttl: timedelta
 
         Returns
         -------
@@ -501,10 +636,7 @@ class UseDirectProvider(BaseProvider, ABC):
         else:
             modified_time = datetime.utcfromtimestamp(file_path.stat().st_mtime)
             current_time = datetime.utcnow()
-            if (
-                current_time - modified_time > timedelta(days=1)
-                and self.active_search is False
-            ):
+            if current_time - modified_time > ttl and self.active_search is False:
                 data = None
             else:
                 json_body: Dict[Any, Any] = json.loads(
@@ -670,17 +802,49 @@ class UseDirectProvider(BaseProvider, ABC):
         resp = self.get_campsites_response(
             campground_id=facility_id, start_date=date.today(), end_date=date.today()
         )
-        campsites: List[UseDirectAvailabilityUnit] = list(resp.Facility.Units.values())
+        units = resp.Facility.Units or {}
+        campsites: List[UseDirectAvailabilityUnit] = list(units.values())
         for campsite in campsites:
             campsite.FacilityId = facility_id
         return campsites
 
+    def _get_facility_units(self, facility_id: int) -> List[UseDirectAvailabilityUnit]:
+        """
+        Get the Unit Catalog for a Facility - Cached on Disk
+
+        The catalog is stored alongside the rest of the offline metadata
+        (`units/<facility_id>.json`) without any availability slices.
+
+        Parameters
+        ----------
+        facility_id: int
+
+        Returns
+        -------
+        List[UseDirectAvailabilityUnit]
+        """
+        units_file = self.offline_cache_dir.joinpath("units", f"{facility_id}.json")
+        units_data = self._fetch_metadata_from_disk(
+            file_path=units_file, ttl=UseDirectConfig.UNIT_METADATA_TTL
+        )
+        if units_data is None:
+            units = self.get_campsites_per_facility(facility_id=facility_id)
+            units_json = [json.loads(unit.json(exclude={"Slices"})) for unit in units]
+            units_file.parent.mkdir(parents=True, exist_ok=True)
+            units_file.write_text(json.dumps(units_json, indent=2))
+        else:
+            units = [UseDirectAvailabilityUnit(**unit_json) for unit_json in units_data]
+        return units
+
     def get_campsite_metadata(
         self, facility_ids: List[int]
     ) -> Dict[int, UseDirectAvailabilityUnit]:
         """
         Get the Campsite Metadata
 
+        Unit catalogs are served from the offline cache when possible, cache
+        misses are fetched concurrently (within the per-host rate limit).
+
         Parameters
         ----------
         facility_ids: List[int]
@@ -690,11 +854,15 @@ class UseDirectProvider(BaseProvider, ABC):
         -------
         Dict[int, UseDirectAvailabilityUnit]
         """
+        unique_facility_ids = list(dict.fromkeys(int(item) for item in facility_ids))
+        facility_units = run_concurrently(
+            self._get_facility_units,
+            unique_facility_ids,
+            max_workers=UseDirectConfig.MAX_CONCURRENT_REQUESTS,
+        )
         campsites: Dict[int, UseDirectAvailabilityUnit] = {}
-        for facility_id in facility_ids:
-            found_campsites = self.get_campsites_per_facility(facility_id=facility_id)
-            campsite_dict = {item.UnitId: item for item in found_campsites}
-            campsites.update(campsite_dict)
+        for found_campsites in facility_units:
+            campsites.update({item.UnitId: item for item in found_campsites})
         self.usedirect_campsites.update(campsites)
         return campsites
 
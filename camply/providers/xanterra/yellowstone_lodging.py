@@ -2,24 +2,31 @@
 Python Class Check Yellowstone Campground Booking API for Availability
 """
 
+import json
 import logging
+import pathlib
+import time
 from datetime import datetime, timedelta
 from json import loads
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib import parse
 
 import requests
 import tenacity
-from fake_useragent import UserAgent
-from pandas import DataFrame, to_datetime
 from pytz import timezone
 
-from camply.config import STANDARD_HEADERS
+from camply.config import STANDARD_HEADERS, FileConfig
 from camply.config.api_config import YellowstoneConfig
 from camply.containers import AvailableCampsite, CampgroundFacility, RecreationArea
 from camply.containers.api_responses import XantResortData
-from camply.providers.base_provider import BaseProvider
+from camply.providers.base_provider import BaseProvider, ProviderError
 from camply.utils import logging_utils
+from camply.utils.concurrency_utils import (
+    CircuitBreaker,
+    HostRateLimiter,
+    run_concurrently,
+)
+from camply.utils.instrumentation import count_retry
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -36,6 +43,55 @@ class Yellowstone(BaseProvider):
         recreation_area_location="USA",
     )
 
+    __offline_cache_dir__: Optional[pathlib.Path] = None
+
+    rate_limiter: HostRateLimiter = HostRateLimiter(
+        calls=YellowstoneConfig.RATE_LIMIT_CALLS,
+        period=YellowstoneConfig.RATE_LIMIT_PERIOD,
+    )
+
+    circuit_breaker: CircuitBreaker = CircuitBreaker(
+        failure_threshold=YellowstoneConfig.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=YellowstoneConfig.CIRCUIT_RESET_TIMEOUT,
+    )
+
+    def __init__(self):
+        """
+        Initialize with a Session Carrying the Yellowstone Headers
+        """
+        super().__init__()
+        self.session.headers.update(STANDARD_HEADERS)
+        self.session.headers.update(YellowstoneConfig.API_REFERRERS)
+        self.retry_deadline: Optional[float] = None
+
+    def start_poll(self) -> None:
+        """
+        Start the Retry Budget Shared by Every Request of a Poll
+
+        Once `YellowstoneConfig.RETRY_POLL_BUDGET` seconds have passed requests
+        are no longer retried, so a failing API can't stretch a single poll
+        out to the per-request budget times the number of requests.
+        """
+        self.retry_deadline = time.monotonic() + YellowstoneConfig.RETRY_POLL_BUDGET
+
+    def _retry_time_remaining(self) -> float:
+        """
+        Seconds Left in the Current Poll's Retry Budget
+        """
+        if self.retry_deadline is None:
+            return float("inf")
+        return max(self.retry_deadline - time.monotonic(), 0.0)
+
+    @property
+    def offline_cache_dir(self) -> pathlib.Path:
+        """
+        Offline Cache Directory
+        """
+        if self.__offline_cache_dir__ is None:
+            return FileConfig.XANTERRA_PROVIDER / self.__class__.__name__
+        else:
+            return self.__offline_cache_dir__
+
     def _get_monthly_availability(
         self, month: datetime, nights: Optional[int] = None
     ) -> dict:
@@ -67,68 +123,108 @@ class Yellowstone(BaseProvider):
             all_resort_availability_data[YellowstoneConfig.BOOKING_AVAILABILITY] = {}
         return all_resort_availability_data
 
-    @staticmethod
-    @tenacity.retry(
-        wait=tenacity.wait_random_exponential(multiplier=3, max=1800),
-        stop=tenacity.stop.stop_after_delay(6000),
-    )
-    def _try_retry_get_data(endpoint: str, params: Optional[dict] = None) -> dict:
+    def _get_data(self, endpoint: str, params: Optional[dict] = None) -> dict:
         """
-        Try and Retry Fetching Data from the Yellowstone API.
-
-        Unfortunately this is a required method to request the data since the
-        Yellowstone API doesn't always return data.
+        Fetch Data from the Yellowstone API, a Single Attempt
 
         Parameters
         ----------
         endpoint: str
             API Endpoint
-        params
+        params: Optional[dict]
+            Query Parameters
 
         Returns
         -------
         dict
+
+        Raises
+        ------
+        ProviderError
+            When the API errors or returns an empty or malformed response
         """
-        yellowstone_headers = {}
-        user_agent = {"User-Agent": UserAgent(browsers=["chrome"]).random}
-        yellowstone_headers.update(user_agent)
-        yellowstone_headers.update(STANDARD_HEADERS)
-        yellowstone_headers.update(YellowstoneConfig.API_REFERRERS)
-        response = requests.get(
-            url=endpoint, headers=yellowstone_headers, params=params, timeout=30
-        )
-        if response.ok is True and response.text.strip() != "":
-            return loads(response.content)
-        else:
-            error_message = (
-                "Something went wrong with checking the "
-                "Yellowstone Booking API. Will continue retrying."
+        try:
+            response = self.session.get(
+                url=endpoint,
+                params=params,
+                timeout=YellowstoneConfig.REQUEST_TIMEOUT,
             )
-            logger.warning(error_message)
-            raise RuntimeError(error_message)
+        except requests.RequestException as re:
+            raise ProviderError(f"Yellowstone API request failed: {re}") from re
+        if response.ok is True and response.text.strip() != "":
+            try:
+                return loads(response.content)
+            except ValueError as ve:
+                error_message = (
+                    "The Yellowstone Booking API returned an invalid response: "
+                    f"{response.url} - {ve}"
+                )
+                logger.warning(error_message)
+                raise ProviderError(error_message) from ve
+        error_message = (
+            "Something went wrong with checking the Yellowstone Booking API: "
+            f"{response.url} - {response.status_code}"
+        )
+        logger.warning(error_message)
+        raise ProviderError(error_message)
 
-    @staticmethod
-    def make_yellowstone_request(endpoint: str, params: Optional[dict] = None) -> dict:
+    def make_yellowstone_request(
+        self, endpoint: str, params: Optional[dict] = None
+    ) -> dict:
         """
         Try and Retry Fetching Data from the Yellowstone API.
 
         Unfortunately this is a required method to request the data since the
-        Yellowstone API doesn't always return data.
+        Yellowstone API doesn't always return data. Retries are bounded, per
+        request and by the budget shared across the poll (see `start_poll`),
+        so a flaky endpoint fails the current poll rather than blocking it, and
+        repeated failures open a circuit breaker that refuses requests until
+        the API has had time to recover.
 
         Parameters
         ----------
         endpoint: str
             API Endpoint
-        params
+        params: Optional[dict]
+            Query Parameters
 
         Returns
         -------
         dict
+
+        Raises
+        ------
+        ProviderError
+            When the retry budget is exhausted or the circuit is open
         """
+        if self.circuit_breaker.allow() is False:
+            raise ProviderError(
+                "The Yellowstone Booking API is failing, skipping request "
+                f"until the circuit resets: {endpoint}"
+            )
+        backoff = tenacity.wait_random_exponential(
+            multiplier=1, max=YellowstoneConfig.RETRY_MAX_WAIT
+        )
+        retryer = tenacity.Retrying(
+            wait=lambda retry_state: min(
+                backoff(retry_state), self._retry_time_remaining()
+            ),
+            stop=(
+                tenacity.stop_after_attempt(YellowstoneConfig.RETRY_MAX_ATTEMPTS)
+                | tenacity.stop_after_delay(YellowstoneConfig.RETRY_MAX_DELAY)
+                | (lambda _: self._retry_time_remaining() == 0)
+            ),
+            retry=tenacity.retry_if_exception_type(ProviderError),
+            before=lambda _: self.rate_limiter.wait(host=endpoint),
+            before_sleep=count_retry,
+            reraise=True,
+        )
         try:
-            content = Yellowstone._try_retry_get_data(endpoint=endpoint, params=params)
-        except RuntimeError as re:
-            raise RuntimeError(f"error_message: {re}") from re
+            content = retryer(self._get_data, endpoint=endpoint, params=params)
+        except ProviderError:
+            self.circuit_breaker.record_failure()
+            raise
+        self.circuit_breaker.record_success()
         return content
 
     @classmethod
@@ -255,8 +351,9 @@ class Yellowstone(BaseProvider):
         """
         Get campsite extra information
 
-        Given a DataFrame of campsite availability, return updated Data with details
-        about the actual campsites that are available (i.e Tent Size, RV Length, Etc)
+        Given a list of campsite availability, return updated Data with details
+        about the actual campsites that are available (i.e Tent Size, RV Length, Etc).
+        Each facility is requested concurrently.
 
         Parameters
         ----------
@@ -269,31 +366,39 @@ class Yellowstone(BaseProvider):
         -------
         List[dict]
         """
-        available_room_array = []
-        availability_df = DataFrame(data=available_campsites)
-        if availability_df.empty is True:
-            return available_room_array
-        for facility_id, _facility_df in availability_df.groupby(
-            YellowstoneConfig.FACILITY_ID
-        ):
-            api_endpoint = self._get_api_endpoint(
-                url_path=YellowstoneConfig.YELLOWSTONE_CAMPSITE_AVAILABILITY, query=None
-            )
-            params = {"date": self._ensure_current_month(month=month), "limit": 31}
-            if nights is not None:
-                params.update({"nights": nights})
+        facility_ids = sorted(
+            {
+                campsite[YellowstoneConfig.FACILITY_ID]
+                for campsite in available_campsites
+            }
+        )
+        api_endpoint = self._get_api_endpoint(
+            url_path=YellowstoneConfig.YELLOWSTONE_CAMPSITE_AVAILABILITY, query=None
+        )
+        params = {"date": self._ensure_current_month(month=month), "limit": 31}
+        if nights is not None:
+            params.update({"nights": nights})
+
+        def _get_facility_availability(facility_id: str) -> List[dict]:
             campsite_data = self.make_yellowstone_request(
                 endpoint=f"{api_endpoint}/{facility_id}", params=params
             )
             campsite_availability = campsite_data[
                 YellowstoneConfig.BOOKING_AVAILABILITY
             ]
-            booking_dates = campsite_availability.keys()
-            availabilities = self._process_daily_availability(
-                booking_dates=booking_dates,
+            return self._process_daily_availability(
+                booking_dates=campsite_availability.keys(),
                 campsite_availability=campsite_availability,
                 facility_id=facility_id,
             )
+
+        facility_availabilities = run_concurrently(
+            _get_facility_availability,
+            facility_ids,
+            max_workers=YellowstoneConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        available_room_array = []
+        for availabilities in facility_availabilities:
             available_room_array += availabilities
         return available_room_array
 
@@ -342,10 +447,42 @@ class Yellowstone(BaseProvider):
                         )
         return daily_availabilities
 
+    def _get_property_info(self, facility_id: str) -> Dict[str, Any]:
+        """
+        Get the Room Information for a Property - Cached on Disk
+
+        Parameters
+        ----------
+        facility_id: str
+
+        Returns
+        -------
+        Dict[str, Any]
+        """
+        cache_file = self.offline_cache_dir.joinpath(
+            "property", f"{facility_id.replace(':', '_')}.json"
+        )
+        if cache_file.exists() is True:
+            modified_time = datetime.utcfromtimestamp(cache_file.stat().st_mtime)
+            if datetime.utcnow() - modified_time <= YellowstoneConfig.PROPERTY_INFO_TTL:
+                return json.loads(cache_file.read_text(encoding="utf-8"))
+        api_endpoint = self._get_api_endpoint(
+            url_path=YellowstoneConfig.YELLOWSTONE_PROPERTY_INFO, query=None
+        )
+        campsite_info = self.make_yellowstone_request(
+            endpoint=f"{api_endpoint}/{facility_id}"
+        )
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(campsite_info), encoding="utf-8")
+        return campsite_info
+
     def _get_property_information(self, available_rooms: List[dict]) -> List[dict]:
         """
         Gather Information About All Campgrounds / Hotels within Yellowstone
 
+        Property information is static, it's cached on disk and cache misses
+        are requested concurrently.
+
         Parameters
         ----------
         available_rooms: List[dict]
@@ -355,17 +492,17 @@ class Yellowstone(BaseProvider):
         List[dict]
         """
         property_info_array = []
-        availability_df = DataFrame(data=available_rooms)
-        if availability_df.empty is True:
-            return property_info_array
-        facility_identifiers = availability_df[YellowstoneConfig.FACILITY_ID].unique()
-        for facility_id in facility_identifiers:
-            api_endpoint = self._get_api_endpoint(
-                url_path=YellowstoneConfig.YELLOWSTONE_PROPERTY_INFO, query=None
-            )
-            campsite_info = self.make_yellowstone_request(
-                endpoint=f"{api_endpoint}/{facility_id}"
+        facility_identifiers = list(
+            dict.fromkeys(
+                room[YellowstoneConfig.FACILITY_ID] for room in available_rooms
             )
+        )
+        facility_info = run_concurrently(
+            self._get_property_info,
+            facility_identifiers,
+            max_workers=YellowstoneConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        for facility_id, campsite_info in zip(facility_identifiers, facility_info):
             campsite_codes = campsite_info.keys()
             for campsite_code in campsite_codes:
                 campsite_data = campsite_info[campsite_code]
@@ -420,84 +557,121 @@ class Yellowstone(BaseProvider):
         monthly_campsites = self._compile_campground_availabilities(
             availability=availability
         )
-        campsite_data = DataFrame(
-            monthly_campsites, columns=YellowstoneConfig.CAMPSITE_DATA_COLUMNS
-        ).drop_duplicates()
-        if campsite_data.empty is True:
+        if len(monthly_campsites) == 0:
             return []
         available_room_array = self._gather_campsite_specific_availability(
             available_campsites=monthly_campsites, month=month, nights=nights
         )
-        available_rooms = DataFrame(available_room_array)
         property_info = self._get_property_information(
             available_rooms=available_room_array
         )
-        properties = DataFrame(property_info)
-        merged_campsites = available_rooms.merge(
-            properties,
-            on=[
-                YellowstoneConfig.FACILITY_ID_COLUMN,
-                YellowstoneConfig.CAMPSITE_ID_COLUMN,
-            ],
+        return self._assemble_campsites(
+            monthly_campsites=monthly_campsites,
+            available_rooms=available_room_array,
+            property_info=property_info,
+            nights=nights,
         )
-        merged_campsites[YellowstoneConfig.BOOKING_DATE_COLUMN] = to_datetime(
-            merged_campsites[YellowstoneConfig.BOOKING_DATE_COLUMN]
-        )
-        if nights is not None:
-            nights_param = {"nights": nights}
-        else:
-            nights_param = {"nights": 1}
-        booking_nights = nights_param.get("nights")
-        merged_campsites[YellowstoneConfig.BOOKING_END_DATE_COLUMN] = merged_campsites[
-            YellowstoneConfig.BOOKING_DATE_COLUMN
-        ] + timedelta(days=booking_nights)
-        merged_campsites[YellowstoneConfig.BOOKING_NIGHTS_COLUMN] = booking_nights
-        final_campsites = merged_campsites.merge(
-            campsite_data, on=YellowstoneConfig.FACILITY_ID_COLUMN
-        ).sort_values(by=YellowstoneConfig.BOOKING_DATE_COLUMN)
-        final_campsites[YellowstoneConfig.BOOKING_URL_COLUMN] = final_campsites.apply(
-            lambda x: self._return_lodging_url(
-                lodging_code=x.facility_id, month=x.booking_date, params=nights_param
-            ),
-            axis=1,
-        )
-        all_monthly_campsite_array = self._df_to_campsites(campsite_df=final_campsites)
-        return all_monthly_campsite_array
 
     @classmethod
-    def _df_to_campsites(cls, campsite_df: DataFrame) -> List[AvailableCampsite]:
+    def _assemble_campsites(
+        cls,
+        monthly_campsites: List[dict],
+        available_rooms: List[dict],
+        property_info: List[dict],
+        nights: Optional[int] = None,
+    ) -> List[AvailableCampsite]:
         """
-        Transform a DataFrame into an array of AvailableCampsites
+        Join Available Rooms with Property and Facility Details
+
+        Rooms are joined to their property information on (facility, room code)
+        and to the facility names found in the monthly availability, then
+        emitted as AvailableCampsites sorted by booking date. Booking URLs
+        are built once per facility and date.
 
         Parameters
         ----------
-        campsite_df: DataFrame
+        monthly_campsites: List[dict]
+            Campground availabilities from `_compile_campground_availabilities`
+        available_rooms: List[dict]
+            Room availabilities from `_gather_campsite_specific_availability`
+        property_info: List[dict]
+            Room details from `_get_property_information`
+        nights: Optional[int]
+            Search for consecutive nights
 
         Returns
         -------
         List[AvailableCampsite]
         """
-        all_monthly_campsite_array = []
-        for _, row in campsite_df.iterrows():
-            campsite = AvailableCampsite(
-                campsite_id=row[YellowstoneConfig.CAMPSITE_ID_COLUMN],
-                booking_date=row[YellowstoneConfig.BOOKING_DATE_COLUMN],
-                booking_end_date=row[YellowstoneConfig.BOOKING_END_DATE_COLUMN],
-                booking_nights=row[YellowstoneConfig.BOOKING_NIGHTS_COLUMN],
-                campsite_site_name=row[YellowstoneConfig.CAMPSITE_SITE_NAME_COLUMN],
-                campsite_loop_name=YellowstoneConfig.YELLOWSTONE_LOOP_NAME,
-                campsite_type=row[YellowstoneConfig.CAMPSITE_TYPE_COLUMN],
-                campsite_occupancy=row[YellowstoneConfig.CAMPSITE_OCCUPANCY_COLUMN],
-                campsite_use_type=row[YellowstoneConfig.CAMPSITE_USE_TYPE_COLUMN],
-                availability_status=YellowstoneConfig.CAMPSITE_AVAILABILITY_STATUS,
-                recreation_area=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_NAME,
-                recreation_area_id=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_ID,
-                facility_name=row[YellowstoneConfig.FACILITY_NAME_COLUMN],
-                facility_id=row[YellowstoneConfig.FACILITY_ID_COLUMN],
-                booking_url=row[YellowstoneConfig.BOOKING_URL_COLUMN],
+        booking_nights = nights if nights is not None else 1
+        nights_param = {"nights": booking_nights}
+        facility_names: Dict[str, List[str]] = {}
+        for campsite in monthly_campsites:
+            names = facility_names.setdefault(
+                campsite[YellowstoneConfig.FACILITY_ID_COLUMN], []
+            )
+            if campsite[YellowstoneConfig.FACILITY_NAME_COLUMN] not in names:
+                names.append(campsite[YellowstoneConfig.FACILITY_NAME_COLUMN])
+        properties: Dict[Tuple[str, str], List[dict]] = {}
+        for room_info in property_info:
+            key = (
+                room_info[YellowstoneConfig.FACILITY_ID_COLUMN],
+                room_info[YellowstoneConfig.CAMPSITE_ID_COLUMN],
+            )
+            properties.setdefault(key, []).append(room_info)
+        booking_urls: Dict[Tuple[str, datetime], str] = {}
+        booking_dates: Dict[str, datetime] = {}
+        records: List[Tuple[datetime, AvailableCampsite]] = []
+        for room in available_rooms:
+            facility_id = room[YellowstoneConfig.FACILITY_ID_COLUMN]
+            room_details = properties.get(
+                (facility_id, room[YellowstoneConfig.CAMPSITE_ID_COLUMN])
             )
-            all_monthly_campsite_array.append(campsite)
-        return all_monthly_campsite_array
+            names = facility_names.get(facility_id)
+            if not room_details or not names:
+                continue
+            booking_date_str = room[YellowstoneConfig.BOOKING_DATE_COLUMN]
+            booking_date = booking_dates.get(booking_date_str)
+            if booking_date is None:
+                booking_date = datetime.strptime(
+                    booking_date_str, YellowstoneConfig.BOOKING_DATE_FORMAT
+                )
+                booking_dates[booking_date_str] = booking_date
+            booking_url = booking_urls.get((facility_id, booking_date))
+            if booking_url is None:
+                booking_url = cls._return_lodging_url(
+                    lodging_code=facility_id, month=booking_date, params=nights_param
+                )
+                booking_urls[(facility_id, booking_date)] = booking_url
+            booking_end_date = booking_date + timedelta(days=booking_nights)
+            for room_info in room_details:
+                for facility_name in names:
+                    campsite = AvailableCampsite(
+                        campsite_id=room_info[YellowstoneConfig.CAMPSITE_ID_COLUMN],
+                        booking_date=booking_date,
+                        booking_end_date=booking_end_date,
+                        booking_nights=booking_nights,
+                        campsite_site_name=room_info[
+                            YellowstoneConfig.CAMPSITE_SITE_NAME_COLUMN
+                        ],
+                        campsite_loop_name=YellowstoneConfig.YELLOWSTONE_LOOP_NAME,
+                        campsite_type=room_info[YellowstoneConfig.CAMPSITE_TYPE_COLUMN],
+                        campsite_occupancy=room_info[
+                            YellowstoneConfig.CAMPSITE_OCCUPANCY_COLUMN
+                        ],
+                        campsite_use_type=room_info[
+                            YellowstoneConfig.CAMPSITE_USE_TYPE_COLUMN
+                        ],
+                        availability_status=YellowstoneConfig.CAMPSITE_AVAILABILITY_STATUS,
+                        recreation_area=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_NAME,
+                        recreation_area_id=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_ID,
+                        facility_name=facility_name,
+                        facility_id=facility_id,
+                        booking_url=booking_url,
+                    )
+                    records.append((booking_date, campsite))
+        records.sort(key=lambda record: record[0])
+        return [campsite for _, campsite in records]
 
     @classmethod
     def _ensure_current_month(cls, month: datetime) -> datetime:
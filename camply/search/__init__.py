@@ -1,59 +1,114 @@
 """
 camply search __init__ file
+
+Search classes are imported the first time they're accessed, importing
+`camply.search` on its own doesn't import any search or provider modules.
 """
 
-from typing import Dict, List, Type
+from typing import TYPE_CHECKING, Dict, Type
 
-from camply.search.base_search import BaseCampingSearch
-from camply.search.search_going_to_camp import SearchGoingToCamp
-from camply.search.search_recreationdotgov import (
-    SearchRecreationDotGov,
-    SearchRecreationDotGovDailyTicket,
-    SearchRecreationDotGovDailyTimedEntry,
-    SearchRecreationDotGovTicket,
-    SearchRecreationDotGovTimedEntry,
-)
-from camply.search.search_usedirect import (
-    SearchAlabamaStateParks,
-    SearchArizonaStateParks,
-    SearchFairfaxCountyParks,
-    SearchFloridaStateParks,
-    SearchMaricopaCountyParks,
-    SearchMinnesotaStateParks,
-    SearchMissouriStateParks,
-    SearchNorthernTerritory,
-    SearchOhioStateParks,
-    SearchOregonMetro,
-    SearchReserveCalifornia,
-    SearchVirginiaStateParks,
-)
-from camply.search.search_yellowstone import SearchYellowstone
+from camply.utils.lazy_imports import LazyRegistry, lazy_module_attributes
+
+if TYPE_CHECKING:
+    from camply.search.base_search import BaseCampingSearch
+    from camply.search.search_going_to_camp import SearchGoingToCamp
+    from camply.search.search_recreationdotgov import (
+        SearchRecreationDotGov,
+        SearchRecreationDotGovDailyTicket,
+        SearchRecreationDotGovDailyTimedEntry,
+        SearchRecreationDotGovTicket,
+        SearchRecreationDotGovTimedEntry,
+    )
+    from camply.search.search_usedirect import (
+        SearchAlabamaStateParks,
+        SearchArizonaStateParks,
+        SearchFairfaxCountyParks,
+        SearchFloridaStateParks,
+        SearchMaricopaCountyParks,
+        SearchMinnesotaStateParks,
+        SearchMissouriStateParks,
+        SearchNorthernTerritory,
+        SearchOhioStateParks,
+        SearchOregonMetro,
+        SearchReserveCalifornia,
+        SearchVirginiaStateParks,
+    )
+    from camply.search.search_yellowstone import SearchYellowstone
+
+__search_classes__: Dict[str, str] = {
+    "BaseCampingSearch": "camply.search.base_search:BaseCampingSearch",
+    "SearchGoingToCamp": "camply.search.search_going_to_camp:SearchGoingToCamp",
+    "SearchRecreationDotGov": "camply.search.search_recreationdotgov:SearchRecreationDotGov",
+    "SearchRecreationDotGovDailyTicket": "camply.search.search_recreationdotgov:SearchRecreationDotGovDailyTicket",
+    "SearchRecreationDotGovDailyTimedEntry": "camply.search.search_recreationdotgov:SearchRecreationDotGovDailyTimedEntry",
+    "SearchRecreationDotGovTicket": "camply.search.search_recreationdotgov:SearchRecreationDotGovTicket",
+    "SearchRecreationDotGovTimedEntry": "camply.search.search_recreationdotgov:SearchRecreationDotGovTimedEntry",
+    "SearchAlabamaStateParks": "camply.search.search_usedirect:SearchAlabamaStateParks",
+    "SearchArizonaStateParks": "camply.search.search_usedirect:SearchArizonaStateParks",
+    "SearchFairfaxCountyParks": "camply.search.search_usedirect:SearchFairfaxCountyParks",
+    "SearchFloridaStateParks": "camply.search.search_usedirect:SearchFloridaStateParks",
+    "SearchMaricopaCountyParks": "camply.search.search_usedirect:SearchMaricopaCountyParks",
+    "SearchMinnesotaStateParks": "camply.search.search_usedirect:SearchMinnesotaStateParks",
+    "SearchMissouriStateParks": "camply.search.search_usedirect:SearchMissouriStateParks",
+    "SearchNorthernTerritory": "camply.search.search_usedirect:SearchNorthernTerritory",
+    "SearchOhioStateParks": "camply.search.search_usedirect:SearchOhioStateParks",
+    "SearchOregonMetro": "camply.search.search_usedirect:SearchOregonMetro",
+    "SearchReserveCalifornia": "camply.search.search_usedirect:SearchReserveCalifornia",
+    "SearchVirginiaStateParks": "camply.search.search_usedirect:SearchVirginiaStateParks",
+    "SearchYellowstone": "camply.search.search_yellowstone:SearchYellowstone",
+}
+
+__getattr__ = lazy_module_attributes(__name__, __search_classes__)
 
 # Register Providers Here with their Search class
-__search_providers__: List[Type[BaseCampingSearch]] = [
-    SearchRecreationDotGov,
-    SearchYellowstone,
-    SearchGoingToCamp,
+__search_providers__: Dict[str, str] = {
+    "RecreationDotGov": "camply.search.search_recreationdotgov:SearchRecreationDotGov",
+    "Yellowstone": "camply.search.search_yellowstone:SearchYellowstone",
+    "GoingToCamp": "camply.search.search_going_to_camp:SearchGoingToCamp",
     # UseDirect
-    SearchReserveCalifornia,
-    SearchAlabamaStateParks,
-    SearchArizonaStateParks,
-    SearchFloridaStateParks,
-    SearchMinnesotaStateParks,
-    SearchMissouriStateParks,
-    SearchOhioStateParks,
-    SearchVirginiaStateParks,
-    SearchNorthernTerritory,
-    SearchFairfaxCountyParks,
-    SearchMaricopaCountyParks,
-    SearchOregonMetro,
+    "ReserveCalifornia": "camply.search.search_usedirect:SearchReserveCalifornia",
+    "AlabamaStateParks": "camply.search.search_usedirect:SearchAlabamaStateParks",
+    "ArizonaStateParks": "camply.search.search_usedirect:SearchArizonaStateParks",
+    "FloridaStateParks": "camply.search.search_usedirect:SearchFloridaStateParks",
+    "MinnesotaStateParks": "camply.search.search_usedirect:SearchMinnesotaStateParks",
+    "MissouriStateParks": "camply.search.search_usedirect:SearchMissouriStateParks",
+    "OhioStateParks": "camply.search.search_usedirect:SearchOhioStateParks",
+    "VirginiaStateParks": "camply.search.search_usedirect:SearchVirginiaStateParks",
+    "NorthernTerritory": "camply.search.search_usedirect:SearchNorthernTerritory",
+    "FairfaxCountyParks": "camply.search.search_usedirect:SearchFairfaxCountyParks",
+    "MaricopaCountyParks": "camply.search.search_usedirect:SearchMaricopaCountyParks",
+    "OregonMetro": "camply.search.search_usedirect:SearchOregonMetro",
     # Tours and Timed Entry (RecDotGov)
-    SearchRecreationDotGovTicket,
-    SearchRecreationDotGovTimedEntry,
-    SearchRecreationDotGovDailyTicket,
-    SearchRecreationDotGovDailyTimedEntry,
-]
-
-CAMPSITE_SEARCH_PROVIDER: Dict[str, Type[BaseCampingSearch]] = {
-    provider.provider_class.__name__: provider for provider in __search_providers__
+    "RecreationDotGovTicket": "camply.search.search_recreationdotgov:SearchRecreationDotGovTicket",
+    "RecreationDotGovTimedEntry": "camply.search.search_recreationdotgov:SearchRecreationDotGovTimedEntry",
+    "RecreationDotGovDailyTicket": "camply.search.search_recreationdotgov:SearchRecreationDotGovDailyTicket",
+    "RecreationDotGovDailyTimedEntry": "camply.search.search_recreationdotgov:SearchRecreationDotGovDailyTimedEntry",
 }
+
+CAMPSITE_SEARCH_PROVIDER: "LazyRegistry[Type[BaseCampingSearch]]" = LazyRegistry(
+    __search_providers__
+)
+
+__all__ = [
+    "CAMPSITE_SEARCH_PROVIDER",
+    "BaseCampingSearch",
+    "SearchGoingToCamp",
+    "SearchRecreationDotGov",
+    "SearchRecreationDotGovDailyTicket",
+    "SearchRecreationDotGovDailyTimedEntry",
+    "SearchRecreationDotGovTicket",
+    "SearchRecreationDotGovTimedEntry",
+    "SearchAlabamaStateParks",
+    "SearchArizonaStateParks",
+    "SearchFairfaxCountyParks",
+    "SearchFloridaStateParks",
+    "SearchMaricopaCountyParks",
+    "SearchMinnesotaStateParks",
+    "SearchMissouriStateParks",
+    "SearchNorthernTerritory",
+    "SearchOhioStateParks",
+    "SearchOregonMetro",
+    "SearchReserveCalifornia",
+    "SearchVirginiaStateParks",
+    "SearchYellowstone",
+]
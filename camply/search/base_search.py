@@ -12,24 +12,44 @@ from itertools import groupby, islice, tee
 from operator import itemgetter
 from os import getenv
 from time import sleep
-from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Set, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Union,
+)
 
 import pandas as pd
 import tenacity
 from pandas import DataFrame, Series, Timedelta, concat, date_range
 from pydantic.json import pydantic_encoder
 
-from camply.config import CampsiteContainerFields, DataColumns, SearchConfig
+from camply.config import (
+    CampsiteContainerFields,
+    DataColumns,
+    OutboxConfig,
+    SearchConfig,
+)
 from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
 from camply.containers.data_containers import ListedCampsite
 from camply.exceptions import CamplyError, CampsiteNotFoundError
 from camply.notifications.base_notifications import BaseNotifications
 from camply.notifications.multi_provider_notifications import MultiNotifierProvider
-from camply.providers import ProviderType
+from camply.notifications.outbox import NotificationOutbox
 from camply.utils import make_list
 from camply.utils.general_utils import days_of_the_week_base
+from camply.utils.instrumentation import increment, traced
 from camply.utils.logging_utils import get_emoji
 
+if TYPE_CHECKING:
+    from camply.providers import ProviderType
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,7 +95,7 @@ class BaseCampingSearch(ABC):
             Days of the week (by weekday integer) to search for.
         """
         self._verbose = kwargs.get("verbose", True)
-        self.campsite_finder: ProviderType = self.provider_class()
+        self.campsite_finder: "ProviderType" = self.provider_class()
         self.search_window: List[SearchWindow] = make_list(search_window)
         self.days_of_the_week = set(
             days_of_the_week if days_of_the_week is not None else ()
@@ -150,7 +170,7 @@ class BaseCampingSearch(ABC):
 
     @property
     @abstractmethod
-    def provider_class(self) -> ProviderType:
+    def provider_class(self) -> "ProviderType":
         """
         Provider Class Dependency Injection
         """
@@ -201,6 +221,7 @@ class BaseCampingSearch(ABC):
         )
         return intersection
 
+    @traced()
     def _filter_date_overlap(self, campsites: DataFrame) -> pd.DataFrame:
         """
         See whether a campsite should be returned as found
@@ -224,6 +245,7 @@ class BaseCampingSearch(ABC):
         filtered_campsites = campsites[matches].copy().reset_index(drop=True)
         return filtered_campsites
 
+    @traced(name="search", poll=True, expected=(CampsiteNotFoundError,))
     def _search_matching_campsites_available(
         self, log: bool = False, verbose: bool = False, raise_error: bool = False
     ) -> List[AvailableCampsite]:
@@ -252,6 +274,7 @@ class BaseCampingSearch(ABC):
                 ]
             ):
                 matching_campgrounds.append(camp)
+        increment("campsites_matched", len(matching_campgrounds))
         logger.info(
             f"{(get_emoji(matching_campgrounds) + ' ') * 4}{len(matching_campgrounds)} "
             "Reservable Campsites Matching Search Preferences"
@@ -344,7 +367,8 @@ class BaseCampingSearch(ABC):
         polling_interval_minutes = self._get_polling_minutes(
             polling_interval=polling_interval
         )
-        self.notifier = MultiNotifierProvider(provider=notification_provider)
+        if self.notifier is None:
+            self.notifier = self._get_notifier(provider=notification_provider)
         logger.info(
             f"Searching for campsites every {polling_interval_minutes} minutes. "
         )
@@ -365,6 +389,7 @@ class BaseCampingSearch(ABC):
             matching_data=list(new_campsites), log=log, verbose=verbose
         )
         logger.info(f"{len(new_campsites)} New Campsites Found.")
+        increment("campsites_new", len(new_campsites))
         self.campsites_found.update(new_campsites)
         logged_campsites = list(new_campsites)
         self._handle_notifications(
@@ -377,6 +402,7 @@ class BaseCampingSearch(ABC):
         return list(self.campsites_found)
 
     @classmethod
+    @traced(name="notify", poll=True)
     def _handle_notifications(
         cls,
         retryer: tenacity.Retrying,
@@ -526,8 +552,29 @@ class BaseCampingSearch(ABC):
                 sleep(int(polling_interval_minutes) * 60)
             else:
                 continuous_search = False
+        self.notifier.close()
+        self.notifier = None
         return list(self.campsites_found)
 
+    @classmethod
+    def _get_notifier(
+        cls, provider: Union[str, List[str], BaseNotifications, None]
+    ) -> MultiNotifierProvider:
+        """
+        Build the Notifier, Queued Through the Outbox When One is Configured
+
+        Parameters
+        ----------
+        provider: Union[str, List[str], BaseNotifications, None]
+
+        Returns
+        -------
+        MultiNotifierProvider
+        """
+        if OutboxConfig.OUTBOX_PATH is not None:
+            return NotificationOutbox(provider=provider, path=OutboxConfig.OUTBOX_PATH)
+        return MultiNotifierProvider(provider=provider)
+
     def get_matching_campsites(
         self,
         log: bool = True,
@@ -643,6 +690,7 @@ class BaseCampingSearch(ABC):
         return sorted(search_nights)
 
     @classmethod
+    @traced()
     def _consolidate_campsites(
         cls, campsite_df: DataFrame, nights: int
     ) -> pd.DataFrame:
@@ -802,6 +850,7 @@ class BaseCampingSearch(ABC):
         return campsite_df
 
     @staticmethod
+    @traced()
     def df_to_campsites(campsite_df: DataFrame) -> List[AvailableCampsite]:
         """
         Convert Campsite DataFrame to array of AvailableCampsite objects
@@ -4,8 +4,9 @@ Going To Camp API search utilities
 
 import logging
 import sys
-from datetime import datetime, time
-from typing import Any, List, Optional, Union
+from collections import defaultdict
+from datetime import date, datetime, time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from camply.containers import (
     AvailableCampsite,
@@ -13,11 +14,12 @@ from camply.containers import (
     RecreationArea,
     SearchWindow,
 )
+from camply.containers.data_containers import AvailableResource
 from camply.providers import GoingToCamp
 from camply.providers.going_to_camp.going_to_camp_provider import NON_GROUP_EQUIPMENT
 from camply.search.base_search import BaseCampingSearch
 from camply.utils import make_list
-from camply.utils.general_utils import is_list_like
+from camply.utils.concurrency_utils import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -59,9 +61,9 @@ class SearchGoingToCamp(BaseCampingSearch):
         search_window: Union[SearchWindow, List[SearchWindow]]
             Search Window tuple containing start date and End Date
         recreation_area: List[int]
-            The ID of the recreation area to be searched. This type of this is a
-            List[int], but only for compatability with the BaseCampingSeach API.
-            This list is validated to contain a single recreation area.
+            The IDs of the recreation areas to be searched. Each recreation
+            area lives on its own GoingToCamp host, which are searched
+            concurrently.
         weekends_only: bool
             Whether to only search for Camping availabilities on the weekends (Friday /
             Saturday nights)
@@ -78,7 +80,7 @@ class SearchGoingToCamp(BaseCampingSearch):
             **kwargs,
         )
 
-        self._recreation_area_id = self._validate_rec_area(recreation_area)
+        self._recreation_area_ids = self._validate_rec_area(recreation_area)
         self._campgrounds = campgrounds
         self.weekends_only = weekends_only
         assert (
@@ -93,34 +95,38 @@ class SearchGoingToCamp(BaseCampingSearch):
         )
         self.campsites = make_list(campsites)
         self.equipment_id = self._validate_equipment(
-            equipment_id, self._recreation_area_id
+            equipment_id, self._recreation_area_ids
         )
         self.campgrounds = self._get_searchable_campgrounds()
 
     @classmethod
-    def _validate_rec_area(cls, recreation_area: int) -> int:
+    def _validate_rec_area(cls, recreation_area: Union[List[int], int]) -> List[int]:
         if recreation_area in [(), [], None]:
             logger.error("At least one --rec-area must be provided")
             sys.exit(1)
-        if is_list_like(recreation_area) is True and len(recreation_area) > 1:
-            logger.error(
-                "Going To Camp only allows a single recreation area to be searched at a time"
-            )
-            sys.exit(1)
-        return int(make_list(recreation_area)[0])
+        return list(dict.fromkeys(make_list(recreation_area, coerce=int)))
 
     @classmethod
-    def _validate_equipment(cls, equipment_id: Optional[int], rec_area: int):
+    def _validate_equipment(
+        cls, equipment_id: Optional[int], rec_areas: List[int]
+    ) -> Optional[int]:
         if not equipment_id:
             return
 
+        if len(rec_areas) > 1:
+            logger.error(
+                "Equipment IDs are unique to each recreation area, "
+                "--equipment-id can only be used with a single --rec-area"
+            )
+            sys.exit(1)
         try:
             return int(equipment_id)
         except ValueError:
             logger.error(
                 "Invalid equipment ID. Use the follwoing to get list of "
                 "equipment types: "
-                f"`camply equipment-types --provider goingtocamp --rec-area {rec_area}`"
+                "`camply equipment-types --provider goingtocamp "
+                f"--rec-area {rec_areas[0]}`"
             )
             sys.exit(1)
 
@@ -133,81 +139,186 @@ class SearchGoingToCamp(BaseCampingSearch):
         all campsites _within_ a cammpground. Iterating through all sites for
         all campgrounds would likely lead to abuse complaints.
 
+        Overlapping search windows are merged so each campground is only
+        searched once per date range, and each recreation area (host) is
+        searched concurrently.
+
         Returns
         -------
         List[AvailableCampsite]
         """
-        available_sites = []
-        for search_window in self.search_window:
-            current_start_date = search_window.get_current_start_date()
-            for campground in self.campgrounds:
-                sites = self.campsite_finder.list_site_availability(
-                    campground=campground,
-                    start_date=current_start_date,
-                    end_date=search_window.end_date,
-                    equipment_type_id=self.equipment_id,
+        search_ranges = self._merge_search_windows(
+            [
+                (search_window.get_current_start_date(), search_window.end_date)
+                for search_window in self.search_window
+            ]
+        )
+        campgrounds_by_rec_area: Dict[int, List[CampgroundFacility]] = defaultdict(list)
+        for campground in self.campgrounds:
+            campgrounds_by_rec_area[int(campground.recreation_area_id)].append(
+                campground
+            )
+        rec_area_results = run_concurrently(
+            lambda item: self._search_recreation_area(
+                rec_area_id=item[0], campgrounds=item[1], search_ranges=search_ranges
+            ),
+            list(campgrounds_by_rec_area.items()),
+            max_workers=len(campgrounds_by_rec_area),
+        )
+        return [site for sites in rec_area_results for site in sites]
+
+    @classmethod
+    def _merge_search_windows(
+        cls, search_windows: List[Tuple[date, date]]
+    ) -> List[Tuple[Tuple[date, date], List[Tuple[date, date]]]]:
+        """
+        Merge Overlapping Search Windows into Minimal Date Ranges
+
+        Parameters
+        ----------
+        search_windows: List[Tuple[date, date]]
+            (start_date, end_date) of each search window
+
+        Returns
+        -------
+        List[Tuple[Tuple[date, date], List[Tuple[date, date]]]]
+            Each merged (start_date, end_date) range along with the search
+            windows it covers
+        """
+        search_ranges: List[Tuple[Tuple[date, date], List[Tuple[date, date]]]] = []
+        for window_start, window_end in sorted(dict.fromkeys(search_windows)):
+            if search_ranges and window_start < search_ranges[-1][0][1]:
+                (range_start, range_end), windows = search_ranges[-1]
+                search_ranges[-1] = (
+                    (range_start, max(range_end, window_end)),
+                    [*windows, (window_start, window_end)],
                 )
-                for site in sites:
-                    site_details = self.campsite_finder.get_site_details(
-                        self._recreation_area_id, site.resource_id
-                    )
-                    nights = (search_window.end_date - current_start_date).days
-                    start_dt = datetime.combine(current_start_date, time.min)
-                    end_dt = datetime.combine(search_window.end_date, time.min)
-                    (
-                        rec_area_domain_name,
-                        rec_area,
-                    ) = self.campsite_finder.rec_area_lookup(
-                        rec_area_id=self._recreation_area_id
-                    )
-                    booking_url = self.campsite_finder.get_reservation_link(
-                        rec_area_domain_name,
-                        resource_location_id=campground.facility_id,
-                        map_id=site.map_id,
-                        equipment_id=NON_GROUP_EQUIPMENT,
-                        sub_equipment_id=self.equipment_id,
-                        party_size=1,
-                        start_date=current_start_date,
-                        end_date=search_window.end_date,
-                    )
+            else:
+                search_ranges.append(
+                    ((window_start, window_end), [(window_start, window_end)])
+                )
+        return search_ranges
 
-                    # Some rec areas have zero-capacity sites, which should not
-                    # be viable for camping. Skip all zero-capacity sites.
-                    if (
-                        not site_details["minCapacity"]
-                        or not site_details["maxCapacity"]
-                    ):
-                        continue
-
-                    available_sites.append(
-                        AvailableCampsite(
-                            campsite_id=site_details["resourceId"],
-                            campsite_site_name=site_details["localizedValues"][0][
-                                "name"
-                            ],
-                            booking_date=start_dt,
-                            booking_end_date=end_dt,
-                            booking_nights=nights,
-                            campsite_loop_name="Unknown",
-                            campsite_type=site_details["site_attributes"].get(
-                                "Service Type", "Unknown"
-                            ),
-                            campsite_occupancy=(
-                                site_details["minCapacity"],
-                                site_details["maxCapacity"],
-                            ),
-                            campsite_use_type="N/A",
-                            availability_status="Available",
-                            recreation_area=rec_area.recreation_area,
-                            recreation_area_id=self._recreation_area_id,
-                            facility_name=campground.facility_name,
-                            facility_id=campground.facility_id,
-                            booking_url=booking_url,
-                        )
+    def _search_recreation_area(
+        self,
+        rec_area_id: int,
+        campgrounds: List[CampgroundFacility],
+        search_ranges: List[Tuple[Tuple[date, date], List[Tuple[date, date]]]],
+    ) -> List[AvailableCampsite]:
+        """
+        Search every Campground in a Recreation Area across all Date Ranges
+
+        Ranges covering a single search window ask for stays spanning the
+        window, merged ranges ask for nightly availability which is then
+        split back into the individual windows. When the nightly availability
+        doesn't cover the merged range each window is searched on its own.
+
+        Parameters
+        ----------
+        rec_area_id: int
+        campgrounds: List[CampgroundFacility]
+        search_ranges: List[Tuple[Tuple[date, date], List[Tuple[date, date]]]]
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        found: List[Tuple[CampgroundFacility, AvailableResource, date, date]] = []
+        for (range_start, range_end), windows in search_ranges:
+            for campground in campgrounds:
+                nightly_sites = None
+                if len(windows) > 1:
+                    nightly_sites = self.campsite_finder.list_site_daily_availability(
+                        campground=campground,
+                        start_date=range_start,
+                        end_date=range_end,
+                        equipment_type_id=self.equipment_id,
                     )
+                if nightly_sites is None:
+                    found += self._search_windows(campground, windows)
+                    continue
+                for site, nightly in nightly_sites:
+                    for window_start, window_end in windows:
+                        offset = (window_start - range_start).days
+                        nights = (window_end - window_start).days
+                        if all(nightly[offset : offset + nights]):
+                            found.append((campground, site, window_start, window_end))
 
+        sites_details = self.campsite_finder.get_sites_details(
+            rec_area_id, [site.resource_id for _, site, _, _ in found]
+        )
+        rec_area_domain_name, rec_area = self.campsite_finder.rec_area_lookup(
+            rec_area_id=rec_area_id
+        )
+        available_sites = []
+        for campground, site, start_date, end_date in found:
+            site_details = sites_details[site.resource_id]
+            # Some rec areas have zero-capacity sites, which should not
+            # be viable for camping. Skip all zero-capacity sites.
+            if not site_details["minCapacity"] or not site_details["maxCapacity"]:
+                continue
+            booking_url = self.campsite_finder.get_reservation_link(
+                rec_area_domain_name,
+                resource_location_id=campground.facility_id,
+                map_id=site.map_id,
+                equipment_id=NON_GROUP_EQUIPMENT,
+                sub_equipment_id=self.equipment_id,
+                party_size=1,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            available_sites.append(
+                AvailableCampsite(
+                    campsite_id=site_details["resourceId"],
+                    campsite_site_name=site_details["localizedValues"][0]["name"],
+                    booking_date=datetime.combine(start_date, time.min),
+                    booking_end_date=datetime.combine(end_date, time.min),
+                    booking_nights=(end_date - start_date).days,
+                    campsite_loop_name="Unknown",
+                    campsite_type=site_details["site_attributes"].get(
+                        "Service Type", "Unknown"
+                    ),
+                    campsite_occupancy=(
+                        site_details["minCapacity"],
+                        site_details["maxCapacity"],
+                    ),
+                    campsite_use_type="N/A",
+                    availability_status="Available",
+                    recreation_area=rec_area.recreation_area,
+                    recreation_area_id=rec_area_id,
+                    facility_name=campground.facility_name,
+                    facility_id=campground.facility_id,
+                    booking_url=booking_url,
+                )
+            )
         return available_sites
 
+    def _search_windows(
+        self, campground: CampgroundFacility, windows: List[Tuple[date, date]]
+    ) -> List[Tuple[CampgroundFacility, AvailableResource, date, date]]:
+        """
+        Search a Campground for Stays Spanning each Search Window
+
+        Parameters
+        ----------
+        campground: CampgroundFacility
+        windows: List[Tuple[date, date]]
+
+        Returns
+        -------
+        List[Tuple[CampgroundFacility, AvailableResource, date, date]]
+        """
+        found = []
+        for window_start, window_end in windows:
+            sites = self.campsite_finder.list_site_availability(
+                campground=campground,
+                start_date=window_start,
+                end_date=window_end,
+                equipment_type_id=self.equipment_id,
+            )
+            found += [(campground, site, window_start, window_end) for site in sites]
+        return found
+
     def _get_searchable_campgrounds(self) -> List[CampgroundFacility]:
         """
         Return a List of Campgrounds to search
@@ -217,7 +328,7 @@ class SearchGoingToCamp(BaseCampingSearch):
         searchable_campgrounds: List[CampgroundFacility]
             List of searchable campgrounds
         """
-        if self._campgrounds in [(), [], None] or not self._recreation_area_id:
+        if self._campgrounds in [(), [], None] or not self._recreation_area_ids:
             logger.error(
                 "You must provide a Campground and Recreation Area to"
                 " search campsites with this provider"
@@ -240,11 +351,11 @@ class SearchGoingToCamp(BaseCampingSearch):
         """
         if self._campgrounds not in [(), [], None]:
             return self.campsite_finder.find_campgrounds(
-                rec_area_id=self._recreation_area_id, campground_id=self._campgrounds
+                rec_area_id=self._recreation_area_ids, campground_id=self._campgrounds
             )
 
         return self.campsite_finder.find_campgrounds(
-            rec_area_id=self._recreation_area_id,
+            rec_area_id=self._recreation_area_ids,
         )
 
     def list_campsite_units(self) -> Any:
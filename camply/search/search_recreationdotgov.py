@@ -6,7 +6,18 @@ import logging
 from abc import ABC
 from random import uniform
 from time import sleep
-from typing import List, Optional, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
@@ -25,9 +36,12 @@ from camply.providers import (
 )
 from camply.search.base_search import BaseCampingSearch
 from camply.utils import logging_utils, make_list
+from camply.utils.instrumentation import span
 
 logger = logging.getLogger(__name__)
 
+EquipmentCapabilities = FrozenSet[Tuple[str, float]]
+
 
 class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
     """
@@ -111,6 +125,7 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         self.campsite_metadata: Optional[pd.DataFrame] = None
         self.equipment: List[Tuple[str, Optional[int]]] = []
         self.equipment = self._get_searchable_equipment(equipment=equipment)
+        self.equipment_campsite_ids: Optional[Set[int]] = None
 
     def _get_searchable_campgrounds(self) -> List[CampgroundFacility]:
         """
@@ -251,6 +266,17 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
             logger.info(
                 "Metadata fetched for %s campsites", len(self.campsite_metadata)
             )
+        if (
+            self.equipment
+            and self.equipment_campsite_ids is None
+            and "permitted_equipment" in self.campsite_metadata.columns
+        ):
+            self.equipment_campsite_ids = self._fitting_equipment(
+                index=self.build_equipment_index(
+                    keys=self.campsite_metadata.index,
+                    permitted_equipment=self.campsite_metadata["permitted_equipment"],
+                )
+            )
         for index, campground in enumerate(self.campgrounds):
             for month in self.search_months:
                 logger.info(
@@ -283,25 +309,95 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
                     ]
                 found_campsites += campsites
                 if index + 1 < len(self.campgrounds):
-                    sleep(round(uniform(*RecreationBookingConfig.RATE_LIMITING), 2))
+                    with span("rate_limit_wait"):
+                        sleep(round(uniform(*RecreationBookingConfig.RATE_LIMITING), 2))
         campsite_df = self.campsites_to_df(campsites=found_campsites)
-        campsite_df_validated = self._filter_date_overlap(campsites=campsite_df)
-        compiled_campsite_df = self._consolidate_campsites(
-            campsite_df=campsite_df_validated, nights=self.nights
-        )
         equipment_filtered_campsites = self.filter_campsites_to_equipment(
-            campsites=compiled_campsite_df
+            campsites=campsite_df
         )
-        compiled_campsites = self.df_to_campsites(
-            campsite_df=equipment_filtered_campsites
+        campsite_df_validated = self._filter_date_overlap(
+            campsites=equipment_filtered_campsites
         )
+        compiled_campsite_df = self._consolidate_campsites(
+            campsite_df=campsite_df_validated, nights=self.nights
+        )
+        compiled_campsites = self.df_to_campsites(campsite_df=compiled_campsite_df)
 
         return compiled_campsites
 
+    def _normalize_equipment_name(self, equipment_name: str) -> str:
+        """
+        Map a Provider's Equipment Name to the Name Searched For
+        """
+        if self.accepted_equipment == EquipmentOptions.__all_accepted_equipment__:
+            return EquipmentConfig.EQUIPMENT_REVERSE_MAPPING.get(
+                equipment_name, equipment_name.lower()
+            )
+        return equipment_name.lower()
+
+    def build_equipment_index(
+        self,
+        keys: Iterable[Hashable],
+        permitted_equipment: Iterable[Optional[List[Dict[str, Any]]]],
+    ) -> Dict[Hashable, EquipmentCapabilities]:
+        """
+        Index Normalized (Equipment, Max Length) Entries by Campsite
+
+        Parameters
+        ----------
+        keys: Iterable[Hashable]
+            Campsite ID (or row) of each list of permitted equipment, repeated
+            keys are combined
+        permitted_equipment: Iterable[Optional[List[Dict[str, Any]]]]
+            `permitted_equipment` of each campsite
+
+        Returns
+        -------
+        Dict[Hashable, EquipmentCapabilities]
+        """
+        index: Dict[Hashable, Set[Tuple[str, float]]] = {}
+        for key, equipment in zip(keys, permitted_equipment):
+            capabilities = index.setdefault(key, set())
+            if not isinstance(equipment, list):
+                continue
+            capabilities.update(
+                (
+                    self._normalize_equipment_name(item["equipment_name"]),
+                    float(item["max_length"]),
+                )
+                for item in equipment
+            )
+        return {key: frozenset(capabilities) for key, capabilities in index.items()}
+
+    def _fitting_equipment(
+        self, index: Dict[Hashable, EquipmentCapabilities]
+    ) -> Set[Hashable]:
+        """
+        Keys of an Equipment Index that Fit Any of the Searched Equipment
+        """
+        wanted = [
+            (name.lower(), None if length is None else float(length))
+            for name, length in self.equipment
+        ]
+        return {
+            key
+            for key, capabilities in index.items()
+            if any(
+                equipment_name == name and (length is None or max_length >= length)
+                for equipment_name, max_length in capabilities
+                for name, length in wanted
+            )
+        }
+
     def filter_campsites_to_equipment(self, campsites: pd.DataFrame) -> pd.DataFrame:
         """
         Filter a Campsite DataFrame down to specified equipment
 
+        Campsites are matched against `equipment_campsite_ids`, built once
+        from the campsite metadata. Without it (tours and timed entries,
+        whose equipment differs per availability) each row's own
+        `permitted_equipment` is used.
+
         Parameters
         ----------
         campsites: pd.DataFrame
@@ -312,41 +408,17 @@ class SearchRecreationDotGovBase(BaseCampingSearch, ABC):
         """
         if self.equipment is None or len(self.equipment) == 0 or len(campsites) == 0:
             return campsites
-        column_names = ["campsite_id", "permitted_equipment"]
-        exploded_data = campsites[column_names].explode("permitted_equipment")
-        expanded_data = exploded_data["permitted_equipment"].apply(pd.Series)
-        joined_data = pd.DataFrame(
-            pd.concat([exploded_data, expanded_data], axis=1),
-            columns=[*column_names, "equipment_name", "max_length"],
-        )
-        if self.accepted_equipment == EquipmentOptions.__all_accepted_equipment__:
-            joined_data["equipment_name_normalized"] = (
-                joined_data["equipment_name"]
-                .fillna("")
-                .apply(lambda x: EquipmentConfig.EQUIPMENT_REVERSE_MAPPING[x])
-            )
-        else:
-            joined_data["equipment_name_normalized"] = joined_data["equipment_name"]
-        equipment_types = [item[0].lower() for item in self.equipment]
-        matching_equipment = joined_data[
-            joined_data["equipment_name_normalized"].isin(equipment_types)
-        ]
-        matching_ids = []
-        for equipment_name, equipment_length in self.equipment:
-            matching_data = matching_equipment[
-                matching_equipment["equipment_name_normalized"]
-                == equipment_name.lower()
+        if self.equipment_campsite_ids is not None:
+            return campsites[
+                campsites["campsite_id"].isin(self.equipment_campsite_ids)
             ].copy()
-            if equipment_length is not None:
-                matching_data = matching_data[
-                    matching_data["max_length"] >= float(equipment_length)
-                ]
-            matching_ids += list(matching_data["campsite_id"].unique())
-
-        original_campsites = campsites[
-            campsites["campsite_id"].isin(matching_ids)
-        ].copy()
-        return original_campsites
+        matching_rows = self._fitting_equipment(
+            index=self.build_equipment_index(
+                keys=campsites.index,
+                permitted_equipment=campsites["permitted_equipment"],
+            )
+        )
+        return campsites[campsites.index.isin(matching_rows)].copy()
 
     def _get_listable_campsites(
         self, campsites: Union[List[RecDotGovCampsite], List[RecDotGovSearchResult]]
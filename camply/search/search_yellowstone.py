@@ -12,8 +12,10 @@ from camply.config.api_config import YellowstoneConfig
 from camply.containers import AvailableCampsite, RecreationArea, SearchWindow
 from camply.exceptions import SearchError
 from camply.providers import Yellowstone
+from camply.providers.base_provider import ProviderError
 from camply.search.base_search import BaseCampingSearch
 from camply.utils import make_list
+from camply.utils.concurrency_utils import run_concurrently
 from camply.utils.logging_utils import log_sorted_response
 
 logger = logging.getLogger(__name__)
@@ -75,6 +77,10 @@ class SearchYellowstone(BaseCampingSearch):
         """
         Search for all matching campsites in Yellowstone.
 
+        Each month is searched concurrently. A month that fails is skipped
+        and searched again on the next poll. Every request made during the
+        search shares a single retry budget.
+
         Returns
         -------
         List[AvailableCampsite]
@@ -82,11 +88,15 @@ class SearchYellowstone(BaseCampingSearch):
         all_campsites = []
         searchable_campgrounds = self._get_searchable_campgrounds()
         this_month = datetime.now().date().replace(day=1)
-        for month in self.search_months:
-            if month >= this_month:
-                all_campsites += self.campsite_finder.get_monthly_campsites(
-                    month=month, nights=None if self.nights == 1 else self.nights
-                )
+        search_months = [month for month in self.search_months if month >= this_month]
+        self.campsite_finder.start_poll()
+        monthly_campsites = run_concurrently(
+            self._get_monthly_campsites,
+            search_months,
+            max_workers=YellowstoneConfig.MAX_CONCURRENT_REQUESTS,
+        )
+        for campsites in monthly_campsites:
+            all_campsites += campsites
         matching_campsites = self._filter_campsites_to_campgrounds(
             campsites=all_campsites, searchable_campgrounds=searchable_campgrounds
         )
@@ -101,6 +111,29 @@ class SearchYellowstone(BaseCampingSearch):
         compiled_campsites = self.df_to_campsites(campsite_df=compiled_campsite_df)
         return compiled_campsites
 
+    def _get_monthly_campsites(self, month: datetime) -> List[AvailableCampsite]:
+        """
+        Search a Single Month, Skipping it When the API is Failing
+
+        Parameters
+        ----------
+        month: datetime
+
+        Returns
+        -------
+        List[AvailableCampsite]
+        """
+        try:
+            return self.campsite_finder.get_monthly_campsites(
+                month=month, nights=None if self.nights == 1 else self.nights
+            )
+        except ProviderError as pe:
+            logger.warning(
+                f"Skipping Yellowstone search for {month.strftime('%B, %Y')}, "
+                f"it will be retried on the next search: {pe}"
+            )
+            return []
+
     def _get_searchable_campgrounds(self) -> Optional[Set[str]]:
         """
         Return the Campgrounds for the Camping Search
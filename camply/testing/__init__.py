@@ -0,0 +1,16 @@
+"""
+Synthetic Provider Data and Transports for Testing at Scale
+"""
+
+from camply.testing.server import EmulatorConfig, ProviderEmulator
+from camply.testing.synthetic import SyntheticAvailability
+from camply.testing.transport import FakeTransport, fake_transport, route_request
+
+__all__ = [
+    "EmulatorConfig",
+    "ProviderEmulator",
+    "SyntheticAvailability",
+    "FakeTransport",
+    "fake_transport",
+    "route_request",
+]
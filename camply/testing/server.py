@@ -0,0 +1,360 @@
+"""
+Local Provider Emulator: Synthetic Data over Real HTTP
+
+Serves the same routes as `fake_transport` - Recreation.gov month
+availability and campsite search, RIDB facilities and recreation areas,
+UseDirect grid and filters, plus GoingToCamp and Yellowstone - from a local
+HTTP server, with configurable latency, error rates and rate limits. Point
+camply at it with `APIConfig.HOST_OVERRIDES` (`CAMPLY_HOST_OVERRIDES`):
+
+    python -m camply.testing.server --port 8080 --latency 0.2 --error-rate 0.05
+    CAMPLY_HOST_OVERRIDES="*=http://127.0.0.1:8080" camply campsites ...
+"""
+
+import argparse
+import collections
+import json
+import logging
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Counter, Deque, Dict, List, Optional, Tuple
+
+from camply.testing.synthetic import SyntheticAvailability
+from camply.testing.transport import SnapshotCounter, route_request
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class EmulatorConfig:
+    """
+    Failure Conditions of the Emulator
+
+    `error_rate` and `throttle_rate` are the share of requests answered with
+    a 503 and a 429. Once a host gets more than `rate_limit_calls` requests
+    within `rate_limit_period` seconds, the rest are answered with a 429 and
+    a `Retry-After` header too.
+    """
+
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    rate_limit_calls: Optional[int] = None
+    rate_limit_period: float = 1.0
+    retry_after: int = 1
+    seed: Optional[int] = None
+
+
+class _EmulatorHandler(BaseHTTPRequestHandler):
+    """
+    Answer Each Request Through the Emulator That Owns the Server
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: "_EmulatorHTTPServer"
+
+    def do_GET(self) -> None:
+        """
+        Answer a GET Request
+        """
+        self._respond()
+
+    def do_POST(self) -> None:
+        """
+        Answer a POST Request
+        """
+        self._respond()
+
+    def _respond(self) -> None:
+        """
+        Run the Request Through the Emulator and Write its Response
+        """
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        host = self.headers.get("X-Forwarded-Host") or self.headers.get("Host", "")
+        status_code, payload, headers = self.server.emulator.handle(
+            method=self.command, host=host, path=self.path, body=body
+        )
+        content = json.dumps(payload).encode("utf-8")
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, message: str, *args: Any) -> None:
+        """
+        Log Requests at DEBUG Level Instead of to stderr
+        """
+        logger.debug("%s - %s", self.address_string(), message % args)
+
+
+class _EmulatorHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP Server Holding a Reference to its Emulator
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], emulator: "ProviderEmulator") -> None:
+        """
+        Bind the Server
+        """
+        super().__init__(address, _EmulatorHandler)
+        self.emulator = emulator
+
+
+class ProviderEmulator:
+    """
+    Local HTTP Server Answering Provider Requests with Synthetic Data
+
+    Use it as a context manager, or `start` and `stop` it. Requests are
+    answered on `url`, the host they were meant for comes from the
+    `X-Forwarded-Host` header `HostOverrideAdapter` adds.
+    """
+
+    def __init__(
+        self,
+        synthetic: Optional[SyntheticAvailability] = None,
+        config: Optional[EmulatorConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        """
+        Initialize the Emulator
+
+        Parameters
+        ----------
+        synthetic: Optional[SyntheticAvailability]
+            Generator to answer with, defaults to `SyntheticAvailability()`
+        config: Optional[EmulatorConfig]
+            Latency, error rates and rate limits, defaults to none of them
+        host: str
+        port: int
+            Port to listen on, 0 picks a free one
+        """
+        self.synthetic = synthetic if synthetic is not None else SyntheticAvailability()
+        self.config = config if config is not None else EmulatorConfig()
+        self.status_codes: Counter[int] = collections.Counter()
+        self.snapshots = SnapshotCounter()
+        self._random = random.Random(self.config.seed)
+        self._request_times: Dict[str, Deque[float]] = collections.defaultdict(
+            collections.deque
+        )
+        self._lock = threading.Lock()
+        self._server = _EmulatorHTTPServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {self.url}>"
+
+    def __enter__(self) -> "ProviderEmulator":
+        """
+        Start Serving
+        """
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """
+        Stop Serving
+        """
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL the Emulator is Serving on
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def host_overrides(self) -> Dict[str, str]:
+        """
+        `APIConfig.HOST_OVERRIDES` Sending Every Provider Request Here
+        """
+        return {"*": self.url}
+
+    def start(self) -> "ProviderEmulator":
+        """
+        Serve Requests in a Background Thread
+
+        Returns
+        -------
+        ProviderEmulator
+        """
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="camply-emulator", daemon=True
+        )
+        self._thread.start()
+        logger.info("Provider Emulator Serving on %s", self.url)
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop Serving and Release the Port
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def _rate_limited(self, host: str) -> bool:
+        """
+        Record a Request to a Host, Returning Whether it's Over the Rate Limit
+        """
+        if self.config.rate_limit_calls is None:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            request_times = self._request_times[host]
+            while (
+                request_times
+                and now - request_times[0] >= self.config.rate_limit_period
+            ):
+                request_times.popleft()
+            if len(request_times) >= self.config.rate_limit_calls:
+                return True
+            request_times.append(now)
+            return False
+
+    def _failure(self, host: str) -> Optional[HTTPStatus]:
+        """
+        Status Code of an Injected Failure, None When the Request Goes Through
+        """
+        if self._rate_limited(host):
+            return HTTPStatus.TOO_MANY_REQUESTS
+        with self._lock:
+            draw = self._random.random()
+        if draw < self.config.error_rate:
+            return HTTPStatus.SERVICE_UNAVAILABLE
+        if draw < self.config.error_rate + self.config.throttle_rate:
+            return HTTPStatus.TOO_MANY_REQUESTS
+        return None
+
+    def handle(
+        self, method: str, host: str, path: str, body: Optional[bytes] = None
+    ) -> Tuple[int, Any, Dict[str, str]]:
+        """
+        Answer a Request
+
+        Parameters
+        ----------
+        method: str
+        host: str
+            Host the request was meant for
+        path: str
+            Path and query string
+        body: Optional[bytes]
+
+        Returns
+        -------
+        Tuple[int, Any, Dict[str, str]]
+            Status code, JSON payload and extra response headers
+        """
+        delay = self.config.latency
+        if self.config.latency_jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.config.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+        headers: Dict[str, str] = {}
+        failure = self._failure(host)
+        if failure is not None:
+            status_code, payload = failure, {"error": failure.phrase}
+            if failure == HTTPStatus.TOO_MANY_REQUESTS:
+                headers["Retry-After"] = str(self.config.retry_after)
+        else:
+            url = f"https://{host}{path}"
+            status_code, payload = route_request(
+                synthetic=self.synthetic,
+                method=method,
+                url=url,
+                body=body,
+                snapshot=self.snapshots.next(method, url, body),
+            )
+        with self._lock:
+            self.status_codes[int(status_code)] += 1
+        return int(status_code), payload, headers
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    """
+    Run the Emulator Until Interrupted
+
+    Parameters
+    ----------
+    args: Optional[List[str]]
+        Command line arguments, defaults to `sys.argv`
+
+    Returns
+    -------
+    int
+        Exit code
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m camply.testing.server", description=__doc__.strip()
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--campgrounds", type=int, default=10)
+    parser.add_argument("--sites", type=int, default=50)
+    parser.add_argument("--density", type=float, default=0.3)
+    parser.add_argument("--churn", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--latency-jitter", type=float, default=0.0, help="Seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 503s")
+    parser.add_argument(
+        "--throttle-rate", type=float, default=0.0, help="Share of 429s"
+    )
+    parser.add_argument(
+        "--rate-limit", type=int, default=None, help="Requests per host per period"
+    )
+    parser.add_argument("--rate-limit-period", type=float, default=1.0)
+    options = parser.parse_args(args)
+    logging.basicConfig(level=logging.INFO)
+    emulator = ProviderEmulator(
+        synthetic=SyntheticAvailability(
+            campgrounds=options.campgrounds,
+            sites=options.sites,
+            density=options.density,
+            churn=options.churn,
+            seed=options.seed,
+        ),
+        config=EmulatorConfig(
+            latency=options.latency,
+            latency_jitter=options.latency_jitter,
+            error_rate=options.error_rate,
+            throttle_rate=options.throttle_rate,
+            rate_limit_calls=options.rate_limit,
+            rate_limit_period=options.rate_limit_period,
+            seed=options.seed,
+        ),
+        host=options.host,
+        port=options.port,
+    )
+    with emulator:
+        print(f'CAMPLY_HOST_OVERRIDES="*={emulator.url}"', flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+    logger.info("Responses by status code: %s", dict(emulator.status_codes))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
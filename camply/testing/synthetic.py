@@ -0,0 +1,974 @@
+"""
+Synthetic Availability: Provider Payloads at Any Scale
+
+Every payload is derived from a seed, so the same generator always produces
+the same data, and can be validated against the API response containers the
+providers parse them with.
+"""
+
+import datetime
+import hashlib
+import math
+from typing import Any, Dict, Hashable, List, Optional
+
+from camply.config.api_config import RIDBConfig, YellowstoneConfig
+from camply.providers.going_to_camp.going_to_camp_provider import (
+    CAMP_SITE,
+    NON_GROUP_EQUIPMENT,
+)
+
+
+class SyntheticAvailability:
+    """
+    Deterministic Campground Availability Across Every Provider
+
+    Campgrounds are numbered from `FACILITY_ID_OFFSET` and grouped into
+    recreation areas of `CAMPGROUNDS_PER_REC_AREA`, numbered from 1. Each
+    campground has `sites` campsites whose IDs are the facility ID times
+    `SITE_ID_MULTIPLIER` plus the site number. The same IDs are used for
+    every provider, so campground 1000 / recreation area 1 exists on
+    Recreation.gov, every UseDirect provider and every GoingToCamp host.
+
+    Availability is decided per campsite and night: `density` is the share
+    of nights that are available and `churn` the share of nights that are
+    drawn again between one snapshot (poll) and the next.
+    """
+
+    FACILITY_ID_OFFSET: int = 1_000
+    CAMPGROUNDS_PER_REC_AREA: int = 10
+    SITE_ID_MULTIPLIER: int = 1_000
+    GOING_TO_CAMP_SITES_PER_MAP: int = 50
+    GOING_TO_CAMP_MAP_MULTIPLIER: int = 100
+    GOING_TO_CAMP_SERVICE_TYPE_ID: int = -32000
+
+    STATE_CODES: List[str] = ["CA", "OR", "WA", "AZ", "CO", "UT"]
+    CAMPSITE_TYPES: List[str] = [
+        "STANDARD NONELECTRIC",
+        "STANDARD ELECTRIC",
+        "TENT ONLY NONELECTRIC",
+        "RV NONELECTRIC",
+    ]
+    CAMPSITE_EQUIPMENT: Dict[str, List[str]] = {
+        "STANDARD NONELECTRIC": ["Tent", "RV", "Trailer"],
+        "STANDARD ELECTRIC": ["Tent", "RV", "Trailer"],
+        "TENT ONLY NONELECTRIC": ["Tent"],
+        "RV NONELECTRIC": ["RV", "Trailer"],
+    }
+    UNIT_TYPE_GROUPS: List[str] = ["Campsite", "Group Campsite", "Cabin"]
+    PRICE: int = 33
+
+    def __init__(
+        self,
+        campgrounds: int = 10,
+        sites: int = 50,
+        density: float = 0.3,
+        churn: float = 0.05,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the Generator
+
+        Parameters
+        ----------
+        campgrounds: int
+            Number of campgrounds
+        sites: int
+            Campsites per campground (also rooms per Yellowstone campground)
+        density: float
+            Share of campsite nights that are available, between 0 and 1
+        churn: float
+            Share of campsite nights drawn again with each snapshot, between 0 and 1
+        seed: int
+            Seed every payload is derived from
+        """
+        if campgrounds < 1:
+            raise ValueError("There must be at least one campground")
+        if not 1 <= sites < self.SITE_ID_MULTIPLIER:
+            raise ValueError(
+                f"Campgrounds must have between 1 and {self.SITE_ID_MULTIPLIER - 1} sites"
+            )
+        if not 0 <= density <= 1 or not 0 <= churn <= 1:
+            raise ValueError("`density` and `churn` must be between 0 and 1")
+        self.campgrounds = campgrounds
+        self.sites = sites
+        self.density = density
+        self.churn = churn
+        self.seed = seed
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return (
+            f"<{self.__class__.__name__}: {self.campgrounds} campgrounds x "
+            f"{self.sites} sites, density={self.density}, churn={self.churn}>"
+        )
+
+    # ----------------------------------------------------------------------
+    # Availability
+    # ----------------------------------------------------------------------
+
+    def _fraction(self, *keys: Hashable) -> float:
+        """
+        Deterministic Number in [0, 1) for a Set of Keys
+        """
+        digest = hashlib.blake2b(
+            repr((self.seed, *keys)).encode("utf-8"), digest_size=8
+        ).digest()
+        return int.from_bytes(digest, "big") / 2**64
+
+    def is_available(
+        self, campsite: Hashable, night: datetime.date, snapshot: int = 0
+    ) -> bool:
+        """
+        Whether a Campsite is Available on a Night
+
+        Each campsite night has a random phase, its availability is drawn
+        again every time `snapshot * churn + phase` crosses an integer - on
+        average `churn` of all campsite nights between consecutive snapshots.
+
+        Parameters
+        ----------
+        campsite: Hashable
+            Campsite ID (or any key identifying a campsite)
+        night: datetime.date
+        snapshot: int
+            Poll number, availability churns from one snapshot to the next
+
+        Returns
+        -------
+        bool
+        """
+        ordinal = night.toordinal()
+        phase = self._fraction("phase", campsite, ordinal)
+        epoch = math.floor(snapshot * self.churn + phase)
+        return self._fraction("available", campsite, ordinal, epoch) < self.density
+
+    @classmethod
+    def nights(
+        cls, start_date: datetime.date, end_date: datetime.date
+    ) -> List[datetime.date]:
+        """
+        Every Night from `start_date` up to (Excluding) `end_date`
+        """
+        return [
+            start_date + datetime.timedelta(days=offset)
+            for offset in range((end_date - start_date).days)
+        ]
+
+    @classmethod
+    def _month_nights(cls, month: datetime.date) -> List[datetime.date]:
+        """
+        Every Night in a Month
+        """
+        start = month.replace(day=1)
+        end = (start + datetime.timedelta(days=32)).replace(day=1)
+        return cls.nights(start, end)
+
+    # ----------------------------------------------------------------------
+    # Campgrounds and Campsites
+    # ----------------------------------------------------------------------
+
+    @property
+    def facility_ids(self) -> List[int]:
+        """
+        Every Campground's Facility ID
+        """
+        return list(
+            range(self.FACILITY_ID_OFFSET, self.FACILITY_ID_OFFSET + self.campgrounds)
+        )
+
+    @property
+    def rec_area_ids(self) -> List[int]:
+        """
+        Every Recreation Area ID
+        """
+        return list(
+            range(1, math.ceil(self.campgrounds / self.CAMPGROUNDS_PER_REC_AREA) + 1)
+        )
+
+    def _facility_index(self, facility_id: Any) -> int:
+        """
+        Position of a Campground, Raising a KeyError for Unknown Campgrounds
+        """
+        index = int(facility_id) - self.FACILITY_ID_OFFSET
+        if not 0 <= index < self.campgrounds:
+            raise KeyError(f"Campground #{facility_id} not found")
+        return index
+
+    def rec_area_id(self, facility_id: Any) -> int:
+        """
+        Recreation Area a Campground Belongs to
+        """
+        return self._facility_index(facility_id) // self.CAMPGROUNDS_PER_REC_AREA + 1
+
+    def rec_area_facility_ids(self, rec_area_id: Any) -> List[int]:
+        """
+        Facility IDs of Every Campground in a Recreation Area
+        """
+        if int(rec_area_id) not in self.rec_area_ids:
+            raise KeyError(f"Recreation Area #{rec_area_id} not found")
+        return [
+            facility_id
+            for facility_id in self.facility_ids
+            if self.rec_area_id(facility_id) == int(rec_area_id)
+        ]
+
+    def rec_area_name(self, rec_area_id: Any) -> str:
+        """
+        Name of a Recreation Area
+        """
+        return f"Synthetic Recreation Area {rec_area_id}"
+
+    def state_code(self, rec_area_id: Any) -> str:
+        """
+        State a Recreation Area is In
+        """
+        return self.STATE_CODES[int(rec_area_id) % len(self.STATE_CODES)]
+
+    def facility_name(self, facility_id: Any) -> str:
+        """
+        Name of a Campground
+        """
+        return f"Synthetic Campground {self._facility_index(facility_id)}"
+
+    def campsite_ids(self, facility_id: Any) -> List[int]:
+        """
+        Campsite IDs of a Campground
+        """
+        self._facility_index(facility_id)
+        first = int(facility_id) * self.SITE_ID_MULTIPLIER
+        return list(range(first, first + self.sites))
+
+    def _campsite_facility_id(self, campsite_id: Any) -> int:
+        """
+        Campground a Campsite Belongs to, Raising a KeyError for Unknown Campsites
+        """
+        facility_id, site = divmod(int(campsite_id), self.SITE_ID_MULTIPLIER)
+        self._facility_index(facility_id)
+        if site >= self.sites:
+            raise KeyError(f"Campsite #{campsite_id} not found")
+        return facility_id
+
+    def campsite_details(self, campsite_id: int) -> Dict[str, Any]:
+        """
+        Static Details of a Campsite
+        """
+        site = int(campsite_id) % self.SITE_ID_MULTIPLIER
+        campsite_type = self.CAMPSITE_TYPES[site % len(self.CAMPSITE_TYPES)]
+        return {
+            "site": f"{site:03d}",
+            "loop": f"Loop {chr(ord('A') + site % 5)}",
+            "campsite_type": campsite_type,
+            "equipment": self.CAMPSITE_EQUIPMENT[campsite_type],
+            "max_length": float(20 + 5 * (site % 6)),
+            "max_num_people": 4 + 2 * (site % 3),
+        }
+
+    # ----------------------------------------------------------------------
+    # Recreation.gov and RIDB
+    # ----------------------------------------------------------------------
+
+    def recdotgov_month(
+        self, facility_id: Any, month: datetime.date, snapshot: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Monthly Campground Availability - `CampsiteAvailabilityResponse`
+
+        /api/camps/availability/campground/<FACILITY ID>/month
+        """
+        nights = self._month_nights(month)
+        campsites = {}
+        for campsite_id in self.campsite_ids(facility_id):
+            details = self.campsite_details(campsite_id)
+            campsites[str(campsite_id)] = {
+                "availabilities": {
+                    f"{night.isoformat()}T00:00:00Z": "Available"
+                    if self.is_available(campsite_id, night, snapshot)
+                    else "Reserved"
+                    for night in nights
+                },
+                "campsite_id": str(campsite_id),
+                "campsite_reserve_type": "Site-Specific",
+                "campsite_type": details["campsite_type"],
+                "loop": details["loop"],
+                "max_num_people": details["max_num_people"],
+                "min_num_people": 1,
+                "site": details["site"],
+                "type_of_use": "Overnight",
+            }
+        return {"campsites": campsites}
+
+    def recdotgov_campsites(
+        self, facility_id: Any, start: int = 0, size: int = 1000
+    ) -> Dict[str, Any]:
+        """
+        A Page of Campsite Metadata - `RecDotGovCampsiteResponse`
+
+        /api/search/campsites?fq=asset_id:<FACILITY ID>
+        """
+        rec_area_id = self.rec_area_id(facility_id)
+        campsite_ids = self.campsite_ids(facility_id)
+        page = campsite_ids[start : start + size]
+        campsites = []
+        for campsite_id in page:
+            details = self.campsite_details(campsite_id)
+            campsites.append(
+                {
+                    "accessible": campsite_id % 10 == 0,
+                    "asset_id": int(facility_id),
+                    "attributes": [
+                        {
+                            "attribute_category": "site_details",
+                            "attribute_id": 52,
+                            "attribute_name": "Max Num of People",
+                            "attribute_value": str(details["max_num_people"]),
+                        }
+                    ],
+                    "average_rating": None,
+                    "campsite_id": campsite_id,
+                    "campsite_reserve_type": "Site-Specific",
+                    "city": None,
+                    "country_code": "USA",
+                    "fee_templates": {},
+                    "latitude": 40.0 + rec_area_id / 100,
+                    "longitude": -110.0 - int(facility_id) / 10_000,
+                    "loop": details["loop"],
+                    "name": details["site"],
+                    "org_id": 1,
+                    "org_name": "Synthetic Parks Service",
+                    "parent_asset_id": int(facility_id),
+                    "parent_asset_name": self.facility_name(facility_id).upper(),
+                    "parent_asset_type": "Campground",
+                    "permitted_equipment": [
+                        {
+                            "equipment_name": equipment,
+                            "max_length": details["max_length"],
+                        }
+                        for equipment in details["equipment"]
+                    ],
+                    "preview_image_url": None,
+                    "reservable": True,
+                    "state_code": self.state_code(rec_area_id),
+                    "type": details["campsite_type"],
+                    "type_of_use": "Overnight",
+                }
+            )
+        return {
+            "campsites": campsites,
+            "size": len(campsites),
+            "spelling_autocorrected": None,
+            "start": start,
+            "total": len(campsite_ids),
+        }
+
+    def ridb_facility(self, facility_id: Any) -> Dict[str, Any]:
+        """
+        A Campground - `FacilityResponse`
+
+        /api/v1/facilities/<FACILITY ID>
+        """
+        rec_area_id = self.rec_area_id(facility_id)
+        return {
+            "FacilityID": str(facility_id),
+            "FacilityName": self.facility_name(facility_id).upper(),
+            "FacilityTypeDescription": RIDBConfig.CAMPGROUND_FACILITY_FIELD_QUALIFIER,
+            "Enabled": True,
+            "Reservable": True,
+            "FACILITYADDRESS": [{"AddressStateCode": self.state_code(rec_area_id)}],
+            "RECAREA": [
+                {
+                    "RecAreaID": str(rec_area_id),
+                    "RecAreaName": self.rec_area_name(rec_area_id),
+                }
+            ],
+            "ORGANIZATION": [{"OrgName": "Synthetic Parks Service", "OrgID": 1}],
+            "ACTIVITY": [{"ActivityID": 9, "ActivityName": "CAMPING"}],
+            "ParentRecAreaID": str(rec_area_id),
+            "LastUpdatedDate": "2023-01-01",
+        }
+
+    def ridb_rec_area(self, rec_area_id: Any) -> Dict[str, Any]:
+        """
+        A Recreation Area - `RecreationAreaResponse`
+
+        /api/v1/recareas/<REC AREA ID>
+        """
+        if int(rec_area_id) not in self.rec_area_ids:
+            raise KeyError(f"Recreation Area #{rec_area_id} not found")
+        return {
+            "RecAreaID": str(rec_area_id),
+            "RecAreaName": self.rec_area_name(rec_area_id),
+            "RECAREAADDRESS": [{"AddressStateCode": self.state_code(rec_area_id)}],
+            "LastUpdatedDate": "2023-01-01",
+        }
+
+    def ridb_campsite(self, campsite_id: Any) -> List[Dict[str, Any]]:
+        """
+        A Campsite - a List of One `CampsiteResponse`
+
+        /api/v1/campsites/<CAMPSITE ID>
+        """
+        facility_id = self._campsite_facility_id(campsite_id)
+        details = self.campsite_details(int(campsite_id))
+        return [
+            {
+                "CampsiteID": int(campsite_id),
+                "FacilityID": facility_id,
+                "CampsiteName": details["site"],
+                "CampsiteType": details["campsite_type"],
+                "TypeOfUse": "Overnight",
+                "Loop": details["loop"],
+                "CampsiteAccessible": int(campsite_id) % 10 == 0,
+                "CampsiteReservable": True,
+                "CampsiteLongitude": -110.0,
+                "CampsiteLatitude": 40.0,
+                "CreatedDate": "2023-01-01",
+                "LastUpdatedDate": "2023-01-01",
+                "PERMITTEDEQUIPMENT": [
+                    {"EquipmentName": equipment, "MaxLength": details["max_length"]}
+                    for equipment in details["equipment"]
+                ],
+                "ATTRIBUTES": [],
+            }
+        ]
+
+    @classmethod
+    def ridb_page(
+        cls, records: List[Dict[str, Any]], offset: int = 0, limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        A Page of RIDB Records - `GenericResponse`
+        """
+        page = records[offset : offset + limit]
+        return {
+            "RECDATA": page,
+            "METADATA": {
+                "RESULTS": {"CURRENT_COUNT": len(page), "TOTAL_COUNT": len(records)},
+                "SEARCH_PARAMETERS": {"OFFSET": offset, "LIMIT": limit},
+            },
+        }
+
+    def ridb_facilities(
+        self,
+        rec_area_id: Optional[Any] = None,
+        query: Optional[str] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        A Page of Campgrounds - `GenericResponse` of `FacilityResponse`
+
+        /api/v1/facilities and /api/v1/recareas/<REC AREA ID>/facilities
+        """
+        facility_ids = (
+            self.facility_ids
+            if rec_area_id is None
+            else self.rec_area_facility_ids(rec_area_id)
+        )
+        facilities = [self.ridb_facility(facility_id) for facility_id in facility_ids]
+        if query:
+            facilities = [
+                facility
+                for facility in facilities
+                if query.lower() in facility["FacilityName"].lower()
+            ]
+        return self.ridb_page(records=facilities, offset=offset, limit=limit)
+
+    def ridb_rec_areas(
+        self, query: Optional[str] = None, offset: int = 0, limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        A Page of Recreation Areas - `GenericResponse` of `RecreationAreaResponse`
+
+        /api/v1/recareas
+        """
+        rec_areas = [
+            self.ridb_rec_area(rec_area_id) for rec_area_id in self.rec_area_ids
+        ]
+        if query:
+            rec_areas = [
+                rec_area
+                for rec_area in rec_areas
+                if query.lower() in rec_area["RecAreaName"].lower()
+            ]
+        return self.ridb_page(records=rec_areas, offset=offset, limit=limit)
+
+    # ----------------------------------------------------------------------
+    # UseDirect
+    # ----------------------------------------------------------------------
+
+    def usedirect_filters(self) -> Dict[str, Any]:
+        """
+        Campground Metadata - `UseDirectMetadata`
+
+        /rdr/rdr/search/filters
+        """
+        return {
+            "Message": "",
+            "UnitCategories": [
+                {"UnitCategoryId": index, "UnitCategoryName": campsite_type.title()}
+                for index, campsite_type in enumerate(self.CAMPSITE_TYPES, start=1)
+            ],
+            "UnitTypesGroups": [
+                {
+                    "UnitCategoryId": 1,
+                    "UnitTypesGroupId": index,
+                    "UnitTypesGroupName": group,
+                }
+                for index, group in enumerate(self.UNIT_TYPE_GROUPS, start=1)
+            ],
+        }
+
+    def usedirect_city_parks(self) -> Dict[str, Dict[str, Any]]:
+        """
+        City Parks by ID - `UseDirectCityPark`
+
+        /rdr/rdr/fd/citypark
+        """
+        return {
+            str(rec_area_id): {
+                "CityParkId": rec_area_id,
+                "Name": self.rec_area_name(rec_area_id),
+                "Latitude": 40.0 + rec_area_id / 100,
+                "Longitude": -110.0,
+                "IsActive": True,
+                "EntityType": "Park",
+                "PlaceId": rec_area_id,
+            }
+            for rec_area_id in self.rec_area_ids
+        }
+
+    def usedirect_places(self) -> List[Dict[str, Any]]:
+        """
+        Every Place - `UseDirectDetailedPlace`
+
+        /rdr/rdr/fd/places
+        """
+        return [
+            {
+                "PlaceId": rec_area_id,
+                "Name": self.rec_area_name(rec_area_id),
+                "Description": self.rec_area_name(rec_area_id),
+                "City": "Synthetic City",
+                "State": self.state_code(rec_area_id),
+                "UDate": "2023-01-01T00:00:00",
+            }
+            for rec_area_id in self.rec_area_ids
+        ]
+
+    def usedirect_facilities(self) -> List[Dict[str, Any]]:
+        """
+        Every Facility - `UseDirectFacilityMetadata`
+
+        /rdr/rdr/fd/facilities
+        """
+        return [
+            {
+                "FacilityId": facility_id,
+                "PlaceId": self.rec_area_id(facility_id),
+                "Name": self.facility_name(facility_id),
+            }
+            for facility_id in self.facility_ids
+        ]
+
+    def usedirect_grid(
+        self,
+        facility_id: Any,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        snapshot: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Availability Grid from `start_date` to `end_date` (Inclusive) - `UseDirectAvailabilityResponse`
+
+        /rdr/rdr/search/grid
+        """
+        nights = self.nights(start_date, end_date + datetime.timedelta(days=1))
+        units = {}
+        for campsite_id in self.campsite_ids(facility_id):
+            details = self.campsite_details(campsite_id)
+            site = campsite_id % self.SITE_ID_MULTIPLIER
+            units[str(campsite_id)] = {
+                "UnitId": campsite_id,
+                "Name": f"Campsite #{details['site']}",
+                "ShortName": details["site"],
+                "IsAda": campsite_id % 10 == 0,
+                "AllowWebBooking": True,
+                "IsWebViewable": True,
+                "UnitCategoryId": self.CAMPSITE_TYPES.index(details["campsite_type"])
+                + 1,
+                "UnitTypeGroupId": site % len(self.UNIT_TYPE_GROUPS) + 1,
+                "VehicleLength": int(details["max_length"]),
+                "OrderBy": site,
+                "Slices": {
+                    f"{night.isoformat()}T00:00:00": {
+                        "Date": night.isoformat(),
+                        "IsFree": self.is_available(campsite_id, night, snapshot),
+                        "IsBlocked": False,
+                        "IsWalkin": False,
+                        "ReservationId": 0,
+                        "Lock": None,
+                        "MinStay": 1,
+                    }
+                    for night in nights
+                },
+            }
+        return {
+            "Message": "",
+            "UnitTypeId": 0,
+            "StartDate": start_date.isoformat(),
+            "EndDate": end_date.isoformat(),
+            "NightsRequested": len(nights),
+            "NightsActual": len(nights),
+            "Facility": {
+                "FacilityId": int(facility_id),
+                "Name": self.facility_name(facility_id),
+                "Latitude": 40.0,
+                "Longitude": -110.0,
+                "UnitCount": len(units),
+                "Units": units,
+            },
+        }
+
+    # ----------------------------------------------------------------------
+    # GoingToCamp
+    # ----------------------------------------------------------------------
+
+    def going_to_camp_map_ids(self, facility_id: Any) -> List[int]:
+        """
+        Child Map IDs of a Campground, Each Holding a Slice of its Sites
+        """
+        root_map_id = self.going_to_camp_root_map_id(facility_id)
+        child_maps = math.ceil(self.sites / self.GOING_TO_CAMP_SITES_PER_MAP)
+        return [root_map_id + offset for offset in range(1, child_maps + 1)]
+
+    def going_to_camp_root_map_id(self, facility_id: Any) -> int:
+        """
+        Root Map ID of a Campground
+        """
+        self._facility_index(facility_id)
+        return int(facility_id) * self.GOING_TO_CAMP_MAP_MULTIPLIER
+
+    def going_to_camp_resource_locations(
+        self, rec_area_id: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Campgrounds in a Recreation Area
+
+        /api/resourceLocation
+        """
+        return [
+            {
+                "resourceLocationId": facility_id,
+                "localizedValues": [
+                    {
+                        "cultureName": "en-US",
+                        "shortName": self.facility_name(facility_id),
+                        "fullName": self.facility_name(facility_id),
+                        "description": "",
+                    }
+                ],
+                "region": self.state_code(rec_area_id),
+                "resourceCategoryIds": [CAMP_SITE],
+            }
+            for facility_id in self.rec_area_facility_ids(rec_area_id)
+        ]
+
+    def going_to_camp_maps(self, rec_area_id: Any) -> List[Dict[str, Any]]:
+        """
+        Root Maps of Every Campground in a Recreation Area
+
+        /api/maps
+        """
+        return [
+            {
+                "mapId": self.going_to_camp_root_map_id(facility_id),
+                "resourceLocationId": facility_id,
+                "isResourceLocationRootMap": True,
+                "localizedValues": [
+                    {"cultureName": "en-US", "title": self.facility_name(facility_id)}
+                ],
+            }
+            for facility_id in self.rec_area_facility_ids(rec_area_id)
+        ]
+
+    def going_to_camp_map(
+        self,
+        map_id: Any,
+        start_date: datetime.date,
+        end_date: datetime.date,
+        daily: bool = False,
+        snapshot: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Availability of a Map - Links to Child Maps or Sites
+
+        Sites have one entry per night when `daily`, otherwise a single entry
+        for the whole stay. An availability of 0 means available.
+
+        /api/availability/map
+        """
+        facility_id, offset = divmod(int(map_id), self.GOING_TO_CAMP_MAP_MULTIPLIER)
+        child_map_ids = self.going_to_camp_map_ids(facility_id)
+        if offset == 0:
+            return {
+                "mapId": int(map_id),
+                "mapAvailabilities": [0],
+                "resourceAvailabilities": {},
+                "mapLinkAvailabilities": {str(child): [0] for child in child_map_ids},
+            }
+        if int(map_id) not in child_map_ids:
+            raise KeyError(f"Map #{map_id} not found")
+        first_site = (offset - 1) * self.GOING_TO_CAMP_SITES_PER_MAP
+        campsite_ids = self.campsite_ids(facility_id)[
+            first_site : first_site + self.GOING_TO_CAMP_SITES_PER_MAP
+        ]
+        nights = self.nights(start_date, end_date)
+        resources = {}
+        for campsite_id in campsite_ids:
+            nightly = [
+                self.is_available(campsite_id, night, snapshot) for night in nights
+            ]
+            if daily is False:
+                nightly = [all(nightly)]
+            resources[str(campsite_id)] = [
+                {"availability": 0 if available else 1, "remainingQuota": None}
+                for available in nightly
+            ]
+        return {
+            "mapId": int(map_id),
+            "mapAvailabilities": [0],
+            "resourceAvailabilities": resources,
+            "mapLinkAvailabilities": {},
+        }
+
+    def going_to_camp_attributes(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Filterable Attribute Definitions
+
+        /api/attribute/filterable
+        """
+        return {
+            str(self.GOING_TO_CAMP_SERVICE_TYPE_ID): {
+                "attributeDefinitionId": self.GOING_TO_CAMP_SERVICE_TYPE_ID,
+                "localizedValues": [
+                    {"displayName": "Service Type", "cultureName": "en-US"}
+                ],
+                "values": [
+                    {
+                        "enumValue": index,
+                        "localizedValues": [
+                            {
+                                "displayName": campsite_type.title(),
+                                "cultureName": "en-US",
+                            }
+                        ],
+                    }
+                    for index, campsite_type in enumerate(self.CAMPSITE_TYPES)
+                ],
+            }
+        }
+
+    def going_to_camp_site_details(self, resource_id: Any) -> Dict[str, Any]:
+        """
+        Details of a Site
+
+        /api/resource/details?resourceId=<CAMPSITE ID>
+        """
+        facility_id = self._campsite_facility_id(resource_id)
+        details = self.campsite_details(int(resource_id))
+        site = int(resource_id) % self.SITE_ID_MULTIPLIER
+        return {
+            "resourceId": int(resource_id),
+            "resourceCategoryId": CAMP_SITE,
+            "resourceLocationId": facility_id,
+            "localizedValues": [
+                {"cultureName": "en-US", "name": details["site"], "description": ""}
+            ],
+            "definedAttributes": [
+                {
+                    "values": [self.CAMPSITE_TYPES.index(details["campsite_type"])],
+                    "attributeDefinitionId": self.GOING_TO_CAMP_SERVICE_TYPE_ID,
+                }
+            ],
+            "minCapacity": 1,
+            "maxCapacity": details["max_num_people"],
+            "mapId": self.going_to_camp_map_ids(facility_id)[
+                site // self.GOING_TO_CAMP_SITES_PER_MAP
+            ],
+        }
+
+    def going_to_camp_equipment(self) -> List[Dict[str, Any]]:
+        """
+        Equipment Categories
+
+        /api/equipment
+        """
+        equipment = sorted(
+            {item for items in self.CAMPSITE_EQUIPMENT.values() for item in items}
+        )
+        return [
+            {
+                "equipmentCategoryId": NON_GROUP_EQUIPMENT,
+                "subEquipmentCategories": [
+                    {
+                        "subEquipmentCategoryId": NON_GROUP_EQUIPMENT + index,
+                        "localizedValues": [{"cultureName": "en-US", "name": name}],
+                    }
+                    for index, name in enumerate(equipment)
+                ],
+            }
+        ]
+
+    # ----------------------------------------------------------------------
+    # Yellowstone
+    # ----------------------------------------------------------------------
+
+    def yellowstone_room_codes(self, hotel_code: str) -> List[str]:
+        """
+        Room (Campsite) Codes of a Yellowstone Campground
+        """
+        if hotel_code not in YellowstoneConfig.YELLOWSTONE_CAMPGROUNDS:
+            raise KeyError(f"Campground {hotel_code} not found")
+        return [f"S{site:03d}" for site in range(self.sites)]
+
+    def _yellowstone_stay_available(
+        self,
+        hotel_code: str,
+        room_code: str,
+        night: datetime.date,
+        nights: int,
+        snapshot: int,
+    ) -> bool:
+        """
+        Whether a Room is Available for a Stay Starting on `night`
+        """
+        return all(
+            self.is_available(
+                (hotel_code, room_code),
+                night + datetime.timedelta(days=offset),
+                snapshot,
+            )
+            for offset in range(nights)
+        )
+
+    def yellowstone_hotels(
+        self,
+        start_date: datetime.date,
+        limit: int = 31,
+        nights: int = 1,
+        snapshot: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Daily Availability of Every Campground - `XantResortData`
+
+        /v1/api/availability/hotels/yellowstonenationalparklodges
+        """
+        availability: Dict[str, Dict[str, Any]] = {}
+        for night in self.nights(
+            start_date, start_date + datetime.timedelta(days=limit)
+        ):
+            daily = {}
+            for hotel_code, name in YellowstoneConfig.YELLOWSTONE_CAMPGROUNDS.items():
+                available = sum(
+                    self._yellowstone_stay_available(
+                        hotel_code, room_code, night, nights, snapshot
+                    )
+                    for room_code in self.yellowstone_room_codes(hotel_code)
+                )
+                title = (
+                    name.replace("Campground", "CG Internet Rate")
+                    if "Campground" in name
+                    else f"{name} Internet Rate"
+                )
+                mins = (
+                    {str(guests): self.PRICE for guests in range(1, 7)}
+                    if available > 0
+                    else {"1": 0}
+                )
+                daily[hotel_code] = {
+                    "hotelCode": hotel_code,
+                    "status": "OPEN",
+                    "message": "",
+                    "min": str(self.PRICE),
+                    "max": str(self.PRICE),
+                    "perGuests": {},
+                    "rates": {
+                        YellowstoneConfig.RATE_CODE: {
+                            "code": YellowstoneConfig.RATE_CODE,
+                            "title": title,
+                            "description": "",
+                            "category": "RACK",
+                            "minstay": 1,
+                            "start": start_date.strftime("%m/%d/%Y"),
+                            "available": {"1": available},
+                            "mins": mins,
+                            "min": self.PRICE if available > 0 else 0,
+                        }
+                    },
+                }
+            availability[night.strftime("%m/%d/%Y")] = daily
+        return {"availability": availability}
+
+    def yellowstone_rooms(
+        self,
+        hotel_code: str,
+        start_date: datetime.date,
+        limit: int = 31,
+        nights: int = 1,
+        snapshot: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Daily Availability of Every Room in a Campground
+
+        /v1/api/availability/rooms/yellowstonenationalparklodges/<HOTEL CODE>
+        """
+        room_codes = self.yellowstone_room_codes(hotel_code)
+        availability = {}
+        for night in self.nights(
+            start_date, start_date + datetime.timedelta(days=limit)
+        ):
+            booking_date = night.strftime("%m/%d/%Y")
+            availability[booking_date] = {
+                "date": booking_date,
+                "status": "OPEN",
+                "message": "",
+                "rooms": [
+                    {
+                        "hotelCode": hotel_code,
+                        "roomCode": room_code,
+                        "rateCode": YellowstoneConfig.RATE_CODE,
+                        "available": int(
+                            self._yellowstone_stay_available(
+                                hotel_code, room_code, night, nights, snapshot
+                            )
+                        ),
+                        "price": self.PRICE,
+                        "type": "rv",
+                        "base": 1,
+                        "max": 6,
+                    }
+                    for room_code in room_codes
+                ],
+            }
+        return {"availability": availability}
+
+    def yellowstone_property(self, hotel_code: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Room Details of a Campground
+
+        /v1/api/property/rooms/yellowstonenationalparklodges/<HOTEL CODE>
+        """
+        return {
+            room_code: {
+                "code": room_code,
+                "title": f"Site {room_code[1:]}",
+                "type": "rv" if index % 2 == 0 else "tent",
+                "group": [],
+                "occupancyBase": 1,
+                "occupancyMax": 6,
+                "description": "",
+            }
+            for index, room_code in enumerate(self.yellowstone_room_codes(hotel_code))
+        }
@@ -0,0 +1,457 @@
+"""
+Fake Transport: Serve Synthetic Payloads to the Real Providers
+
+Requests are answered in-process by patching the transport adapter of
+every `requests.Session`, so providers run unmodified - with their own URL
+building, pagination, caching and parsing - against synthetic data.
+"""
+
+import datetime
+import json
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Callable, Dict, Iterator, List, Optional, Pattern, Tuple
+from urllib import parse
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from camply.config.api_config import UseDirectConfig, YellowstoneConfig
+from camply.providers.going_to_camp.rec_areas import RECREATION_AREAS
+from camply.testing.synthetic import SyntheticAvailability
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SyntheticRequest:
+    """
+    A Request Being Answered: Path Parameters, Query and Body
+    """
+
+    synthetic: SyntheticAvailability
+    host: str
+    path_params: Dict[str, str]
+    query: Dict[str, List[str]] = field(default_factory=dict)
+    body: Optional[bytes] = None
+    snapshot: int = 0
+
+    def param(self, key: str, default: Any = None) -> Any:
+        """
+        First Value of a Query Parameter
+        """
+        return self.query.get(key, [default])[0]
+
+    def date(self, key: str) -> datetime.date:
+        """
+        A Date Query Parameter
+        """
+        return parse_date(self.param(key))
+
+    def json(self) -> Dict[str, Any]:
+        """
+        The JSON Body
+        """
+        return json.loads(self.body or b"{}")
+
+    @property
+    def going_to_camp_rec_area(self) -> int:
+        """
+        Recreation Area of a GoingToCamp Host
+        """
+        return RECREATION_AREAS[self.host].recreation_area_id
+
+
+def parse_date(value: str) -> datetime.date:
+    """
+    Parse the Dates Providers Send: ISO (With or Without a Time) or UseDirect's
+    """
+    try:
+        return datetime.date.fromisoformat(value[:10])
+    except ValueError:
+        return datetime.datetime.strptime(value, UseDirectConfig.DATE_FORMAT).date()
+
+
+def _asset_id(request: SyntheticRequest) -> str:
+    """
+    Facility ID of a Recreation.gov Campsite Search (`fq=asset_id:<ID>`)
+    """
+    for value in request.query.get("fq", []):
+        if value.startswith("asset_id:"):
+            return value.split(":", 1)[1]
+    raise KeyError("asset_id")
+
+
+def _ridb_page(request: SyntheticRequest) -> Dict[str, Any]:
+    """
+    RIDB Search and Pagination Parameters
+    """
+    return {
+        "query": request.param("query"),
+        "offset": int(request.param("offset", 0)),
+        "limit": int(request.param("limit", 50)),
+    }
+
+
+def _yellowstone_window(request: SyntheticRequest) -> Dict[str, Any]:
+    """
+    Yellowstone Availability Window Parameters
+    """
+    return {
+        "start_date": request.date("date"),
+        "limit": int(request.param("limit", 31)),
+        "nights": int(request.param("nights", 1)),
+        "snapshot": request.snapshot,
+    }
+
+
+# (HTTP method or None for any, path pattern, handler)
+ROUTES: List[Tuple[Optional[str], Pattern, Callable[[SyntheticRequest], Any]]] = [
+    # Recreation.gov
+    (
+        "GET",
+        re.compile(r"/api/camps/availability/campground/(?P<facility_id>\d+)/month"),
+        lambda request: request.synthetic.recdotgov_month(
+            facility_id=request.path_params["facility_id"],
+            month=request.date("start_date"),
+            snapshot=request.snapshot,
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/search/campsites"),
+        lambda request: request.synthetic.recdotgov_campsites(
+            facility_id=_asset_id(request),
+            start=int(request.param("start", 0)),
+            size=int(request.param("size", 1000)),
+        ),
+    ),
+    # RIDB
+    (
+        "GET",
+        re.compile(r"/api/v1/facilities"),
+        lambda request: request.synthetic.ridb_facilities(**_ridb_page(request)),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/v1/facilities/(?P<facility_id>\d+)"),
+        lambda request: request.synthetic.ridb_facility(
+            request.path_params["facility_id"]
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/v1/recareas"),
+        lambda request: request.synthetic.ridb_rec_areas(**_ridb_page(request)),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/v1/recareas/(?P<rec_area_id>\d+)"),
+        lambda request: request.synthetic.ridb_rec_area(
+            request.path_params["rec_area_id"]
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/v1/recareas/(?P<rec_area_id>\d+)/facilities"),
+        lambda request: request.synthetic.ridb_facilities(
+            rec_area_id=request.path_params["rec_area_id"], **_ridb_page(request)
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/v1/campsites/(?P<campsite_id>\d+)"),
+        lambda request: request.synthetic.ridb_campsite(
+            request.path_params["campsite_id"]
+        ),
+    ),
+    # UseDirect - every provider has its own prefix
+    (
+        "POST",
+        re.compile(rf"/[^/]+/{UseDirectConfig.AVAILABILITY_ENDPOINT}"),
+        lambda request: request.synthetic.usedirect_grid(
+            facility_id=request.json()["FacilityId"],
+            start_date=parse_date(request.json()["StartDate"]),
+            end_date=parse_date(request.json()["EndDate"]),
+            snapshot=request.snapshot,
+        ),
+    ),
+    (
+        "GET",
+        re.compile(rf"/[^/]+/{UseDirectConfig.METADATA_PREFIX}"),
+        lambda request: request.synthetic.usedirect_filters(),
+    ),
+    (
+        "GET",
+        re.compile(rf"/[^/]+/{UseDirectConfig.CITYPARK_ENDPOINT}"),
+        lambda request: request.synthetic.usedirect_city_parks(),
+    ),
+    (
+        "GET",
+        re.compile(rf"/[^/]+/{UseDirectConfig.LIST_PLACES_ENDPOINT}"),
+        lambda request: request.synthetic.usedirect_places(),
+    ),
+    (
+        "GET",
+        re.compile(rf"/[^/]+/{UseDirectConfig.LIST_FACILITIES_ENDPOINT}"),
+        lambda request: request.synthetic.usedirect_facilities(),
+    ),
+    # GoingToCamp - the host is the recreation area
+    (
+        "GET",
+        re.compile(r"/api/resourceLocation"),
+        lambda request: request.synthetic.going_to_camp_resource_locations(
+            request.going_to_camp_rec_area
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/maps"),
+        lambda request: request.synthetic.going_to_camp_maps(
+            request.going_to_camp_rec_area
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/availability/map"),
+        lambda request: request.synthetic.going_to_camp_map(
+            map_id=request.param("mapId"),
+            start_date=request.date("startDate"),
+            end_date=request.date("endDate"),
+            daily=request.param("getDailyAvailability") == str(True),
+            snapshot=request.snapshot,
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/attribute/filterable"),
+        lambda request: request.synthetic.going_to_camp_attributes(),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/resource/details"),
+        lambda request: request.synthetic.going_to_camp_site_details(
+            request.param("resourceId")
+        ),
+    ),
+    (
+        "GET",
+        re.compile(r"/api/equipment"),
+        lambda request: request.synthetic.going_to_camp_equipment(),
+    ),
+    # Yellowstone
+    (
+        "GET",
+        re.compile(re.escape(YellowstoneConfig.YELLOWSTONE_LODGING_PATH)),
+        lambda request: request.synthetic.yellowstone_hotels(
+            **_yellowstone_window(request)
+        ),
+    ),
+    (
+        "GET",
+        re.compile(
+            rf"/{re.escape(YellowstoneConfig.YELLOWSTONE_CAMPSITE_AVAILABILITY)}"
+            r"/(?P<hotel_code>[^/]+)"
+        ),
+        lambda request: request.synthetic.yellowstone_rooms(
+            hotel_code=request.path_params["hotel_code"],
+            **_yellowstone_window(request),
+        ),
+    ),
+    (
+        "GET",
+        re.compile(
+            rf"/{re.escape(YellowstoneConfig.YELLOWSTONE_PROPERTY_INFO)}"
+            r"/(?P<hotel_code>[^/]+)"
+        ),
+        lambda request: request.synthetic.yellowstone_property(
+            request.path_params["hotel_code"]
+        ),
+    ),
+]
+
+
+def route_request(
+    synthetic: SyntheticAvailability,
+    method: str,
+    url: str,
+    body: Optional[bytes] = None,
+    snapshot: int = 0,
+) -> Tuple[int, Any]:
+    """
+    Answer a Provider Request with a Synthetic Payload
+
+    Routing goes by path - GoingToCamp requests are the only ones that need
+    the host, to know which recreation area they're for. Unknown routes and
+    unknown campgrounds, campsites or maps are answered with a 404.
+
+    Parameters
+    ----------
+    synthetic: SyntheticAvailability
+    method: str
+    url: str
+    body: Optional[bytes]
+        Request body, JSON for the UseDirect availability grid
+    snapshot: int
+        Poll number, passed to the generator for availability churn
+
+    Returns
+    -------
+    Tuple[int, Any]
+        Status code and the JSON payload
+    """
+    parsed_url = parse.urlsplit(url)
+    path = parse.unquote(parsed_url.path).rstrip("/")
+    for route_method, pattern, handler in ROUTES:
+        match = pattern.fullmatch(path)
+        if match is None or route_method not in (None, method.upper()):
+            continue
+        request = SyntheticRequest(
+            synthetic=synthetic,
+            host=parsed_url.hostname or "",
+            path_params=match.groupdict(),
+            query=parse.parse_qs(parsed_url.query),
+            body=body,
+            snapshot=snapshot,
+        )
+        try:
+            return HTTPStatus.OK, handler(request)
+        except (KeyError, ValueError) as error:
+            return HTTPStatus.NOT_FOUND, {"error": f"Not Found: {error}"}
+    return HTTPStatus.NOT_FOUND, {"error": f"No synthetic route for {method} {path}"}
+
+
+class SnapshotCounter:
+    """
+    Count How Many Times Each Distinct Request Has Been Made
+
+    The count is the snapshot a request sees: 0 the first time, 1 the
+    next and so on - so a search polling the same endpoint sees its
+    availability churn.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize with Every Count at Zero
+        """
+        self._counts: Dict[Tuple[str, str, Optional[bytes]], int] = {}
+        self._lock = threading.Lock()
+
+    def next(self, method: str, url: str, body: Optional[bytes] = None) -> int:
+        """
+        Snapshot for a Request, Counting it
+
+        Parameters
+        ----------
+        method: str
+        url: str
+        body: Optional[bytes]
+
+        Returns
+        -------
+        int
+        """
+        key = (method.upper(), url, body)
+        with self._lock:
+            snapshot = self._counts.get(key, 0)
+            self._counts[key] = snapshot + 1
+        return snapshot
+
+
+class FakeTransport(BaseAdapter):
+    """
+    A `requests` Transport Adapter Answering with Synthetic Payloads
+
+    Every request is recorded in `requests`, each distinct request (method,
+    URL and body) advances its own snapshot - see `SnapshotCounter`.
+    """
+
+    def __init__(self, synthetic: Optional[SyntheticAvailability] = None) -> None:
+        """
+        Initialize the Transport
+
+        Parameters
+        ----------
+        synthetic: Optional[SyntheticAvailability]
+            Generator to answer with, defaults to `SyntheticAvailability()`
+        """
+        super().__init__()
+        self.synthetic = synthetic if synthetic is not None else SyntheticAvailability()
+        self.requests: List[requests.PreparedRequest] = []
+        self.snapshots = SnapshotCounter()
+        self._lock = threading.Lock()
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Answer a Prepared Request
+
+        Parameters
+        ----------
+        request: requests.PreparedRequest
+
+        Returns
+        -------
+        requests.Response
+        """
+        body = (
+            request.body.encode("utf-8")
+            if isinstance(request.body, str)
+            else request.body
+        )
+        with self._lock:
+            self.requests.append(request)
+        snapshot = self.snapshots.next(request.method, request.url, body)
+        status_code, payload = route_request(
+            synthetic=self.synthetic,
+            method=request.method,
+            url=request.url,
+            body=body,
+            snapshot=snapshot,
+        )
+        logger.debug("%s %s -> %s", request.method, request.url, status_code)
+        response = requests.Response()
+        response.status_code = int(status_code)
+        response.reason = HTTPStatus(status_code).phrase
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = json.dumps(payload).encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        """
+        Nothing to Clean Up
+        """
+
+
+@contextmanager
+def fake_transport(
+    synthetic: Optional[SyntheticAvailability] = None,
+) -> Iterator[FakeTransport]:
+    """
+    Answer Every `requests` Call with Synthetic Payloads
+
+    Parameters
+    ----------
+    synthetic: Optional[SyntheticAvailability]
+        Generator to answer with, defaults to `SyntheticAvailability()`
+
+    Yields
+    ------
+    FakeTransport
+    """
+    transport = FakeTransport(synthetic=synthetic)
+    get_adapter = requests.Session.get_adapter
+    requests.Session.get_adapter = lambda session, url: transport
+    try:
+        yield transport
+    finally:
+        requests.Session.get_adapter = get_adapter
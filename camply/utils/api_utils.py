@@ -3,9 +3,17 @@ Recreation.gov Web Searching Utilities
 """
 
 import logging
-from typing import List, Union
+import time
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Union
 from urllib import parse
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from camply.config.api_config import APIConfig
+from camply.utils.instrumentation import increment, observe
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,3 +88,105 @@ def filter_json(json: dict, filters: Union[str, List[str]]) -> object:
         logger.error(error_message)
         raise KeyError from key_error
     return object_layers[len(filters)]
+
+
+def override_url(url: str, overrides: Dict[str, str]) -> Optional[str]:
+    """
+    Point a URL at the Base URL its Host is Overridden With
+
+    Parameters
+    ----------
+    url: str
+    overrides: Dict[str, str]
+        Base URLs keyed by hostname, `*` matches every host
+
+    Returns
+    -------
+    Optional[str]
+        The rewritten URL, None when the host isn't overridden
+    """
+    parsed_url = parse.urlsplit(url)
+    base_url = overrides.get(parsed_url.hostname, overrides.get("*"))
+    if not base_url:
+        return None
+    target = parse.urlsplit(base_url)
+    return parse.urlunsplit(
+        (
+            target.scheme,
+            target.netloc,
+            target.path.rstrip("/") + parsed_url.path,
+            parsed_url.query,
+            parsed_url.fragment,
+        )
+    )
+
+
+class HostOverrideAdapter(HTTPAdapter):
+    """
+    Transport Adapter Honoring `APIConfig.HOST_OVERRIDES`
+
+    Requests for an overridden host are sent to its replacement base URL,
+    with the original host in an `X-Forwarded-Host` header. Every request
+    is instrumented by provider, host and status.
+    """
+
+    def __init__(self, provider: str = "unknown", **kwargs: Any) -> None:
+        """
+        Initialize the Adapter
+
+        Parameters
+        ----------
+        provider: str
+            Name of the provider the requests are made for
+        **kwargs
+            Passed to `HTTPAdapter`
+        """
+        super().__init__(**kwargs)
+        self.provider = provider
+
+    def send(
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a Request, to its Overridden Host if There is One
+        """
+        host = parse.urlsplit(request.url).netloc
+        target = override_url(request.url, APIConfig.HOST_OVERRIDES)
+        if target is not None:
+            request.headers["X-Forwarded-Host"] = host
+            request.url = target
+        labels = {"provider": self.provider, "host": host}
+        start = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        except requests.RequestException:
+            increment("http_requests", status="error", **labels)
+            increment("http_errors", status="error", **labels)
+            raise
+        finally:
+            observe("http_request", time.perf_counter() - start, **labels)
+        status = str(response.status_code)
+        increment("http_requests", status=status, **labels)
+        if response.status_code >= HTTPStatus.BAD_REQUEST:
+            increment("http_errors", status=status, **labels)
+        return response
+
+
+def provider_session(provider: str = "unknown") -> requests.Session:
+    """
+    Create a Session for Provider Requests, Honoring Host Overrides
+
+    Parameters
+    ----------
+    provider: str
+        Name of the provider the requests are made for
+
+    Returns
+    -------
+    requests.Session
+    """
+    session = requests.Session()
+    adapter = HostOverrideAdapter(provider=provider)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,268 @@
+"""
+Concurrency Utilities: Rate Limiting, Circuit Breaking and Bounded Fan-Out
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, TypeVar
+from urllib import parse
+
+from camply.utils.instrumentation import observe
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class HostRateLimiter:
+    """
+    Thread-Safe Rate Limiter, Tracked Separately per Host
+
+    Allows at most `calls` requests per `period` seconds to any single
+    host while letting requests to different hosts proceed independently.
+    """
+
+    def __init__(self, calls: int, period: float) -> None:
+        """
+        Initialize with a Rate
+
+        Parameters
+        ----------
+        calls: int
+            Number of calls allowed per period
+        period: float
+            Length of the period in seconds
+        """
+        self.calls = calls
+        self.period = period
+        self._lock = threading.Lock()
+        self._history: Dict[str, Deque[float]] = defaultdict(deque)
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {self.calls} / {self.period}s>"
+
+    @classmethod
+    def host_for(cls, url: str) -> str:
+        """
+        Return the Host Portion of a URL
+
+        Parameters
+        ----------
+        url: str
+
+        Returns
+        -------
+        str
+        """
+        return parse.urlparse(url).netloc or url
+
+    def wait(self, host: str) -> float:
+        """
+        Block Until a Request to `host` is Allowed
+
+        Parameters
+        ----------
+        host: str
+            Hostname (or URL) the request is going to
+
+        Returns
+        -------
+        float
+            Number of seconds spent waiting
+        """
+        host = self.host_for(host)
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                history = self._history[host]
+                while history and now - history[0] >= self.period:
+                    history.popleft()
+                if len(history) < self.calls:
+                    history.append(now)
+                    break
+                sleep_for = self.period - (now - history[0])
+            time.sleep(sleep_for)
+            waited += sleep_for
+        if waited > 0:
+            observe("rate_limit_wait", waited, host=host)
+        return waited
+
+
+class CircuitBreaker:
+    """
+    Thread-Safe Circuit Breaker
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls are refused until `reset_timeout` seconds have passed. The circuit
+    is then half-open: a single trial call is let through while the others
+    are still refused. A successful trial closes the circuit again and a
+    failed one re-opens it for another `reset_timeout`.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        """
+        Initialize with Thresholds
+
+        Parameters
+        ----------
+        failure_threshold: int
+            Consecutive failures before the circuit opens
+        reset_timeout: float
+            Seconds the circuit stays open before a trial call is allowed
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_started_at: Optional[float] = None
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {self.state}>"
+
+    def _state(self, now: float) -> str:
+        """
+        Current State, the Lock Must Be Held
+        """
+        if self._opened_at is None:
+            return "closed"
+        elif now - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half-open"
+
+    @property
+    def state(self) -> str:
+        """
+        Whether the Circuit is `closed`, `open` or `half-open`
+        """
+        with self._lock:
+            return self._state(now=time.monotonic())
+
+    @property
+    def is_open(self) -> bool:
+        """
+        Whether the Circuit is Open and Refusing Every Call
+        """
+        return self.state == "open"
+
+    def allow(self) -> bool:
+        """
+        Whether a Call may be Attempted Now
+
+        While half-open only the first caller is allowed, as the trial call.
+        A trial that never reports back is abandoned after `reset_timeout`
+        so another one can take its place.
+
+        Returns
+        -------
+        bool
+        """
+        with self._lock:
+            now = time.monotonic()
+            state = self._state(now=now)
+            if state == "closed":
+                return True
+            elif state == "open":
+                return False
+            if (
+                self._trial_started_at is not None
+                and now - self._trial_started_at < self.reset_timeout
+            ):
+                return False
+            self._trial_started_at = now
+            return True
+
+    def record_success(self) -> None:
+        """
+        Record a Successful Call and Close the Circuit
+        """
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_started_at = None
+
+    def record_failure(self) -> None:
+        """
+        Record a Failed Call, Opening the Circuit at the Threshold
+
+        A failed trial re-opens the circuit, failures of calls that started
+        before the circuit opened are ignored.
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._trial_started_at is not None:
+                logger.warning("Circuit re-opened after a failed trial call")
+                self._opened_at = now
+                self._trial_started_at = None
+            elif self._opened_at is None:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    logger.warning(
+                        f"Circuit opened after {self._failures} consecutive failures"
+                    )
+                    self._opened_at = now
+                    self._failures = 0
+
+
+def iter_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterator[R]:
+    """
+    Lazily Map a Function over Items with a Bounded Thread Pool
+
+    Every call is submitted up front, results are yielded in the same order
+    as `items` as soon as they (and every result before them) are ready.
+    The first exception raised by any call is re-raised to the caller. When
+    there is only a single item (or a single worker) the calls run in the
+    current thread, one per result consumed.
+
+    Parameters
+    ----------
+    func: Callable[[T], R]
+    items: Iterable[T]
+    max_workers: int
+
+    Returns
+    -------
+    Iterator[R]
+    """
+    items = list(items)
+    if max_workers <= 1 or len(items) <= 1:
+        yield from map(func, items)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        yield from executor.map(func, items)
+
+
+def run_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> List[R]:
+    """
+    Map a Function over Items with a Bounded Thread Pool
+
+    Results are returned in the same order as `items`. The first exception
+    raised by any call is re-raised to the caller. When there is only a
+    single item (or a single worker) the calls run in the current thread.
+
+    Parameters
+    ----------
+    func: Callable[[T], R]
+    items: Iterable[T]
+    max_workers: int
+
+    Returns
+    -------
+    List[R]
+    """
+    return list(iter_concurrently(func=func, items=items, max_workers=max_workers))
@@ -0,0 +1,660 @@
+"""
+Instrumentation: Spans and Counters for Every Search Poll
+
+Where a poll's time goes - waiting on HTTP, sleeping for rate limits,
+parsing, filtering, consolidating, notifying - is recorded as named spans
+and counters. A poll is opened by a `poll=True` span, everything recorded
+from any thread until it closes is summarized in one `PollRecord` and handed
+to the configured sinks. Span times are inclusive of nested spans.
+
+Instrumentation is off unless sinks are configured (`CAMPLY_INSTRUMENTATION`
+or `enable`), when off every span, counter and decorated function costs a
+single attribute lookup.
+"""
+
+import datetime
+import json
+import logging
+import os
+import pathlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from functools import wraps
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+from camply.config.instrumentation_config import InstrumentationConfig
+
+if TYPE_CHECKING:
+    import tenacity
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Any])
+Labels = Dict[str, str]
+
+_DISABLED = nullcontext()
+
+
+@dataclass
+class SpanStats:
+    """
+    Time Spent in a Span, and How Many Times it Ran
+    """
+
+    seconds: float = 0.0
+    calls: int = 0
+
+
+@dataclass
+class PollRecord:
+    """
+    Everything Recorded During a Single Poll
+    """
+
+    name: str
+    started: datetime.datetime
+    duration: float
+    spans: Dict[str, SpanStats] = field(default_factory=dict)
+    counters: Dict[str, float] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        JSON Serializable Representation
+        """
+        record = asdict(self)
+        record["started"] = self.started.isoformat()
+        return record
+
+    def summary(self) -> str:
+        """
+        One Line Summary, Slowest Spans First
+        """
+        spans = sorted(
+            self.spans.items(), key=lambda item: item[1].seconds, reverse=True
+        )
+        parts = [f"{self.name} {self.duration:.3f}s"]
+        if self.error is not None:
+            parts[0] += f" ({self.error})"
+        parts += [
+            f"{name} {stats.seconds:.3f}s x{stats.calls}"
+            for name, stats in spans
+            if name != self.name
+        ]
+        parts += [f"{name}={value:g}" for name, value in sorted(self.counters.items())]
+        return " | ".join(parts)
+
+
+class InstrumentationSink(ABC):
+    """
+    Destination for Poll Records
+    """
+
+    @abstractmethod
+    def emit(self, record: PollRecord) -> None:
+        """
+        Handle a Finished Poll
+        """
+
+    def close(self) -> None:
+        """
+        Release Anything the Sink Holds
+        """
+        logger.debug("Closing Instrumentation Sink: %s", self)
+
+
+class LiveSink(InstrumentationSink):
+    """
+    Sink That Also Sees Every Span and Counter as it's Recorded
+
+    Live sinks see labels, and what's recorded outside of a poll, too - a
+    poll stuck retrying still shows up in them.
+    """
+
+    @abstractmethod
+    def record_span(self, name: str, seconds: float, labels: Labels) -> None:
+        """
+        Handle a Span as it Ends
+        """
+
+    @abstractmethod
+    def record_count(self, name: str, value: float, labels: Labels) -> None:
+        """
+        Handle a Counter as it's Incremented
+        """
+
+
+class LogSink(InstrumentationSink):
+    """
+    Log a Summary Line per Poll
+    """
+
+    def emit(self, record: PollRecord) -> None:
+        """
+        Log the Record's Summary
+        """
+        logger.info("⏱️  %s", record.summary())
+
+
+class JSONLinesSink(InstrumentationSink):
+    """
+    Append Each Poll Record to a JSON Lines File
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        """
+        Initialize with the File to Append to
+
+        Parameters
+        ----------
+        path: Union[str, pathlib.Path]
+        """
+        self.path = pathlib.Path(path).expanduser()
+        self._lock = threading.Lock()
+
+    def emit(self, record: PollRecord) -> None:
+        """
+        Append the Record as a Line of JSON
+        """
+        line = json.dumps(record.to_dict(), sort_keys=True)
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(line + "\n")
+
+
+class MetricTotals:
+    """
+    Running Totals Across Polls, in the Prometheus Text Format
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize with Every Total at Zero
+        """
+        self.polls: Dict[str, SpanStats] = {}
+        self.last_duration: Dict[str, float] = {}
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def update(self, record: PollRecord) -> None:
+        """
+        Add a Poll Record to the Totals
+        """
+        with self._lock:
+            poll = self.polls.setdefault(record.name, SpanStats())
+            poll.seconds += record.duration
+            poll.calls += 1
+            self.last_duration[record.name] = record.duration
+            for name, stats in record.spans.items():
+                total = self.spans.setdefault(name, SpanStats())
+                total.seconds += stats.seconds
+                total.calls += stats.calls
+            for name, value in record.counters.items():
+                self.counters[name] = self.counters.get(name, 0) + value
+
+    def to_prometheus(self) -> str:
+        """
+        Render the Totals in the Prometheus Text Exposition Format
+        """
+        lines = []
+        with self._lock:
+            metrics = [
+                (
+                    "camply_polls_total",
+                    "counter",
+                    "Polls run",
+                    "poll",
+                    {name: stats.calls for name, stats in self.polls.items()},
+                ),
+                (
+                    "camply_poll_seconds_total",
+                    "counter",
+                    "Seconds spent polling",
+                    "poll",
+                    {name: stats.seconds for name, stats in self.polls.items()},
+                ),
+                (
+                    "camply_poll_last_duration_seconds",
+                    "gauge",
+                    "Duration of the last poll",
+                    "poll",
+                    self.last_duration,
+                ),
+                (
+                    "camply_span_seconds_total",
+                    "counter",
+                    "Seconds spent in each span",
+                    "span",
+                    {name: stats.seconds for name, stats in self.spans.items()},
+                ),
+                (
+                    "camply_span_calls_total",
+                    "counter",
+                    "Times each span ran",
+                    "span",
+                    {name: stats.calls for name, stats in self.spans.items()},
+                ),
+                (
+                    "camply_counter_total",
+                    "counter",
+                    "Running counters",
+                    "name",
+                    self.counters,
+                ),
+            ]
+            for metric, metric_type, description, label, values in metrics:
+                lines.append(f"# HELP {metric} {description}")
+                lines.append(f"# TYPE {metric} {metric_type}")
+                for key, value in sorted(values.items()):
+                    escaped = key.replace("\\", "\\\\").replace('"', '\\"')
+                    lines.append(f'{metric}{{{label}="{escaped}"}} {value:g}')
+        return "\n".join(lines) + "\n"
+
+
+class PrometheusTextfileSink(InstrumentationSink):
+    """
+    Keep a Prometheus Textfile of Running Totals Up to Date
+
+    For the node exporter's textfile collector, the file is replaced
+    atomically after every poll.
+    """
+
+    def __init__(self, path: Union[str, pathlib.Path]) -> None:
+        """
+        Initialize with the File to Write
+
+        Parameters
+        ----------
+        path: Union[str, pathlib.Path]
+        """
+        self.path = pathlib.Path(path).expanduser()
+        self.totals = MetricTotals()
+
+    def emit(self, record: PollRecord) -> None:
+        """
+        Add the Record to the Totals and Rewrite the File
+        """
+        self.totals.update(record)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(self.totals.to_prometheus(), encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class OpenTelemetrySink(InstrumentationSink):
+    """
+    Record Polls as OpenTelemetry Metrics
+
+    Requires `opentelemetry-api`, exporting is up to the SDK configured in
+    the running process.
+    """
+
+    def __init__(self) -> None:
+        """
+        Create the Instruments
+        """
+        try:
+            from opentelemetry import metrics
+        except ImportError as ie:
+            raise RuntimeError(
+                "Looks like `opentelemetry-api` isn't installed. "
+                "Install it with `pip install opentelemetry-api`"
+            ) from ie
+        meter = metrics.get_meter(InstrumentationConfig.OPENTELEMETRY_METER)
+        self.poll_duration = meter.create_histogram(
+            "camply.poll.duration", unit="s", description="Duration of each poll"
+        )
+        self.span_duration = meter.create_histogram(
+            "camply.span.duration", unit="s", description="Time spent in each span"
+        )
+        self.counter = meter.create_counter(
+            "camply.counter", description="Running counters"
+        )
+
+    def emit(self, record: PollRecord) -> None:
+        """
+        Record the Poll's Duration, Spans and Counters
+        """
+        self.poll_duration.record(record.duration, {"poll": record.name})
+        for name, stats in record.spans.items():
+            self.span_duration.record(stats.seconds, {"span": name})
+        for name, value in record.counters.items():
+            self.counter.add(value, {"name": name})
+
+
+class _Collection:
+    """
+    Spans and Counters Recorded so Far in the Open Poll
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started = datetime.datetime.now()
+        self.spans: Dict[str, SpanStats] = {}
+        self.counters: Dict[str, float] = {}
+
+
+class Recorder:
+    """
+    Collect Spans and Counters into Poll Records for a Set of Sinks
+
+    One poll is open at a time, a poll opened while another one is open is
+    just a span of the outer one. Spans and counters recorded while no poll
+    is open only reach live sinks. The recorder in use is `Recorder.active`.
+    """
+
+    active: ClassVar[Optional["Recorder"]] = None
+
+    def __init__(self, sinks: List[InstrumentationSink]) -> None:
+        """
+        Initialize with the Sinks to Emit to
+
+        Parameters
+        ----------
+        sinks: List[InstrumentationSink]
+        """
+        self.sinks = list(sinks)
+        self.live_sinks = [sink for sink in self.sinks if isinstance(sink, LiveSink)]
+        self._poll: Optional[_Collection] = None
+        self._lock = threading.Lock()
+
+    def open_poll(self, name: str) -> Optional[_Collection]:
+        """
+        Open a Poll, Unless One is Already Open
+        """
+        with self._lock:
+            if self._poll is not None:
+                return None
+            self._poll = _Collection(name=name)
+            return self._poll
+
+    def close_poll(
+        self, collection: _Collection, duration: float, error: Optional[str] = None
+    ) -> PollRecord:
+        """
+        Close a Poll and Emit its Record to Every Sink
+
+        A failing sink is logged and skipped - instrumentation never breaks
+        a search.
+        """
+        with self._lock:
+            self._poll = None
+        record = PollRecord(
+            name=collection.name,
+            started=collection.started,
+            duration=duration,
+            spans=collection.spans,
+            counters=collection.counters,
+            error=error,
+        )
+        for sink in self.sinks:
+            try:
+                sink.emit(record)
+            except Exception:
+                logger.exception("Instrumentation Sink Failed: %s", sink)
+        return record
+
+    def add_span(self, name: str, seconds: float, labels: Labels) -> None:
+        """
+        Add Time to a Span of the Open Poll
+        """
+        with self._lock:
+            if self._poll is not None:
+                stats = self._poll.spans.setdefault(name, SpanStats())
+                stats.seconds += seconds
+                stats.calls += 1
+        for sink in self.live_sinks:
+            sink.record_span(name, seconds, labels)
+
+    def add_count(self, name: str, value: float, labels: Labels) -> None:
+        """
+        Add to a Counter of the Open Poll
+        """
+        with self._lock:
+            if self._poll is not None:
+                counters = self._poll.counters
+                counters[name] = counters.get(name, 0) + value
+        for sink in self.live_sinks:
+            sink.record_count(name, value, labels)
+
+    def close(self) -> None:
+        """
+        Close Every Sink
+        """
+        for sink in self.sinks:
+            sink.close()
+
+
+def get_recorder() -> Optional[Recorder]:
+    """
+    The Active Recorder, None When Instrumentation is Disabled
+    """
+    return Recorder.active
+
+
+def enable(sinks: List[InstrumentationSink]) -> Recorder:
+    """
+    Start Recording to a Set of Sinks, Replacing Any Previous Recorder
+
+    Parameters
+    ----------
+    sinks: List[InstrumentationSink]
+
+    Returns
+    -------
+    Recorder
+    """
+    disable()
+    Recorder.active = Recorder(sinks=sinks)
+    return Recorder.active
+
+
+def disable() -> None:
+    """
+    Stop Recording and Close the Sinks
+    """
+    recorder, Recorder.active = Recorder.active, None
+    if recorder is not None:
+        recorder.close()
+
+
+def sinks_from_config(spec: str) -> List[InstrumentationSink]:
+    """
+    Build Sinks from a Comma Separated Spec Like `log,jsonl:polls.jsonl`
+
+    `metrics:[HOST:]PORT` serves a Prometheus metrics endpoint.
+
+    Parameters
+    ----------
+    spec: str
+
+    Returns
+    -------
+    List[InstrumentationSink]
+    """
+    sinks: List[InstrumentationSink] = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        kind, _, target = item.partition(":")
+        kind = kind.lower()
+        if kind == "log":
+            sinks.append(LogSink())
+        elif kind == "jsonl" and target:
+            sinks.append(JSONLinesSink(path=target))
+        elif kind == "prometheus" and target:
+            sinks.append(PrometheusTextfileSink(path=target))
+        elif kind == "otel":
+            sinks.append(OpenTelemetrySink())
+        elif kind == "metrics" and target:
+            from camply.utils.metrics_server import MetricsSink
+
+            host, _, port = target.rpartition(":")
+            sinks.append(
+                MetricsSink(
+                    host=host or InstrumentationConfig.METRICS_HOST, port=int(port)
+                )
+            )
+        else:
+            raise ValueError(f"Invalid instrumentation sink: `{item}`")
+    return sinks
+
+
+@contextmanager
+def _recorded_span(
+    recorder: Recorder,
+    name: str,
+    poll: bool,
+    expected: Tuple[Type[BaseException], ...] = (),
+) -> Iterator[None]:
+    """
+    Time a Span, Opening and Closing a Poll Around it When Asked
+    """
+    collection = recorder.open_poll(name) if poll is True else None
+    error: Optional[str] = None
+    start = time.perf_counter()
+    try:
+        yield
+    except expected:
+        raise
+    except BaseException as exception:
+        error = type(exception).__name__
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        if collection is not None:
+            recorder.close_poll(collection, duration=elapsed, error=error)
+        else:
+            recorder.add_span(name, elapsed, {})
+
+
+def span(
+    name: str,
+    poll: bool = False,
+    expected: Tuple[Type[BaseException], ...] = (),
+) -> ContextManager[None]:
+    """
+    Time a Block of Code as a Span
+
+    Parameters
+    ----------
+    name: str
+    poll: bool
+        Whether the span is a poll - everything recorded while it runs is
+        emitted as one record when it ends
+    expected: Tuple[Type[BaseException], ...]
+        Exceptions that end a poll without it counting as an error
+
+    Returns
+    -------
+    ContextManager[None]
+    """
+    recorder = Recorder.active
+    if recorder is None:
+        return _DISABLED
+    return _recorded_span(recorder, name, poll, expected)
+
+
+def traced(
+    name: Optional[str] = None,
+    poll: bool = False,
+    expected: Tuple[Type[BaseException], ...] = (),
+) -> Callable[[F], F]:
+    """
+    Time Every Call of a Function as a Span, Named After it by Default
+
+    Parameters
+    ----------
+    name: Optional[str]
+    poll: bool
+        Whether each call is a poll, see `span`
+    expected: Tuple[Type[BaseException], ...]
+        Exceptions that end a poll without it counting as an error
+
+    Returns
+    -------
+    Callable[[F], F]
+    """
+
+    def decorator(func: F) -> F:
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = Recorder.active
+            if recorder is None:
+                return func(*args, **kwargs)
+            with _recorded_span(recorder, span_name, poll, expected):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def increment(name: str, value: float = 1, **labels: str) -> None:
+    """
+    Add to a Counter of the Open Poll
+
+    Parameters
+    ----------
+    name: str
+    value: float
+    **labels: str
+        Labels for live sinks, like the host a request went to
+    """
+    recorder = Recorder.active
+    if recorder is not None:
+        recorder.add_count(name, value, labels)
+
+
+def observe(name: str, seconds: float, **labels: str) -> None:
+    """
+    Add Time Measured Elsewhere to a Span of the Open Poll
+
+    Parameters
+    ----------
+    name: str
+    seconds: float
+    **labels: str
+        Labels for live sinks, like the host a request went to
+    """
+    recorder = Recorder.active
+    if recorder is not None:
+        recorder.add_span(name, seconds, labels)
+
+
+def count_retry(retry_state: "tenacity.RetryCallState") -> None:
+    """
+    Count a Retry, for Tenacity's `before_sleep`
+
+    Parameters
+    ----------
+    retry_state: tenacity.RetryCallState
+    """
+    function = getattr(retry_state.fn, "__qualname__", "unknown")
+    increment("retries", function=function)
+
+
+if InstrumentationConfig.SINKS:
+    try:
+        enable(sinks_from_config(InstrumentationConfig.SINKS))
+    except (OSError, RuntimeError, ValueError) as error:
+        logger.error("Instrumentation Disabled: %s", error)
@@ -0,0 +1,106 @@
+"""
+Lazy Import Utilities
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, Iterator, Mapping, TypeVar
+
+T = TypeVar("T")
+
+
+def import_string(path: str) -> Any:
+    """
+    Import an Object from a `module.path:attribute` String
+
+    Parameters
+    ----------
+    path: str
+
+    Returns
+    -------
+    Any
+    """
+    module_name, _, attribute = path.partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+class LazyRegistry(Mapping[str, T]):
+    """
+    Read Only Mapping of Names to Objects Imported on First Access
+
+    The names are known up front so they can be listed (as command line
+    choices, for example) without importing anything, a value's module
+    is only imported once that value is looked up.
+    """
+
+    def __init__(self, paths: Dict[str, str]) -> None:
+        """
+        Initialize with Names and their `module.path:attribute` Strings
+
+        Parameters
+        ----------
+        paths: Dict[str, str]
+        """
+        self._paths = dict(paths)
+        self._loaded: Dict[str, T] = {}
+
+    def __getitem__(self, key: str) -> T:
+        """
+        Import (Once) and Return a Registered Object
+        """
+        if key not in self._loaded:
+            self._loaded[key] = import_string(self._paths[key])
+        return self._loaded[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Iterate Over the Names, Without Importing Anything
+        """
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        """
+        Number of Registered Names
+        """
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {list(self._paths)}>"
+
+
+def lazy_module_attributes(
+    module_name: str, attributes: Dict[str, str]
+) -> Callable[[str], Any]:
+    """
+    Build a Module's `__getattr__` for Lazily Imported Attributes
+
+    Each attribute is imported the first time it's accessed and then cached
+    on the module, so `from package import Name` keeps working while
+    `import package` stays cheap (PEP 562). Unloaded attributes are left out
+    of `dir()` on purpose, tools that walk every module attribute (freezegun,
+    for example) would otherwise import everything.
+
+    Parameters
+    ----------
+    module_name: str
+        `__name__` of the module the attributes belong to
+    attributes: Dict[str, str]
+        Attribute names and their `module.path:attribute` strings
+
+    Returns
+    -------
+    Callable[[str], Any]
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = import_string(attributes[name])
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
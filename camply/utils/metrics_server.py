@@ -0,0 +1,326 @@
+"""
+Prometheus Metrics Endpoint for Long-Running Searches
+
+`MetricsSink` is a live instrumentation sink serving what it records over
+HTTP from a background thread - poll duration histograms and outcomes, the
+last successful poll of each kind, HTTP requests by provider, host and
+status, retries, rate limit waits and campsites found. Enable it with
+`CAMPLY_INSTRUMENTATION=metrics:9090` (or `metrics:0.0.0.0:9090`) and scrape
+`/metrics`.
+"""
+
+import logging
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from camply.config.instrumentation_config import InstrumentationConfig
+from camply.utils.instrumentation import Labels, LiveSink, PollRecord
+
+logger = logging.getLogger(__name__)
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+_INVALID_CHARACTERS = re.compile(r"[^a-zA-Z0-9_]")
+
+
+def metric_name(name: str) -> str:
+    """
+    Turn a Span or Counter Name into a Valid Metric Name
+
+    Parameters
+    ----------
+    name: str
+
+    Returns
+    -------
+    str
+    """
+    return _INVALID_CHARACTERS.sub("_", name.strip("_")).lower()
+
+
+def _format_labels(labels: LabelSet) -> str:
+    """
+    Render a Label Set like `{host="x",status="200"}`
+    """
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for key, value in labels
+    )
+    return f"{{{pairs}}}"
+
+
+class _Family:
+    """
+    Samples of One Counter or Gauge, by Label Set
+    """
+
+    def __init__(self, metric_type: str, description: str) -> None:
+        self.metric_type = metric_type
+        self.description = description
+        self.samples: Dict[LabelSet, float] = {}
+
+
+class _Histogram:
+    """
+    Cumulative Bucket Counts, Sums and Counts of a Histogram, by Label Set
+    """
+
+    def __init__(self, description: str, buckets: Sequence[float]) -> None:
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        self.counts: Dict[LabelSet, List[int]] = {}
+        self.sums: Dict[LabelSet, float] = {}
+
+    def observe(self, labels: LabelSet, value: float) -> None:
+        counts = self.counts.setdefault(labels, [0] * (len(self.buckets) + 1))
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        counts[-1] += 1
+        self.sums[labels] = self.sums.get(labels, 0.0) + value
+
+
+class MetricsRegistry:
+    """
+    Thread-Safe Counters, Gauges and Histograms with Labels
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = InstrumentationConfig.METRICS_BUCKETS
+    ) -> None:
+        """
+        Initialize an Empty Registry
+
+        Parameters
+        ----------
+        buckets: Sequence[float]
+            Upper bounds of the histogram buckets
+        """
+        self.buckets = buckets
+        self._families: Dict[str, _Family] = {}
+        self._histograms: Dict[str, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _label_set(labels: Labels) -> LabelSet:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(
+        self, name: str, value: float = 1, description: str = "", **labels: str
+    ) -> None:
+        """
+        Add to a Counter
+        """
+        with self._lock:
+            family = self._families.setdefault(name, _Family("counter", description))
+            key = self._label_set(labels)
+            family.samples[key] = family.samples.get(key, 0.0) + value
+
+    def set(
+        self, name: str, value: float, description: str = "", **labels: str
+    ) -> None:
+        """
+        Set a Gauge
+        """
+        with self._lock:
+            family = self._families.setdefault(name, _Family("gauge", description))
+            family.samples[self._label_set(labels)] = value
+
+    def observe(
+        self, name: str, value: float, description: str = "", **labels: str
+    ) -> None:
+        """
+        Observe a Value in a Histogram
+        """
+        with self._lock:
+            histogram = self._histograms.setdefault(
+                name, _Histogram(description, self.buckets)
+            )
+            histogram.observe(self._label_set(labels), value)
+
+    def to_prometheus(self) -> str:
+        """
+        Render Every Metric in the Prometheus Text Exposition Format
+
+        Returns
+        -------
+        str
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name, family in sorted(self._families.items()):
+                lines.append(f"# HELP {name} {family.description}")
+                lines.append(f"# TYPE {name} {family.metric_type}")
+                lines += [
+                    f"{name}{_format_labels(labels)} {value:g}"
+                    for labels, value in sorted(family.samples.items())
+                ]
+            for name, histogram in sorted(self._histograms.items()):
+                lines.append(f"# HELP {name} {histogram.description}")
+                lines.append(f"# TYPE {name} histogram")
+                for labels, counts in sorted(histogram.counts.items()):
+                    bounds = [f"{bound:g}" for bound in histogram.buckets] + ["+Inf"]
+                    lines += [
+                        f"{name}_bucket{_format_labels((*labels, ('le', bound)))} {count}"
+                        for bound, count in zip(bounds, counts)
+                    ]
+                    lines.append(
+                        f"{name}_sum{_format_labels(labels)} {histogram.sums[labels]:g}"
+                    )
+                    lines.append(f"{name}_count{_format_labels(labels)} {counts[-1]}")
+        return "\n".join(lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Serve the Registry on the Metrics Path
+    """
+
+    server: "_MetricsHTTPServer"
+
+    def do_GET(self) -> None:
+        """
+        Answer a Scrape
+        """
+        if self.path.split("?")[0] != InstrumentationConfig.METRICS_PATH:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+        content = self.server.registry.to_prometheus().encode("utf-8")
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, message: str, *args: Any) -> None:
+        """
+        Log Scrapes at DEBUG Level Instead of to stderr
+        """
+        logger.debug("%s - %s", self.address_string(), message % args)
+
+
+class _MetricsHTTPServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP Server Holding a Reference to its Registry
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], registry: MetricsRegistry) -> None:
+        """
+        Bind the Server
+        """
+        super().__init__(address, _MetricsHandler)
+        self.registry = registry
+
+
+class MetricsSink(LiveSink):
+    """
+    Serve Instrumentation as Prometheus Metrics over HTTP
+
+    Counters become `camply_<name>_total` with their labels, spans become
+    the `camply_span_duration_seconds` histogram and every poll lands in
+    `camply_poll_duration_seconds`. Notification latency is the duration
+    of the `notify` poll.
+    """
+
+    def __init__(
+        self, host: str = InstrumentationConfig.METRICS_HOST, port: int = 0
+    ) -> None:
+        """
+        Start Serving in a Background Thread
+
+        Parameters
+        ----------
+        host: str
+        port: int
+            Port to listen on, 0 picks a free one
+        """
+        self.registry = MetricsRegistry()
+        self.registry.set(
+            "camply_start_time_seconds", time.time(), "When the process started"
+        )
+        self._server = _MetricsHTTPServer((host, port), self.registry)
+        self._thread: Optional[threading.Thread] = threading.Thread(
+            target=self._server.serve_forever, name="camply-metrics", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Serving Metrics on %s%s", self.url, InstrumentationConfig.METRICS_PATH
+        )
+
+    def __repr__(self) -> str:
+        """
+        String Representation
+        """
+        return f"<{self.__class__.__name__}: {self.url}>"
+
+    @property
+    def url(self) -> str:
+        """
+        Base URL the Metrics are Served on
+        """
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def emit(self, record: PollRecord) -> None:
+        """
+        Record a Poll's Duration and Outcome
+        """
+        outcome = "success" if record.error is None else "error"
+        self.registry.observe(
+            "camply_poll_duration_seconds",
+            record.duration,
+            "Duration of each poll",
+            poll=record.name,
+        )
+        self.registry.inc(
+            "camply_polls_total",
+            1,
+            "Polls by outcome",
+            poll=record.name,
+            outcome=outcome,
+        )
+        if record.error is None:
+            self.registry.set(
+                "camply_last_success_timestamp_seconds",
+                time.time(),
+                "When each kind of poll last succeeded",
+                poll=record.name,
+            )
+
+    def record_span(self, name: str, seconds: float, labels: Labels) -> None:
+        """
+        Observe a Span in the Span Duration Histogram
+        """
+        self.registry.observe(
+            "camply_span_duration_seconds",
+            seconds,
+            "Time spent in each span",
+            span=name,
+            **labels,
+        )
+
+    def record_count(self, name: str, value: float, labels: Labels) -> None:
+        """
+        Add to a Counter
+        """
+        self.registry.inc(f"camply_{metric_name(name)}_total", value, name, **labels)
+
+    def close(self) -> None:
+        """
+        Stop Serving and Release the Port
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+            self._server.server_close()
@@ -0,0 +1,332 @@
+"""
+Profiling Mode: `camply --profile`
+
+Runs a whole camply command under a profiler and `tracemalloc`, writes the
+profile to a file and prints the hottest code paths and the largest
+allocations when the command exits. `cProfile` output is written as pstats
+(open it with `snakeviz` or `python -m pstats`), profiles ending in `.json`
+come from a sampling profiler instead and are written in the speedscope
+format (open them at https://www.speedscope.app).
+"""
+
+import cProfile
+import io
+import json
+import logging
+import pathlib
+import pstats
+import sys
+import threading
+import tracemalloc
+from abc import ABC, abstractmethod
+from collections import Counter
+from types import FrameType
+from typing import Counter as CounterType
+from typing import Dict, List, Optional, Tuple, Union
+
+from camply.config.instrumentation_config import InstrumentationConfig
+
+logger = logging.getLogger(__name__)
+
+FrameKey = Tuple[str, str, int]
+Stack = Tuple[int, ...]
+
+
+class Profiler(ABC):
+    """
+    Profiler Writing a Profile File and Summarizing its Hot Paths
+    """
+
+    @abstractmethod
+    def start(self) -> None:
+        """
+        Start Profiling
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """
+        Stop Profiling
+        """
+
+    @abstractmethod
+    def write(self, path: pathlib.Path) -> None:
+        """
+        Write the Profile to a File
+        """
+
+    @abstractmethod
+    def hot_paths(self, limit: int) -> str:
+        """
+        Summarize the Hottest Code Paths
+        """
+
+
+class CProfileProfiler(Profiler):
+    """
+    Deterministic Profile of the Main Thread, Written as pstats
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize the Profiler
+        """
+        self.profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """
+        Start Profiling
+        """
+        self.profile.enable()
+
+    def stop(self) -> None:
+        """
+        Stop Profiling
+        """
+        self.profile.disable()
+
+    def write(self, path: pathlib.Path) -> None:
+        """
+        Write the Profile as pstats
+        """
+        self.profile.dump_stats(str(path))
+
+    def hot_paths(self, limit: int) -> str:
+        """
+        Functions with the Most Cumulative Time
+        """
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+        return stream.getvalue().strip()
+
+
+class SamplingProfiler(Profiler):
+    """
+    Statistical Profile of Every Thread, Written in the Speedscope Format
+
+    A background thread records the stack of every other thread each
+    `interval` seconds. Identical stacks are only kept once, with a count,
+    so memory stays flat over long continuous searches.
+    """
+
+    def __init__(
+        self, interval: float = InstrumentationConfig.PROFILE_SAMPLING_INTERVAL
+    ) -> None:
+        """
+        Initialize the Profiler
+
+        Parameters
+        ----------
+        interval: float
+            Seconds between samples
+        """
+        self.interval = interval
+        self.frames: Dict[FrameKey, int] = {}
+        self.samples: CounterType[Stack] = Counter()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _frame_index(self, frame: FrameType) -> int:
+        """
+        Index of a Frame's Function in the Shared Frame Table
+        """
+        code = frame.f_code
+        key = (code.co_name, code.co_filename, code.co_firstlineno)
+        return self.frames.setdefault(key, len(self.frames))
+
+    def _thread_index(self, name: str) -> int:
+        """
+        Index of a Pseudo-Frame Grouping Stacks by Thread
+        """
+        return self.frames.setdefault((f"Thread: {name}", "", 0), len(self.frames))
+
+    def sample(self) -> None:
+        """
+        Record the Current Stack of Every Other Thread
+        """
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == threading.get_ident():
+                continue
+            stack: List[int] = []
+            current: Optional[FrameType] = frame
+            while current is not None:
+                stack.append(self._frame_index(current))
+                current = current.f_back
+            stack.append(self._thread_index(names.get(thread_id, str(thread_id))))
+            self.samples[tuple(reversed(stack))] += 1
+
+    def _run(self) -> None:
+        """
+        Sample Until Stopped
+        """
+        while not self._stopped.wait(self.interval):
+            self.sample()
+
+    def start(self) -> None:
+        """
+        Start Sampling in a Background Thread
+        """
+        self._thread = threading.Thread(
+            target=self._run, name="camply-profiler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop Sampling
+        """
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def to_speedscope(self) -> Dict[str, object]:
+        """
+        The Profile in the Speedscope File Format
+        """
+        stacks = list(self.samples.items())
+        frames = sorted(self.frames.items(), key=lambda item: item[1])
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": "camply",
+            "exporter": "camply",
+            "shared": {
+                "frames": [
+                    {"name": name, "file": file, "line": line}
+                    for (name, file, line), _ in frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": "camply",
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(count for _, count in stacks) * self.interval,
+                    "samples": [list(stack) for stack, _ in stacks],
+                    "weights": [count * self.interval for _, count in stacks],
+                }
+            ],
+        }
+
+    def write(self, path: pathlib.Path) -> None:
+        """
+        Write the Profile as Speedscope JSON
+        """
+        path.write_text(json.dumps(self.to_speedscope()), encoding="utf-8")
+
+    def hot_paths(self, limit: int) -> str:
+        """
+        Functions Most Often on the Stack, and Most Often Running
+        """
+        total = sum(self.samples.values())
+        if total == 0:
+            return "No samples recorded"
+        names = {
+            index: f"{name} ({pathlib.Path(file).name}:{line})"
+            for (name, file, line), index in self.frames.items()
+        }
+        inclusive: CounterType[int] = Counter()
+        own: CounterType[int] = Counter()
+        for stack, count in self.samples.items():
+            for index in set(stack[1:]):
+                inclusive[index] += count
+            own[stack[-1]] += count
+        lines = [f"{total} samples every {self.interval * 1000:g}ms"]
+        for title, counter in [("On the stack", inclusive), ("Running", own)]:
+            lines.append(f"{title}:")
+            lines += [
+                f"  {count / total:6.1%}  {names[index]}"
+                for index, count in counter.most_common(limit)
+            ]
+        return "\n".join(lines)
+
+
+class ProfilingSession:
+    """
+    Profile and Trace Allocations Until Stopped, Then Report
+    """
+
+    def __init__(self, output: Union[str, pathlib.Path]) -> None:
+        """
+        Initialize the Session
+
+        Parameters
+        ----------
+        output: Union[str, pathlib.Path]
+            File to write the profile to. A `.json` file gets a sampled
+            speedscope profile, anything else a cProfile pstats file.
+        """
+        self.output = pathlib.Path(output).expanduser()
+        self.profiler: Profiler = (
+            SamplingProfiler()
+            if self.output.suffix.lower() == ".json"
+            else CProfileProfiler()
+        )
+
+    def start(self) -> "ProfilingSession":
+        """
+        Start Profiling and Tracing Allocations
+
+        Returns
+        -------
+        ProfilingSession
+        """
+        tracemalloc.start(InstrumentationConfig.PROFILE_TRACEMALLOC_FRAMES)
+        self.profiler.start()
+        return self
+
+    @staticmethod
+    def allocations(snapshot: tracemalloc.Snapshot, limit: int) -> str:
+        """
+        Summarize the Lines Holding the Most Memory
+
+        Parameters
+        ----------
+        snapshot: tracemalloc.Snapshot
+        limit: int
+
+        Returns
+        -------
+        str
+        """
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            ]
+        )
+        return "\n".join(
+            f"  {stat.size / 1024:10.1f} KiB {stat.count:8} blocks  "
+            f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}"
+            for stat in snapshot.statistics("lineno")[:limit]
+        )
+
+    def stop(self) -> str:
+        """
+        Stop, Write the Profile and Build the Report
+
+        Returns
+        -------
+        str
+        """
+        self.profiler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        self.profiler.write(self.output)
+        limit = InstrumentationConfig.PROFILE_TOP_N
+        return "\n".join(
+            [
+                f"Profile written to {self.output}",
+                "Hot paths:",
+                self.profiler.hot_paths(limit),
+                f"Top allocations still held (peak {peak / 1024 ** 2:.1f} MiB):",
+                self.allocations(snapshot, limit),
+            ]
+        )
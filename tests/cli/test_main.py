@@ -2,10 +2,16 @@
 CLI Testing: `camply ...`
 """
 
+import json
 import logging
+import pathlib
+import pstats
+
+import pytest
 
 from camply import __version__
 from camply.cli import camply_command_line
+from camply.testing import SyntheticAvailability, fake_transport
 from tests.conftest import CamplyRunner, cli_status_checker, vcr_cassette
 
 logger = logging.getLogger(__name__)
@@ -35,3 +41,40 @@ def test_debug(cli_runner: CamplyRunner) -> None:
     result = cli_runner.run_camply_command(command=test_command)
     assert __version__ in result.output
     cli_status_checker(result=result)
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+@pytest.mark.parametrize("file_name", ["camply.prof", "camply.speedscope.json"])
+def test_profile(
+    cli_runner: CamplyRunner,
+    synthetic: SyntheticAvailability,
+    tmp_path: pathlib.Path,
+    file_name: str,
+) -> None:
+    """
+    Profile a Search, Writing pstats or Speedscope and Reporting Hot Paths
+    """
+    profile_path = tmp_path / file_name
+    test_command = f"""
+    camply \
+        --profile-output {profile_path} \
+        campsites \
+        --campground 1000 \
+        --start-date 2023-09-01 \
+        --end-date 2023-09-03
+    """
+    with fake_transport(synthetic):
+        result = cli_runner.run_camply_command(command=test_command)
+    cli_status_checker(result=result)
+    assert f"Profile written to {profile_path}" in result.output
+    assert "Hot paths:" in result.output
+    assert "Top allocations still held" in result.output
+    if profile_path.suffix == ".json":
+        profile = json.loads(profile_path.read_text())
+        assert profile["profiles"][0]["type"] == "sampled"
+        assert len(profile["shared"]["frames"]) > 0
+    else:
+        stats = pstats.Stats(str(profile_path))
+        assert any(
+            function == "get_matching_campsites" for _, _, function in stats.stats
+        )
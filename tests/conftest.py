@@ -4,6 +4,8 @@ Pytest Fixtures Shared Across all Unit Tests
 
 import datetime
 import logging
+import pathlib
+import sys
 from textwrap import dedent
 from typing import Any, Dict
 
@@ -13,8 +15,31 @@ from freezegun import freeze_time
 
 from camply import AvailableCampsite
 from camply.cli import camply_command_line
+from camply.config.api_config import (
+    GoingToCampConfig,
+    RecreationBookingConfig,
+    RIDBConfig,
+    UseDirectConfig,
+    YellowstoneConfig,
+)
+from camply.notifications import CAMPSITE_NOTIFICATIONS
+from camply.providers import GoingToCamp, Yellowstone
+from camply.providers.recreation_dot_gov.recdotgov_provider import (
+    RecreationDotGovBase,
+)
+from camply.providers.usedirect.usedirect import UseDirectProvider
+from camply.search import CAMPSITE_SEARCH_PROVIDER
+from camply.testing import SyntheticAvailability
+from camply.utils.concurrency_utils import HostRateLimiter
 
 logger = logging.getLogger(__name__)
+# Providers and notifiers are imported lazily, import them all before any
+# test freezes the time - pandas won't import with freezegun's `datetime`
+[
+    registry[name]
+    for registry in [CAMPSITE_SEARCH_PROVIDER, CAMPSITE_NOTIFICATIONS]
+    for name in registry
+]
 [
     logging.getLogger(loggo).setLevel(logging.WARNING)
     for loggo in [
@@ -41,6 +66,73 @@ def freeze_current_time():
         yield
 
 
+@pytest.fixture(autouse=True)
+def isolated_provider_cache(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> pathlib.Path:
+    """
+    Keep Providers' Offline Caches Out of the Package Directory
+
+    Every test starts with an empty cache, and no local RIDB catalog, so
+    cassettes are exercised
+    """
+    cache_dir = tmp_path / "provider_cache"
+    for provider in (GoingToCamp, Yellowstone):
+        monkeypatch.setattr(provider, "__offline_cache_dir__", cache_dir)
+    monkeypatch.setattr(RIDBConfig, "CATALOG_PATH", str(cache_dir / "ridb.sqlite"))
+    return cache_dir
+
+
+@pytest.fixture(autouse=True)
+def serial_provider_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Issue Provider HTTP Requests One at a Time
+
+    vcrpy temporarily un-patches the connection classes while it opens a
+    connection, so concurrent requests can escape the cassette. Providers
+    still go through their concurrent code paths, just with a single worker.
+    """
+    for config in (GoingToCampConfig, RIDBConfig, UseDirectConfig, YellowstoneConfig):
+        monkeypatch.setattr(config, "MAX_CONCURRENT_REQUESTS", 1)
+
+
+@pytest.fixture(autouse=True)
+def unthrottled_ridb(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Don't Hold Replayed Cassettes to the RIDB's Per-Minute Rate Limit
+    """
+    monkeypatch.setattr(
+        RecreationDotGovBase,
+        "ridb_rate_limiter",
+        HostRateLimiter(calls=sys.maxsize, period=1.0),
+    )
+
+
+@pytest.fixture
+def synthetic() -> SyntheticAvailability:
+    """
+    A Small Synthetic Dataset
+    """
+    return SyntheticAvailability(campgrounds=3, sites=10, density=0.6)
+
+
+@pytest.fixture
+def unthrottled_providers(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Skip Rate Limiting and Keep Every Provider Cache Empty
+
+    For searches against synthetic data, which has no rate limits to respect
+    """
+    for provider in (GoingToCamp, Yellowstone, UseDirectProvider):
+        monkeypatch.setattr(provider, "__offline_cache_dir__", tmp_path / "synthetic")
+        monkeypatch.setattr(
+            provider, "rate_limiter", HostRateLimiter(calls=sys.maxsize, period=1.0)
+        )
+    monkeypatch.setattr(RecreationBookingConfig, "RATE_LIMITING", (0.0, 0.0))
+
+
 class CamplyRunner(CliRunner):
     """
     Custom CLI Runner for Camply
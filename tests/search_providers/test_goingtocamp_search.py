@@ -3,12 +3,16 @@ GoingToCamp Testing Provider
 """
 
 import logging
-from datetime import datetime
+import pathlib
+from datetime import date, datetime
+from typing import Any, Dict, List, Set, Tuple
 
 import pytest
 
-from camply.containers import AvailableCampsite, SearchWindow
+from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
+from camply.providers import GoingToCamp
 from camply.search import SearchGoingToCamp
+from camply.testing import SyntheticAvailability, fake_transport
 from tests.conftest import vcr_cassette
 
 logger = logging.getLogger(__name__)
@@ -61,3 +65,226 @@ def test_going_to_camp_get_all_campsites(
     assert all_campsites
     for camp in all_campsites:
         assert isinstance(camp, AvailableCampsite)
+
+
+@vcr_cassette
+def test_going_to_camp_site_details_cached(tmp_path: pathlib.Path) -> None:
+    """
+    Site Details are Cached on Disk per (rec_area, resource_id)
+    """
+    resource_ids = ["-2147482738", "-2147482736", "-2147482738"]
+    provider = GoingToCamp()
+    provider.__offline_cache_dir__ = tmp_path
+    details = provider.get_sites_details(1, resource_ids)
+    assert set(details) == set(resource_ids)
+    assert tmp_path.joinpath(
+        "longpoint.goingtocamp.com", "sites", "-2147482738.json"
+    ).exists()
+    # The cassette only holds a single response per site
+    cached_provider = GoingToCamp()
+    cached_provider.__offline_cache_dir__ = tmp_path
+    cached_details = cached_provider.get_sites_details(1, resource_ids)
+    assert cached_details == details
+    assert "site_attributes" in cached_details["-2147482736"]
+
+
+@vcr_cassette
+def test_going_to_camp_map_hierarchy_cached() -> None:
+    """
+    Nested Maps are Crawled Once, Later Searches Only Request Site Maps
+    """
+    campground = CampgroundFacility(
+        facility_name="Whycocomagh Provincial Park",
+        recreation_area="Nova Scotia",
+        facility_id=-2147483629,
+        recreation_area_id=13,
+        map_id=-2147483569,
+    )
+    provider = GoingToCamp()
+    search_kwargs = {
+        "campground": campground,
+        "start_date": date(2023, 7, 1),
+        "end_date": date(2023, 7, 14),
+        "equipment_type_id": None,
+    }
+    sites = provider.list_site_availability(**search_kwargs)
+    assert {site.map_id for site in sites} == {-2147483568, -2147483567}
+    # The cassette holds the root map response only once
+    cached_sites = provider.list_site_availability(**search_kwargs)
+    assert cached_sites == sites
+
+
+@vcr_cassette
+def test_going_to_camp_multiple_rec_areas(
+    search_window: SearchWindow, caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Multiple Recreation Areas (Hosts) Can be Searched at Once
+    """
+    with caplog.at_level(logging.WARNING):
+        gtc_finder = SearchGoingToCamp(
+            search_window=search_window,
+            recreation_area=[1, 13],  # Long Point Region, Nova Scotia
+            campgrounds=["-2147483643", "-2147483629"],
+        )
+    found = {
+        (campground.recreation_area_id, campground.facility_id)
+        for campground in gtc_finder.campgrounds
+    }
+    assert {rec_area_id for rec_area_id, _ in found} == {1, 13}
+    assert (13, -2147483629) in found
+    # Campground IDs are only unique within a recreation area's host, an ID
+    # matching on more than one host is ambiguous and gets flagged
+    assert "Campground #-2147483643 matches Recreation Areas 1, 13" in caplog.text
+    assert "Campground #-2147483629 matches" not in caplog.text
+
+
+def test_going_to_camp_equipment_id_single_rec_area(
+    search_window: SearchWindow,
+) -> None:
+    """
+    Equipment IDs Can't be Shared Across Recreation Areas
+    """
+    with pytest.raises(SystemExit):
+        SearchGoingToCamp(
+            search_window=search_window,
+            recreation_area=[1, 13],
+            campgrounds=["-2147483643"],
+            equipment_id=-32768,
+        )
+
+
+def test_going_to_camp_merge_search_windows() -> None:
+    """
+    Overlapping Search Windows are Merged into Minimal Date Ranges
+    """
+    windows = [
+        (date(2023, 7, 3), date(2023, 7, 8)),
+        (date(2023, 9, 1), date(2023, 9, 2)),
+        (date(2023, 7, 1), date(2023, 7, 5)),
+        (date(2023, 7, 8), date(2023, 7, 10)),
+    ]
+    assert SearchGoingToCamp._merge_search_windows(windows) == [
+        (
+            (date(2023, 7, 1), date(2023, 7, 8)),
+            [windows[2], windows[0]],
+        ),
+        ((date(2023, 7, 8), date(2023, 7, 10)), [windows[3]]),
+        ((date(2023, 9, 1), date(2023, 9, 2)), [windows[1]]),
+    ]
+
+
+@pytest.fixture
+def overlapping_windows() -> List[SearchWindow]:
+    """
+    Two Search Windows Sharing a Night in September 2023
+
+    Returns
+    -------
+    List[SearchWindow]
+    """
+    return [
+        SearchWindow(start_date=date(2023, 9, 1), end_date=date(2023, 9, 4)),
+        SearchWindow(start_date=date(2023, 9, 3), end_date=date(2023, 9, 6)),
+    ]
+
+
+class UndatedSyntheticAvailability(SyntheticAvailability):
+    """
+    A GoingToCamp Host that Ignores `getDailyAvailability`
+    """
+
+    def going_to_camp_map(self, *args, daily: bool = False, **kwargs) -> Dict[str, Any]:
+        """
+        Availability of a Map - Always One Entry for the Whole Stay
+        """
+        return super().going_to_camp_map(*args, daily=False, **kwargs)
+
+
+def _per_window_availability(
+    synthetic: SyntheticAvailability, search_windows: List[SearchWindow]
+) -> Set[Tuple[int, date, date]]:
+    """
+    Sites Available for Each Overlapping Window via `list_site_availability`
+    """
+    with fake_transport(synthetic):
+        finder = SearchGoingToCamp(
+            search_window=search_windows[0],
+            recreation_area=[1],
+            campgrounds=[1000],
+        )
+        campground = finder.campgrounds[0]
+        expected = set()
+        for search_window in search_windows:
+            start_date = search_window.start_date
+            end_date = search_window.end_date
+            sites = finder.campsite_finder.list_site_availability(
+                campground=campground,
+                start_date=start_date,
+                end_date=end_date,
+                equipment_type_id=None,
+            )
+            expected |= {
+                (int(site.resource_id), start_date, end_date) for site in sites
+            }
+    return expected
+
+
+def _overlapping_search(
+    synthetic: SyntheticAvailability, search_windows: List[SearchWindow]
+) -> Tuple[Set[Tuple[int, date, date]], List[str]]:
+    """
+    Search Both Overlapping Windows at Once
+    """
+    with fake_transport(synthetic) as transport:
+        campsites = SearchGoingToCamp(
+            search_window=search_windows,
+            recreation_area=[1],
+            campgrounds=[1000],
+        ).get_all_campsites()
+    found = {
+        (
+            int(campsite.campsite_id),
+            campsite.booking_date.date(),
+            campsite.booking_end_date.date(),
+        )
+        for campsite in campsites
+    }
+    map_requests = [
+        request.url
+        for request in transport.requests
+        if "availability/map" in request.url
+    ]
+    return found, map_requests
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+def test_going_to_camp_merged_windows_match_per_window(
+    overlapping_windows: List[SearchWindow],
+) -> None:
+    """
+    Nightly Availability Split into Overlapping Windows Matches Searching Each
+    """
+    synthetic = SyntheticAvailability(campgrounds=1, sites=60, density=0.8)
+    expected = _per_window_availability(synthetic, overlapping_windows)
+    found, map_requests = _overlapping_search(synthetic, overlapping_windows)
+    assert len(expected) > 0
+    assert found == expected
+    assert all("getDailyAvailability=True" in url for url in map_requests)
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+def test_going_to_camp_merged_windows_fall_back(
+    overlapping_windows: List[SearchWindow], caplog: pytest.LogCaptureFixture
+) -> None:
+    """
+    Each Window is Searched on its Own When Nightly Availability is Missing
+    """
+    synthetic = UndatedSyntheticAvailability(campgrounds=1, sites=60, density=0.8)
+    expected = _per_window_availability(synthetic, overlapping_windows)
+    with caplog.at_level(logging.WARNING):
+        found, map_requests = _overlapping_search(synthetic, overlapping_windows)
+    assert len(expected) > 0
+    assert found == expected
+    assert "Expected 5 nights of availability" in caplog.text
+    assert any("getDailyAvailability=False" in url for url in map_requests)
@@ -2,13 +2,23 @@
 Yellowstone Testing Provider
 """
 
+import json
 import logging
-from datetime import datetime
+import pathlib
+import zipfile
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+from urllib import parse
 
 import pytest
 
+from camply.config import RIDBConfig
+from camply.config.search_config import EquipmentConfig
 from camply.containers import AvailableCampsite, CampgroundFacility, SearchWindow
+from camply.providers import RecreationDotGov
+from camply.providers.recreation_dot_gov.ridb_catalog import RIDBCatalog
 from camply.search import SearchRecreationDotGov
+from camply.testing import SyntheticAvailability, fake_transport
 from tests.conftest import vcr_cassette
 
 logger = logging.getLogger(__name__)
@@ -170,3 +180,182 @@ def test_get_campsite_specific_results(
     assert all_campsites
     for camp in all_campsites:
         assert isinstance(camp, AvailableCampsite)
+
+
+@pytest.mark.parametrize("max_results, expected", [(None, 130), (75, 75)])
+def test_ridb_pagination(
+    monkeypatch: pytest.MonkeyPatch, max_results: Optional[int], expected: int
+) -> None:
+    """
+    Pages After the First are Fetched Concurrently, in Order and Up to a Cap
+    """
+    monkeypatch.setattr(RIDBConfig, "MAX_CONCURRENT_REQUESTS", 4)
+    synthetic = SyntheticAvailability(campgrounds=130, sites=1)
+    with fake_transport(synthetic) as transport:
+        provider = RecreationDotGov()
+        pages = list(
+            provider._ridb_iter_pages(
+                path=RIDBConfig.FACILITIES_API_PATH, max_results=max_results
+            )
+        )
+    facility_ids = [facility["FacilityID"] for page in pages for facility in page]
+    assert facility_ids == [str(i) for i in synthetic.facility_ids][:expected]
+    assert len(transport.requests) == len(pages) == -(-expected // 50)
+
+
+def test_ridb_catalog(
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+    synthetic: SyntheticAvailability,
+) -> None:
+    """
+    Once the Catalog is Synced, Lookups are Served Locally
+    """
+    catalog_path = tmp_path / "ridb.sqlite"
+    with fake_transport(synthetic) as transport:
+        live = RecreationDotGov()
+        rec_areas = live.find_recreation_areas(search_string="Synthetic")
+        campgrounds = live.find_campgrounds(rec_area_id=[1])
+        with RIDBCatalog(path=catalog_path) as catalog:
+            assert live.refresh_catalog(catalog=catalog) == len(rec_areas) + 3
+            assert catalog.cursor == date(2023, 1, 1)
+            live.refresh_catalog(catalog=catalog)
+        assert transport.requests[-1].url.endswith("lastupdated=01-01-2023&offset=0")
+        monkeypatch.setattr(RIDBConfig, "CATALOG_PATH", str(catalog_path))
+        transport.requests.clear()
+        provider = RecreationDotGov()
+        assert provider.find_recreation_areas(search_string="synth area") == rec_areas
+        assert provider.find_recreation_areas(state="CA") == []
+        assert provider.find_campgrounds(rec_area_id=[1]) == campgrounds
+        assert provider.find_campgrounds(campground_id=[1001]) == campgrounds[1:2]
+        assert (
+            provider.find_campgrounds(search_string="campground 2", state="or")
+            == (campgrounds[2:])
+        )
+    assert transport.requests == []
+
+
+def test_ridb_catalog_export(
+    tmp_path: pathlib.Path, synthetic: SyntheticAvailability
+) -> None:
+    """
+    The RIDB Export's Tables are Joined into API Shaped Records
+    """
+    facilities = [synthetic.ridb_facility(i) for i in synthetic.facility_ids]
+    rec_areas = [synthetic.ridb_rec_area(i) for i in synthetic.rec_area_ids]
+    tables = {
+        "Facilities": [
+            {key: value for key, value in facility.items() if not key.isupper()}
+            for facility in facilities
+        ],
+        "FacilityAddresses": [
+            dict(facility["FACILITYADDRESS"][0], FacilityID=facility["FacilityID"])
+            for facility in facilities
+        ],
+        "RecAreas": [
+            {key: value for key, value in rec_area.items() if not key.isupper()}
+            for rec_area in rec_areas
+        ],
+        "RecAreaAddresses": [
+            dict(rec_area["RECAREAADDRESS"][0], RecAreaID=rec_area["RecAreaID"])
+            for rec_area in rec_areas
+        ],
+        "RecAreaFacilities": [
+            {
+                "RecAreaID": facility["ParentRecAreaID"],
+                "FacilityID": facility["FacilityID"],
+            }
+            for facility in facilities
+        ],
+        "Organizations": [{"OrgID": 1, "OrgName": "Synthetic Parks Service"}],
+        "OrgEntities": [
+            {"OrgID": 1, "EntityID": facility["FacilityID"], "EntityType": "Facility"}
+            for facility in facilities
+        ],
+    }
+    archive = tmp_path / "RIDBFullExport_V1_JSON.zip"
+    with zipfile.ZipFile(archive, "w") as export:
+        for name, records in tables.items():
+            export.writestr(
+                f"export/{name}_API_v1.json", json.dumps({"RECDATA": records})
+            )
+    with RIDBCatalog(path=tmp_path / "ridb.sqlite") as catalog:
+        assert catalog.synced_at is None
+        assert catalog.sync_export(source=archive) == len(facilities) + len(rec_areas)
+        assert catalog.synced_at is not None
+        assert [
+            RecreationDotGov._process_rec_area_response(recreation_area=record)[1]
+            for record in catalog.rec_areas(query="Recreation")
+        ] == [
+            RecreationDotGov._process_rec_area_response(recreation_area=rec_area)[1]
+            for rec_area in rec_areas
+        ]
+        assert [
+            RecreationDotGov.process_facilities_responses(facility=record)[1]
+            for record in catalog.facilities(activity="CAMPING", state="WA,OR")
+        ] == [
+            RecreationDotGov.process_facilities_responses(facility=facility)[1]
+            for facility in facilities
+        ]
+        assert catalog.facility(facility_id=1001)["RECAREA"] == facilities[1]["RECAREA"]
+
+
+def test_specific_campsites(
+    monkeypatch: pytest.MonkeyPatch, synthetic: SyntheticAvailability
+) -> None:
+    """
+    Each Distinct Campsite and Facility is Fetched Once, Concurrently
+    """
+    monkeypatch.setattr(RIDBConfig, "MAX_CONCURRENT_REQUESTS", 4)
+    campsite_ids = synthetic.campsite_ids(1000) + synthetic.campsite_ids(1001)[:2]
+    with fake_transport(synthetic) as transport:
+        provider = RecreationDotGov()
+        facilities = provider.find_campgrounds(
+            campsite_id=campsite_ids + campsite_ids[:3]
+        )
+        assert provider.find_campgrounds(campsite_id=campsite_ids) == facilities
+    assert [facility.facility_id for facility in facilities] == [1000] * 10 + [1001] * 2
+    assert sorted(
+        parse.urlparse(request.url).path for request in transport.requests
+    ) == (
+        sorted(
+            [f"/api/v1/campsites/{campsite_id}" for campsite_id in campsite_ids]
+            + ["/api/v1/facilities/1000", "/api/v1/facilities/1001"]
+        )
+    )
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+@pytest.mark.parametrize(
+    "equipment", [[("RV", 25)], [("Tent", None), ("trailer", 40)], [("Vehicle", None)]]
+)
+def test_equipment_filter(
+    synthetic: SyntheticAvailability, equipment: List[Tuple[str, Optional[int]]]
+) -> None:
+    """
+    Campsites are Matched to Equipment Once, from their Metadata
+    """
+    search_window = SearchWindow(
+        start_date=datetime(2023, 9, 1), end_date=datetime(2023, 9, 5)
+    )
+    with fake_transport(synthetic):
+        search = SearchRecreationDotGov(
+            search_window=search_window, campgrounds=[1000], equipment=equipment
+        )
+        campsites = search.get_all_campsites()
+    expected = set()
+    for campsite_id in synthetic.campsite_ids(1000):
+        details = synthetic.campsite_details(campsite_id)
+        names = {
+            EquipmentConfig.EQUIPMENT_REVERSE_MAPPING[name]
+            for name in details["equipment"]
+        }
+        if any(
+            name.lower() in names
+            and (length is None or details["max_length"] >= length)
+            for name, length in equipment
+        ):
+            expected.add(campsite_id)
+    assert search.equipment_campsite_ids == expected
+    assert {campsite.campsite_id for campsite in campsites} <= expected
+    assert len(campsites) > 0 or len(expected) == 0
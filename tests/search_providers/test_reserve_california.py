@@ -5,8 +5,10 @@ ReserveCalifornia Testing
 import datetime
 import os
 import pathlib
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
+import pytest
 from dateutil.relativedelta import relativedelta
 from pytest import MonkeyPatch
 
@@ -172,3 +174,40 @@ def test_rc_cli_campgrounds_env_var(
     cli_status_checker(result=result, exit_code_zero=True)
     assert "Bodega Dunes" in result.output
     assert 'Using Camply Provider: "ReserveCalifornia"' in result.output
+
+
+@vcr_cassette
+def test_rc_campsite_metadata_cached(tmp_path: pathlib.Path) -> None:
+    """
+    Cached Results: Campsite Unit Catalog is Persisted per Facility
+    """
+    prov = ReserveCalifornia()
+    prov.__offline_cache_dir__ = tmp_path
+    campsites = prov.get_campsite_metadata(facility_ids=[598, 598])
+    assert 43467 in campsites
+    assert tmp_path.joinpath("units", "598.json").exists()
+    # The cassette only holds a single availability grid response
+    cached_prov = ReserveCalifornia()
+    cached_prov.__offline_cache_dir__ = tmp_path
+    cached_campsites = cached_prov.get_campsite_metadata(facility_ids=[598])
+    assert set(cached_campsites) == set(campsites)
+    assert cached_campsites[43467].Name == campsites[43467].Name
+
+
+@vcr_cassette
+def test_rc_shared_metadata(tmp_path: pathlib.Path) -> None:
+    """
+    Metadata is Shared Read-Only, Search State is Per-Instance
+    """
+    first = ReserveCalifornia()
+    first.__offline_cache_dir__ = tmp_path
+    second = ReserveCalifornia()
+    second.__offline_cache_dir__ = tmp_path
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda prov: prov.refresh_metadata(), [first, second]))
+    assert first.usedirect_campgrounds is second.usedirect_campgrounds
+    assert len(first.usedirect_campgrounds) > 0
+    with pytest.raises(TypeError):
+        first.usedirect_campgrounds[0] = None
+    first.campsite_ids.append(1)
+    assert second.campsite_ids == []
@@ -3,12 +3,22 @@ Yellowstone Testing Provider
 """
 
 import logging
-from datetime import datetime
+import pathlib
+import time
+from datetime import datetime, timedelta
+from typing import List
 
 import pytest
+import requests
+from pandas import DataFrame, to_datetime
 
+from camply.config.api_config import YellowstoneConfig
 from camply.containers import AvailableCampsite, SearchWindow
+from camply.containers.api_responses import XantResortData
+from camply.providers import Yellowstone
+from camply.providers.base_provider import ProviderError
 from camply.search import SearchYellowstone
+from camply.utils.concurrency_utils import CircuitBreaker
 from tests.conftest import vcr_cassette
 
 logger = logging.getLogger(__name__)
@@ -54,3 +64,193 @@ def test_yellowstone_get_all_campsites(yellowstone_finder) -> None:
     all_campsites = yellowstone_finder.get_all_campsites()
     for camp in all_campsites:
         assert isinstance(camp, AvailableCampsite)
+
+
+@vcr_cassette
+def test_yellowstone_property_info_cached(tmp_path: pathlib.Path) -> None:
+    """
+    Property Information is Cached on Disk per Facility
+    """
+    available_rooms = [{"facility_id": "YLYB:RV"}, {"facility_id": "YLYC:RV"}]
+    provider = Yellowstone()
+    provider.__offline_cache_dir__ = tmp_path
+    property_info = provider._get_property_information(available_rooms)
+    assert {item["facility_id"] for item in property_info} == {"YLYB:RV", "YLYC:RV"}
+    assert tmp_path.joinpath("property", "YLYB_RV.json").exists()
+    # The cassette only holds a single response per property
+    cached_provider = Yellowstone()
+    cached_provider.__offline_cache_dir__ = tmp_path
+    assert cached_provider._get_property_information(available_rooms) == property_info
+
+
+def _legacy_assemble_campsites(
+    monthly_campsites: List[dict],
+    available_rooms: List[dict],
+    property_info: List[dict],
+    nights: int,
+) -> List[AvailableCampsite]:
+    """
+    The Original DataFrame Based Assembly - Kept as a Parity Reference
+    """
+    campsite_data = DataFrame(
+        monthly_campsites, columns=["facility_id", "facility_name", "booking_url"]
+    ).drop_duplicates()
+    merged_campsites = DataFrame(available_rooms).merge(
+        DataFrame(property_info), on=["facility_id", "campsite_code"]
+    )
+    merged_campsites["booking_date"] = to_datetime(merged_campsites["booking_date"])
+    merged_campsites["booking_end_date"] = merged_campsites["booking_date"] + timedelta(
+        days=nights
+    )
+    merged_campsites["booking_nights"] = nights
+    final_campsites = merged_campsites.merge(campsite_data, on="facility_id")
+    final_campsites["booking_url"] = final_campsites.apply(
+        lambda x: Yellowstone._return_lodging_url(
+            lodging_code=x.facility_id,
+            month=x.booking_date,
+            params={"nights": nights},
+        ),
+        axis=1,
+    )
+    return [
+        AvailableCampsite(
+            campsite_id=row["campsite_code"],
+            booking_date=row["booking_date"],
+            booking_end_date=row["booking_end_date"],
+            booking_nights=row["booking_nights"],
+            campsite_site_name=row["campsite_title"],
+            campsite_loop_name=YellowstoneConfig.YELLOWSTONE_LOOP_NAME,
+            campsite_type=row["campsite_type"],
+            campsite_occupancy=row["capacity"],
+            campsite_use_type=row["campsite_type"],
+            availability_status=YellowstoneConfig.CAMPSITE_AVAILABILITY_STATUS,
+            recreation_area=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_NAME,
+            recreation_area_id=YellowstoneConfig.YELLOWSTONE_RECREATION_AREA_ID,
+            facility_name=row["facility_name"],
+            facility_id=row["facility_id"],
+            booking_url=row["booking_url"],
+        )
+        for _, row in final_campsites.iterrows()
+    ]
+
+
+@vcr_cassette
+def test_yellowstone_assembly_parity() -> None:
+    """
+    Record Assembly Matches the Original DataFrame Merges
+    """
+    provider = Yellowstone()
+    month = datetime(2023, 9, 1).date()
+    availability = provider._get_monthly_availability(month=month)
+    monthly_campsites = provider._compile_campground_availabilities(
+        availability=XantResortData(**availability)
+    )
+    available_rooms = provider._gather_campsite_specific_availability(
+        available_campsites=monthly_campsites, month=month
+    )
+    property_info = provider._get_property_information(available_rooms=available_rooms)
+    campsites = provider._assemble_campsites(
+        monthly_campsites=monthly_campsites,
+        available_rooms=available_rooms,
+        property_info=property_info,
+    )
+    legacy_campsites = _legacy_assemble_campsites(
+        monthly_campsites=monthly_campsites,
+        available_rooms=available_rooms,
+        property_info=property_info,
+        nights=1,
+    )
+    assert len(campsites) > 0
+    booking_dates = [campsite.booking_date for campsite in campsites]
+    assert booking_dates == sorted(booking_dates)
+    assert sorted(campsite.json() for campsite in campsites) == sorted(
+        campsite.json() for campsite in legacy_campsites
+    )
+
+
+def test_yellowstone_failing_month_skipped(yellowstone_finder, monkeypatch) -> None:
+    """
+    A Failing API Skips the Month and Opens the Circuit Breaker
+    """
+    attempts = []
+
+    def _failing_get_data(self, endpoint: str, params=None) -> dict:
+        attempts.append(endpoint)
+        raise ProviderError("Service Unavailable")
+
+    monkeypatch.setattr(Yellowstone, "_get_data", _failing_get_data)
+    monkeypatch.setattr(YellowstoneConfig, "RETRY_MAX_WAIT", 0)
+    monkeypatch.setattr(
+        Yellowstone,
+        "circuit_breaker",
+        CircuitBreaker(failure_threshold=2, reset_timeout=300),
+    )
+    month = datetime(2023, 9, 1).date()
+    for _ in range(2):
+        assert yellowstone_finder._get_monthly_campsites(month=month) == []
+    assert len(attempts) == 2 * YellowstoneConfig.RETRY_MAX_ATTEMPTS
+    assert Yellowstone.circuit_breaker.is_open is True
+    assert yellowstone_finder._get_monthly_campsites(month=month) == []
+    assert len(attempts) == 2 * YellowstoneConfig.RETRY_MAX_ATTEMPTS
+
+
+def test_yellowstone_malformed_response(monkeypatch) -> None:
+    """
+    A Response that Isn't JSON Raises a ProviderError
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://webapi.xanterra.net/v1/api/availability/hotels/"
+    response._content = b"<html>Service Temporarily Unavailable</html>"
+    provider = Yellowstone()
+    monkeypatch.setattr(provider.session, "get", lambda **kwargs: response)
+    with pytest.raises(ProviderError, match="invalid response"):
+        provider._get_data(endpoint=response.url)
+
+
+def test_circuit_breaker_half_open() -> None:
+    """
+    A Half-Open Circuit Admits a Single Trial Call
+    """
+    circuit_breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+    for _ in range(2):
+        assert circuit_breaker.allow() is True
+        circuit_breaker.record_failure()
+    assert circuit_breaker.state == "open"
+    assert circuit_breaker.allow() is False
+    time.sleep(0.25)
+    assert circuit_breaker.state == "half-open"
+    assert circuit_breaker.allow() is True
+    assert circuit_breaker.allow() is False
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "open"
+    assert circuit_breaker.allow() is False
+    time.sleep(0.25)
+    assert circuit_breaker.allow() is True
+    assert circuit_breaker.allow() is False
+    circuit_breaker.record_success()
+    assert circuit_breaker.state == "closed"
+    assert circuit_breaker.allow() is True
+    circuit_breaker.record_failure()
+    assert circuit_breaker.state == "closed"
+
+
+def test_yellowstone_retry_budget_per_poll(yellowstone_finder, monkeypatch) -> None:
+    """
+    Requests Stop Retrying Once the Poll's Retry Budget is Spent
+    """
+    attempts = []
+
+    def _failing_get_data(self, endpoint: str, params=None) -> dict:
+        attempts.append(endpoint)
+        raise ProviderError("Service Unavailable")
+
+    monkeypatch.setattr(Yellowstone, "_get_data", _failing_get_data)
+    monkeypatch.setattr(YellowstoneConfig, "RETRY_POLL_BUDGET", 0)
+    monkeypatch.setattr(
+        Yellowstone,
+        "circuit_breaker",
+        CircuitBreaker(failure_threshold=100, reset_timeout=300),
+    )
+    assert yellowstone_finder.get_all_campsites() == []
+    assert len(attempts) == len(yellowstone_finder.search_months)
@@ -0,0 +1,81 @@
+"""
+Local Provider Emulator and Host Overrides
+"""
+
+import datetime
+
+import pytest
+import requests
+
+from camply.config.api_config import APIConfig
+from camply.containers import SearchWindow
+from camply.search.search_recreationdotgov import SearchRecreationDotGov
+from camply.search.search_usedirect import SearchReserveCalifornia
+from camply.testing import EmulatorConfig, ProviderEmulator, SyntheticAvailability
+from camply.utils.api_utils import override_url
+
+
+def test_override_url() -> None:
+    """
+    Overridden Hosts Keep Their Path and Query
+    """
+    overrides = {"www.recreation.gov": "http://127.0.0.1:8080/prefix/"}
+    assert (
+        override_url("https://www.recreation.gov/api/search?a=1", overrides)
+        == "http://127.0.0.1:8080/prefix/api/search?a=1"
+    )
+    assert override_url("https://ridb.recreation.gov/api/v1", overrides) is None
+    assert (
+        override_url("https://ridb.recreation.gov/api/v1", {"*": "http://localhost"})
+        == "http://localhost/api/v1"
+    )
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+@pytest.mark.parametrize(
+    "search_class, search_kwargs",
+    [
+        (SearchRecreationDotGov, {"campgrounds": [1000]}),
+        (SearchReserveCalifornia, {"recreation_area": None, "campgrounds": [1000]}),
+    ],
+)
+def test_search_against_emulator(
+    synthetic: SyntheticAvailability,
+    monkeypatch: pytest.MonkeyPatch,
+    search_class: type,
+    search_kwargs: dict,
+) -> None:
+    """
+    Host Overrides Point Searches at the Emulator
+    """
+    search_window = SearchWindow(
+        start_date=datetime.date(2023, 9, 1), end_date=datetime.date(2023, 9, 3)
+    )
+    with ProviderEmulator(synthetic=synthetic) as emulator:
+        monkeypatch.setattr(APIConfig, "HOST_OVERRIDES", emulator.host_overrides)
+        campsites = search_class(
+            search_window=search_window, verbose=False, **search_kwargs
+        ).get_all_campsites()
+    assert len(campsites) > 0
+    assert set(emulator.status_codes) == {200}
+
+
+def test_injected_failures(synthetic: SyntheticAvailability) -> None:
+    """
+    Error Rates and Rate Limits Answer with 503s and 429s
+    """
+    with ProviderEmulator(
+        synthetic=synthetic, config=EmulatorConfig(error_rate=1.0)
+    ) as emulator:
+        response = requests.get(f"{emulator.url}/api/v1/recareas", timeout=5)
+        assert response.status_code == 503
+    with ProviderEmulator(
+        synthetic=synthetic,
+        config=EmulatorConfig(rate_limit_calls=2, rate_limit_period=60, retry_after=7),
+    ) as emulator:
+        responses = [
+            requests.get(f"{emulator.url}/api/v1/recareas", timeout=5) for _ in range(3)
+        ]
+    assert [response.status_code for response in responses] == [200, 200, 429]
+    assert responses[-1].headers["Retry-After"] == "7"
+    assert responses[0].json()["METADATA"]["RESULTS"]["TOTAL_COUNT"] == 1
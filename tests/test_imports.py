@@ -0,0 +1,78 @@
+"""
+Import Time Testing: `python -X importtime -c "import camply.cli"`
+"""
+
+import logging
+import resource
+import subprocess
+import sys
+import typing
+from typing import Set, Tuple
+
+from camply.notifications import CAMPSITE_NOTIFICATIONS
+from camply.notifications.base_notifications import BaseNotifications
+from camply.search import CAMPSITE_SEARCH_PROVIDER
+
+logger = logging.getLogger(__name__)
+
+# CPU seconds `import camply.cli` may take on top of starting the interpreter.
+# CPU time rather than wall time keeps this stable under parallel test runs
+IMPORT_TIME_BUDGET: float = 0.75
+# Libraries only needed once a search or notification actually runs
+DEFERRED_MODULES: Set[str] = {"pandas", "numpy", "tenacity", "apprise", "twilio"}
+
+
+def _run_python(code: str) -> Tuple[float, subprocess.CompletedProcess]:
+    """
+    Run Code in a Fresh Interpreter with `-X importtime`
+
+    Returns
+    -------
+    Tuple[float, subprocess.CompletedProcess]
+        CPU seconds used by the interpreter and the completed process
+    """
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_seconds = (after.ru_utime - before.ru_utime) + (
+        after.ru_stime - before.ru_stime
+    )
+    return cpu_seconds, process
+
+
+def test_cli_import_budget() -> None:
+    """
+    Importing the CLI Stays Within Budget and Skips Heavy Dependencies
+    """
+    _, process = _run_python("import sys, camply.cli; print(' '.join(sys.modules))")
+    assert set(process.stdout.split()) & DEFERRED_MODULES == set()
+    slowest = sorted(
+        process.stderr.splitlines()[1:],
+        key=lambda line: int(line.split("|")[1]),
+    )[-5:]
+    logger.info("Slowest imports:\n%s", "\n".join(slowest))
+    import_seconds = min(
+        _run_python("import camply.cli")[0] - _run_python("pass")[0] for _ in range(3)
+    )
+    logger.info(f"`import camply.cli` took {import_seconds:.3f} CPU seconds")
+    assert import_seconds < IMPORT_TIME_BUDGET
+
+
+def test_lazy_registries() -> None:
+    """
+    Lazy Registries Resolve to the Same Classes as Before
+    """
+    for provider_name, search_class in CAMPSITE_SEARCH_PROVIDER.items():
+        assert search_class.provider_class.__name__ == provider_name
+    for notifier in CAMPSITE_NOTIFICATIONS.values():
+        assert issubclass(notifier, BaseNotifications)
+    from camply import SearchYellowstone, Yellowstone
+    from camply.providers import ProviderType
+
+    assert Yellowstone in typing.get_args(ProviderType)
+    assert SearchYellowstone is CAMPSITE_SEARCH_PROVIDER["Yellowstone"]
@@ -0,0 +1,180 @@
+"""
+Per-Poll Instrumentation
+"""
+
+import datetime
+import json
+import pathlib
+from typing import Iterator, List
+
+import pytest
+import requests
+import tenacity
+
+from camply.config.api_config import APIConfig
+from camply.containers import SearchWindow
+from camply.search.search_recreationdotgov import SearchRecreationDotGov
+from camply.testing import ProviderEmulator, SyntheticAvailability
+from camply.utils import instrumentation
+from camply.utils.instrumentation import (
+    InstrumentationSink,
+    JSONLinesSink,
+    LogSink,
+    PollRecord,
+    PrometheusTextfileSink,
+    count_retry,
+    sinks_from_config,
+)
+from camply.utils.metrics_server import MetricsSink
+
+
+class ListSink(InstrumentationSink):
+    """
+    Keep Every Record in Memory
+    """
+
+    def __init__(self) -> None:
+        self.records: List[PollRecord] = []
+
+    def emit(self, record: PollRecord) -> None:
+        self.records.append(record)
+
+
+@pytest.fixture
+def sink() -> Iterator[ListSink]:
+    """
+    Record to a List for the Duration of a Test
+    """
+    sink = ListSink()
+    instrumentation.enable([sink])
+    yield sink
+    instrumentation.disable()
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+def test_search_poll_record(
+    sink: ListSink, synthetic: SyntheticAvailability, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    A Search Emits One Record with its Stages, HTTP Calls and Counters
+    """
+    search_window = SearchWindow(
+        start_date=datetime.date(2023, 9, 1), end_date=datetime.date(2023, 9, 3)
+    )
+    with ProviderEmulator(synthetic=synthetic) as emulator:
+        monkeypatch.setattr(APIConfig, "HOST_OVERRIDES", emulator.host_overrides)
+        search = SearchRecreationDotGov(
+            search_window=search_window, campgrounds=[1000, 1001]
+        )
+        sink.records.clear()
+        campsites = search._search_matching_campsites_available()
+    assert len(sink.records) == 1
+    record = sink.records[0]
+    assert record.name == "search"
+    assert record.spans["get_recdotgov_data"].calls == 2
+    assert record.spans["process_campsite_availability"].calls == 2
+    for stage in ["_filter_date_overlap", "_consolidate_campsites", "df_to_campsites"]:
+        assert record.spans[stage].calls >= 1
+    assert record.spans["rate_limit_wait"].calls == 1
+    assert record.counters["http_requests"] == record.spans["http_request"].calls
+    assert record.counters["campsites_matched"] == len(campsites)
+    assert "http_errors" not in record.counters
+    assert record.duration >= record.spans["get_recdotgov_data"].seconds
+
+
+def test_sinks(tmp_path: pathlib.Path) -> None:
+    """
+    JSON Lines and Prometheus Sinks Write What Was Recorded
+    """
+    jsonl_path = tmp_path / "polls.jsonl"
+    prometheus_path = tmp_path / "camply.prom"
+    sinks = sinks_from_config(f"log, jsonl:{jsonl_path}, prometheus:{prometheus_path}")
+    assert [type(sink) for sink in sinks] == [
+        LogSink,
+        JSONLinesSink,
+        PrometheusTextfileSink,
+    ]
+    instrumentation.enable(sinks)
+    try:
+        for _ in range(2):
+            with instrumentation.span("poll", poll=True):
+                with instrumentation.span("parse"), instrumentation.span("poll"):
+                    instrumentation.increment("campsites", 3)
+    finally:
+        instrumentation.disable()
+    lines = jsonl_path.read_text().splitlines()
+    assert len(lines) == 2
+    record = json.loads(lines[0])
+    assert record["spans"]["parse"]["calls"] == 1
+    assert record["spans"]["poll"]["calls"] == 1
+    assert record["counters"] == {"campsites": 3}
+    prometheus = prometheus_path.read_text()
+    assert 'camply_polls_total{poll="poll"} 2' in prometheus
+    assert 'camply_span_calls_total{span="parse"} 2' in prometheus
+    assert 'camply_counter_total{name="campsites"} 6' in prometheus
+    with pytest.raises(ValueError):
+        sinks_from_config("jsonl")
+
+
+def test_disabled_is_a_no_op() -> None:
+    """
+    Without a Recorder, Spans are Shared No-Ops and Traced Functions Run as Is
+    """
+    assert instrumentation.get_recorder() is None
+    assert instrumentation.span("a") is instrumentation.span("b", poll=True)
+
+    @instrumentation.traced()
+    def add(a: int, b: int) -> int:
+        instrumentation.increment("calls")
+        return a + b
+
+    assert add(1, 2) == 3
+    assert add.__name__ == "add"
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+def test_metrics_endpoint(
+    synthetic: SyntheticAvailability, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    The Metrics Endpoint Serves Polls, Requests by Host and Retries
+    """
+    (sink,) = sinks_from_config("metrics:127.0.0.1:0")
+    assert isinstance(sink, MetricsSink)
+    instrumentation.enable([sink])
+    try:
+        search_window = SearchWindow(
+            start_date=datetime.date(2023, 9, 1), end_date=datetime.date(2023, 9, 3)
+        )
+        with ProviderEmulator(synthetic=synthetic) as emulator:
+            monkeypatch.setattr(APIConfig, "HOST_OVERRIDES", emulator.host_overrides)
+            search = SearchRecreationDotGov(
+                search_window=search_window, campgrounds=[1000]
+            )
+            search._search_matching_campsites_available()
+        retryer = tenacity.Retrying(
+            wait=tenacity.wait_none(),
+            stop=tenacity.stop_after_attempt(2),
+            before_sleep=count_retry,
+            retry_error_cls=tenacity.RetryError,
+        )
+        with pytest.raises(tenacity.RetryError):
+            retryer(int, "not a number")
+        response = requests.get(f"{sink.url}/metrics", timeout=5)
+        missing = requests.get(f"{sink.url}/other", timeout=5)
+    finally:
+        instrumentation.disable()
+    assert response.status_code == 200
+    assert missing.status_code == 404
+    metrics = response.text
+    assert 'camply_poll_duration_seconds_count{poll="search"} 1' in metrics
+    assert 'camply_polls_total{outcome="success",poll="search"} 1' in metrics
+    assert 'camply_last_success_timestamp_seconds{poll="search"}' in metrics
+    assert (
+        'camply_http_requests_total{host="www.recreation.gov",'
+        'provider="RecreationDotGov",status="200"}'
+    ) in metrics
+    assert 'camply_retries_total{function="int"} 1' in metrics
+    assert (
+        'camply_span_duration_seconds_bucket{span="get_recdotgov_data",le="+Inf"} 1'
+    ) in metrics
@@ -2,11 +2,63 @@
 Notification Testing
 """
 
+import gzip
+import json
+import pathlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
 from camply import AvailableCampsite
-from camply.notifications import PushoverNotifications
+from camply.config import EmailConfig, NtfyConfig, OutboxConfig, SearchConfig
+from camply.config.notification_config import WebhookConfig
+from camply.containers.data_containers import WebhookBody
+from camply.notifications import (
+    EmailNotifications,
+    MultiNotifierProvider,
+    PushoverNotifications,
+    email_notifications,
+)
+from camply.notifications.base_notifications import (
+    BaseNotifications,
+    NotificationError,
+)
+from camply.notifications.ntfy import NtfyNotifications
+from camply.notifications.outbox import NotificationOutbox
+from camply.notifications.webhook import WebhookNotifications
 from tests.conftest import vcr_cassette
 
 
+class RecordingNotifications(BaseNotifications):
+    """
+    Notifications Recorded in Memory
+    """
+
+    max_concurrent_messages = 4
+
+    def __init__(self, delay: float = 0.0, error: bool = False) -> None:
+        super().__init__()
+        self.delay = delay
+        self.error = error
+        self.messages: List[str] = []
+        self.threads = set()
+
+    def send_message(self, message: str, **kwargs) -> None:
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.error is True:
+            raise ConnectionError("Notification Service Unavailable")
+        self.messages.append(message)
+
+    def send_campsites(self, campsites: List[AvailableCampsite], **kwargs) -> None:
+        self.send_messages(
+            [{"message": campsite.campsite_id} for campsite in campsites]
+        )
+
+
 @vcr_cassette
 def test_pushover_message():
     """
@@ -23,3 +75,341 @@ def test_pushover_campsite(available_campsite: AvailableCampsite):
     """
     pusher = PushoverNotifications()
     pusher.send_campsites(campsites=[available_campsite])
+
+
+def test_multi_notifier_error_isolation(available_campsite: AvailableCampsite):
+    """
+    A Failing or Slow Provider Doesn't Block the Others
+    """
+    failing = RecordingNotifications(error=True)
+    slow = RecordingNotifications(delay=2.0)
+    working = RecordingNotifications(delay=0.1)
+    notifier = MultiNotifierProvider(provider=[failing, slow, working])
+    notifier.provider_timeout = 0.5
+    start = time.monotonic()
+    notifier.send_campsites(campsites=[available_campsite] * 3)
+    assert time.monotonic() - start < 1.5
+    assert len(working.messages) == 3
+    assert len(working.threads) > 1
+    assert failing.messages == []
+
+
+def test_multi_notifier_all_providers_failing():
+    """
+    A NotificationError is Raised Only When Every Provider Fails
+    """
+    notifier = MultiNotifierProvider(
+        provider=[
+            RecordingNotifications(error=True),
+            RecordingNotifications(error=True),
+        ]
+    )
+    with pytest.raises(NotificationError):
+        notifier.send_message(message="This is a test message!")
+
+
+def test_notification_outbox_idempotent(
+    available_campsite: AvailableCampsite, tmp_path: pathlib.Path
+):
+    """
+    Queued Campsites are Delivered Once, Even Across Restarts
+    """
+    outbox_path = tmp_path / "outbox.db"
+    recorder = RecordingNotifications()
+    outbox = NotificationOutbox(provider=[recorder], path=outbox_path)
+    outbox.send_campsites(campsites=[available_campsite, available_campsite])
+    outbox.close(timeout=5)
+    assert recorder.messages == [available_campsite.campsite_id]
+    restarted_recorder = RecordingNotifications()
+    restarted = NotificationOutbox(provider=[restarted_recorder], path=outbox_path)
+    restarted.send_campsites(campsites=[available_campsite])
+    restarted.close(timeout=5)
+    assert restarted_recorder.messages == []
+
+
+def test_notification_outbox_retries_after_restart(
+    available_campsite: AvailableCampsite, tmp_path: pathlib.Path, monkeypatch
+):
+    """
+    Failed Deliveries Stay Queued and are Retried by the Next Outbox
+    """
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_BASE", 0.0)
+    outbox_path = tmp_path / "outbox.db"
+    failing = NotificationOutbox(
+        provider=[RecordingNotifications(error=True)], path=outbox_path
+    )
+    failing.send_campsites(campsites=[available_campsite])
+    failing.close(timeout=0.5)
+    assert failing.pending_count() == 1
+    recorder = RecordingNotifications()
+    outbox = NotificationOutbox(provider=[recorder], path=outbox_path)
+    outbox.close(timeout=5)
+    assert recorder.messages == [available_campsite.campsite_id]
+    assert outbox.pending_count() == 0
+
+
+def test_notification_outbox_batch_size(
+    available_campsite: AvailableCampsite, tmp_path: pathlib.Path, monkeypatch
+):
+    """
+    Queued Campsites are Delivered in Batches, Each Marked Sent on its Own
+    """
+    monkeypatch.setattr(OutboxConfig, "BACKOFF_BASE", 0.0)
+    monkeypatch.setattr(SearchConfig, "MAXIMUM_NOTIFICATION_BATCH_SIZE", 2)
+
+    class FlakyRecorder(RecordingNotifications):
+        def __init__(self) -> None:
+            super().__init__()
+            self.batches: List[List[int]] = []
+
+        def send_campsites(self, campsites: List[AvailableCampsite], **kwargs):
+            self.batches.append([campsite.campsite_id for campsite in campsites])
+            if len(self.batches) == 2:
+                raise ConnectionError("Notification Service Unavailable")
+            super().send_campsites(campsites=campsites, **kwargs)
+
+    recorder = FlakyRecorder()
+    outbox = NotificationOutbox(provider=[recorder], path=tmp_path / "outbox.db")
+    campsites = [
+        available_campsite.copy(update={"campsite_id": index}) for index in range(5)
+    ]
+    outbox.send_campsites(campsites=campsites)
+    outbox.close(timeout=5)
+    assert recorder.batches[:3] == [[0, 1], [2, 3], [4]]
+    assert recorder.batches[3:] == [[2, 3]]
+    assert sorted(recorder.messages) == list(range(5))
+    assert outbox.pending_count() == 0
+
+
+def test_digest_packing(available_campsite: AvailableCampsite):
+    """
+    Digests Group Campsites and Fit Every Message Under the Provider Limit
+    """
+    recorder = RecordingNotifications()
+    recorder.max_message_length = 500
+    campsites = [
+        available_campsite.copy(
+            update={
+                "campsite_id": index,
+                "campsite_site_name": f"Site {index}",
+                "facility_name": f"Campground {index % 2}",
+            }
+        )
+        for index in range(20)
+    ]
+    messages = recorder.pack_digest(campsites)
+    assert 1 < len(messages) < len(campsites)
+    assert all(recorder.measure_message(message) <= 500 for message in messages)
+    digest = "\n".join(messages)
+    for campsite in campsites:
+        assert f"• {campsite.campsite_site_name} (" in digest
+    for message in messages:
+        assert message.startswith("🏕 Campground")
+
+
+def test_ntfy_digest_measured_in_bytes(
+    available_campsite: AvailableCampsite, monkeypatch
+):
+    """
+    Ntfy Digests are Packed by their UTF-8 Size, not their Character Count
+    """
+    monkeypatch.setattr(NtfyConfig, "NTFY_TOPIC", "camply-test")
+    ntfy = NtfyNotifications()
+    assert ntfy.measure_message("Café 🏕") == 10
+    ntfy.max_message_length = 500
+    campsites = [
+        available_campsite.copy(
+            update={
+                "campsite_id": index,
+                "campsite_site_name": f"Sité {index} 🌲🌲🌲",
+                "facility_name": "Campground Île-aux-Coudres",
+            }
+        )
+        for index in range(20)
+    ]
+    messages = ntfy.pack_digest(campsites)
+    assert len(messages) > 1
+    assert all(len(message.encode("utf-8")) <= 500 for message in messages)
+
+
+class FakeSMTP:
+    """
+    In-Memory SMTP_SSL Recording Connections and Sends
+    """
+
+    connections: List["FakeSMTP"] = []
+    drop_next_send: bool = False
+
+    def __init__(self, host: str, port: int, timeout: float) -> None:
+        self.logins = 0
+        self.sent = []
+        FakeSMTP.connections.append(self)
+
+    def ehlo(self) -> None:
+        pass
+
+    def login(self, user: str, password: str) -> None:
+        self.logins += 1
+
+    def send_message(self, email) -> None:
+        if FakeSMTP.drop_next_send is True:
+            FakeSMTP.drop_next_send = False
+            raise email_notifications.SMTPServerDisconnected("Connection closed")
+        self.sent.append(email)
+
+    def quit(self) -> None:
+        pass
+
+
+def test_email_smtp_connection_reused(monkeypatch):
+    """
+    Emails Share One SMTP Login and Reconnect When the Server Drops it
+    """
+    for key, value in {
+        "EMAIL_TO_ADDRESS": "to@camply.test",
+        "EMAIL_USERNAME": "camply",
+        "EMAIL_PASSWORD": "password",
+    }.items():
+        monkeypatch.setattr(EmailConfig, key, value)
+    monkeypatch.setattr(EmailNotifications, "email_username", "camply")
+    monkeypatch.setattr(EmailNotifications, "_email_password", "password")
+    monkeypatch.setattr(email_notifications, "SMTP_SSL", FakeSMTP)
+    monkeypatch.setattr(email_notifications.SMTPClient, "_clients", {})
+    monkeypatch.setattr(FakeSMTP, "connections", [])
+    notifier = EmailNotifications()
+    assert FakeSMTP.connections == []
+    notifier.send_messages([{"message": "one"}, {"message": "two"}])
+    notifier.send_message(message="three")
+    assert len(FakeSMTP.connections) == 1
+    assert FakeSMTP.connections[0].logins == 1
+    assert len(FakeSMTP.connections[0].sent) == 3
+    FakeSMTP.drop_next_send = True
+    notifier.send_message(message="four")
+    assert len(FakeSMTP.connections) == 2
+    assert FakeSMTP.connections[1].sent[0].get_content().strip() == "four"
+
+
+class FormattingNotifications(RecordingNotifications):
+    """
+    Recorded Notifications Using the Standard Campsite Format
+    """
+
+    def send_campsites(self, campsites: List[AvailableCampsite], **kwargs) -> None:
+        for campsite in campsites:
+            message_title, fields = self.format_standard_campsites(campsite=campsite)
+            self.messages.append(f"{message_title}: {fields['Booking Link']}")
+
+
+def test_formatted_campsites_shared(available_campsite: AvailableCampsite, monkeypatch):
+    """
+    Campsites are Formatted Once and Shared Across Providers
+    """
+    expected = BaseNotifications.format_standard_campsites(available_campsite)
+    dict_calls = []
+    original_dict = AvailableCampsite.dict
+
+    def _counting_dict(self, *args, **kwargs):
+        dict_calls.append(self)
+        return original_dict(self, *args, **kwargs)
+
+    monkeypatch.setattr(AvailableCampsite, "dict", _counting_dict)
+    providers = [FormattingNotifications() for _ in range(3)]
+    notifier = MultiNotifierProvider(provider=providers)
+    notifier.send_campsites(campsites=[available_campsite])
+    assert len(dict_calls) == 1
+    assert BaseNotifications._formatted_campsites == {}
+    for provider in providers:
+        assert provider.messages == [f"{expected[0]}: {expected[1]['Booking Link']}"]
+
+
+class WebhookSink(BaseHTTPRequestHandler):
+    """
+    Local HTTP Sink Recording Webhook Requests
+    """
+
+    requests: List[Dict[str, Any]] = []
+    status_codes: List[int] = []
+
+    def do_POST(self) -> None:
+        if self.headers.get("Transfer-Encoding") == "chunked":
+            body = b""
+            while True:
+                size = int(self.rfile.readline().strip(), 16)
+                body += self.rfile.read(size)
+                self.rfile.readline()
+                if size == 0:
+                    break
+        else:
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+        if self.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        self.requests.append({"headers": dict(self.headers), "body": body})
+        status_code = self.status_codes.pop(0) if self.status_codes else 200
+        self.send_response(status_code)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def webhook_sink(monkeypatch) -> Iterator[WebhookSink]:
+    """
+    Serve a Local Webhook Sink and Point the Webhook Notifications at it
+    """
+    monkeypatch.setattr(WebhookSink, "requests", [])
+    monkeypatch.setattr(WebhookSink, "status_codes", [])
+    server = ThreadingHTTPServer(("127.0.0.1", 0), WebhookSink)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        WebhookConfig, "WEBHOOK_URL", f"http://127.0.0.1:{server.server_port}/hook"
+    )
+    monkeypatch.setattr(WebhookConfig, "RETRY_MAX_WAIT", 0.01)
+    yield WebhookSink
+    server.shutdown()
+    server.server_close()
+
+
+def test_webhook_batches(
+    available_campsite: AvailableCampsite, webhook_sink, monkeypatch
+):
+    """
+    Webhooks are Chunked, Gzipped, Retried and Don't Touch the Shared Headers
+    """
+    default_headers = WebhookConfig.DEFAULT_HEADERS.copy()
+    monkeypatch.setattr(WebhookConfig, "WEBHOOK_HEADERS", {"X-Camply": "test"})
+    monkeypatch.setattr(WebhookConfig, "WEBHOOK_GZIP", True)
+    monkeypatch.setattr(WebhookConfig, "WEBHOOK_MAX_BATCH_SIZE", 2)
+    campsites = [
+        available_campsite.copy(update={"campsite_id": index}) for index in range(5)
+    ]
+    webhook_sink.status_codes = [503]
+    WebhookNotifications().send_campsites(campsites=campsites)
+    assert WebhookConfig.DEFAULT_HEADERS == default_headers
+    assert len(webhook_sink.requests) == 4
+    bodies = [json.loads(request["body"]) for request in webhook_sink.requests[1:]]
+    assert [len(body["campsites"]) for body in bodies] == [2, 2, 1]
+    expected = json.loads(WebhookBody(campsites=campsites[:2]).json())
+    assert bodies[0]["campsites"] == expected["campsites"]
+    assert webhook_sink.requests[1]["headers"]["X-Camply"] == "test"
+    assert webhook_sink.requests[1]["headers"]["Content-Encoding"] == "gzip"
+
+
+def test_webhook_ndjson(
+    available_campsite: AvailableCampsite, webhook_sink, monkeypatch
+):
+    """
+    NDJSON Webhooks Stream One Campsite per Line
+    """
+    monkeypatch.setattr(WebhookConfig, "WEBHOOK_FORMAT", "ndjson")
+    monkeypatch.setattr(WebhookConfig, "WEBHOOK_GZIP", True)
+    campsites = [
+        available_campsite.copy(update={"campsite_id": index}) for index in range(3)
+    ]
+    WebhookNotifications().send_campsites(campsites=campsites)
+    (request,) = webhook_sink.requests
+    assert request["headers"]["Content-Type"] == WebhookConfig.NDJSON_CONTENT_TYPE
+    lines = request["body"].decode("utf-8").splitlines()
+    assert [json.loads(line)["campsite_id"] for line in lines] == [0, 1, 2]
@@ -0,0 +1,108 @@
+"""
+Synthetic Availability and the Fake Transport
+"""
+
+import datetime
+
+import pytest
+
+from camply.containers import SearchWindow
+from camply.containers.api_responses import (
+    CampsiteAvailabilityResponse,
+    FacilityResponse,
+    GenericResponse,
+    RecDotGovCampsiteResponse,
+    XantResortData,
+)
+from camply.containers.usedirect import UseDirectAvailabilityResponse, UseDirectMetadata
+from camply.search.search_going_to_camp import SearchGoingToCamp
+from camply.search.search_recreationdotgov import SearchRecreationDotGov
+from camply.search.search_usedirect import SearchReserveCalifornia
+from camply.search.search_yellowstone import SearchYellowstone
+from camply.testing import SyntheticAvailability, fake_transport, route_request
+
+START_DATE = datetime.date(2023, 9, 1)
+
+
+def test_payloads_match_provider_models(synthetic: SyntheticAvailability) -> None:
+    """
+    Synthetic Payloads Parse as the Responses Providers Expect
+    """
+    end_date = START_DATE + datetime.timedelta(days=5)
+    CampsiteAvailabilityResponse(**synthetic.recdotgov_month(1000, START_DATE))
+    campsites = RecDotGovCampsiteResponse(**synthetic.recdotgov_campsites(1000))
+    assert campsites.total == len(campsites.campsites) == 10
+    FacilityResponse(**synthetic.ridb_facility(1001))
+    facilities = GenericResponse(**synthetic.ridb_facilities(offset=1, limit=1))
+    assert facilities.METADATA.RESULTS.CURRENT_COUNT == 1
+    assert facilities.METADATA.RESULTS.TOTAL_COUNT == 3
+    UseDirectAvailabilityResponse(
+        **synthetic.usedirect_grid(1000, START_DATE, end_date)
+    )
+    UseDirectMetadata(**synthetic.usedirect_filters())
+    XantResortData(**synthetic.yellowstone_hotels(START_DATE))
+
+
+def test_availability_is_deterministic() -> None:
+    """
+    The Same Seed Gives the Same Data, Churn Changes it Between Snapshots
+    """
+    nights = SyntheticAvailability.nights(
+        START_DATE, START_DATE + datetime.timedelta(days=30)
+    )
+
+    def snapshot(generator: SyntheticAvailability, number: int) -> list:
+        return [
+            generator.is_available(campsite_id, night, snapshot=number)
+            for campsite_id in generator.campsite_ids(1000)
+            for night in nights
+        ]
+
+    frozen = SyntheticAvailability(churn=0.0)
+    churning = SyntheticAvailability(churn=1.0)
+    assert snapshot(frozen, 0) == snapshot(frozen, 5)
+    assert snapshot(frozen, 0) == snapshot(SyntheticAvailability(churn=0.0), 0)
+    assert snapshot(churning, 0) != snapshot(churning, 1)
+    assert any(snapshot(frozen, 0))
+    assert not any(snapshot(SyntheticAvailability(density=0.0), 0))
+    with pytest.raises(ValueError):
+        SyntheticAvailability(sites=SyntheticAvailability.SITE_ID_MULTIPLIER)
+
+
+def test_unknown_routes(synthetic: SyntheticAvailability) -> None:
+    """
+    Unknown Routes and Campgrounds are a 404
+    """
+    status_code, _ = route_request(synthetic, "GET", "https://example.com/nothing")
+    assert status_code == 404
+    status_code, _ = route_request(
+        synthetic, "GET", "https://ridb.recreation.gov/api/v1/facilities/1"
+    )
+    assert status_code == 404
+
+
+@pytest.mark.usefixtures("unthrottled_providers")
+@pytest.mark.parametrize(
+    "search_class, search_kwargs",
+    [
+        (SearchRecreationDotGov, {"campgrounds": [1000]}),
+        (SearchReserveCalifornia, {"recreation_area": None, "campgrounds": [1000]}),
+        (SearchGoingToCamp, {"recreation_area": [1], "campgrounds": [1000]}),
+        (SearchYellowstone, {}),
+    ],
+)
+def test_search_through_fake_transport(
+    synthetic: SyntheticAvailability, search_class: type, search_kwargs: dict
+) -> None:
+    """
+    Searches Run Unmodified Against Synthetic Data
+    """
+    search_window = SearchWindow(
+        start_date=START_DATE, end_date=START_DATE + datetime.timedelta(days=2)
+    )
+    with fake_transport(synthetic) as transport:
+        campsites = search_class(
+            search_window=search_window, verbose=False, **search_kwargs
+        ).get_all_campsites()
+    assert len(campsites) > 0
+    assert len(transport.requests) > 0